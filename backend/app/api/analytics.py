@@ -2,8 +2,23 @@
 Analytics API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import os
+import tempfile
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import FileResponse, Response
+from starlette.background import BackgroundTask
 from app.api.auth import get_current_user
+from app.api.responses import empty_list_response
+from app.services.analytics_service import (
+    EXPORT_FORMATS,
+    export_transactions_duckdb,
+    get_dashboard_summary_json,
+    get_monthly_summary_arrow,
+    get_monthly_summary_duckdb,
+    get_spending_by_category_arrow,
+    get_spending_by_category_duckdb,
+    get_top_merchants_duckdb,
+)
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import date
@@ -11,6 +26,13 @@ from decimal import Decimal
 
 router = APIRouter()
 
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def wants_arrow(request: Request) -> bool:
+    """Whether the client asked for an Arrow IPC stream instead of JSON."""
+    return ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", "")
+
 
 class SpendingByCategory(BaseModel):
     category: str
@@ -38,30 +60,42 @@ class TrendData(BaseModel):
 async def get_dashboard_summary(
     current_user=Depends(get_current_user)
 ):
-    """Get dashboard summary data."""
-    # TODO: Implement dashboard summary
-    # - Current month spending
-    # - Budget status
-    # - Recent transactions
-    # - Top categories
-    return {
-        "current_month_spending": 0,
-        "current_month_income": 0,
-        "budget_status": [],
-        "recent_transactions": [],
-        "top_categories": [],
-    }
+    """
+    Get dashboard summary data.
+
+    Returns current month spending and income, monthly budget status,
+    recent transactions and top categories.
+    """
+    return Response(
+        content=await get_dashboard_summary_json(str(current_user["id"])),
+        media_type="application/json",
+    )
 
 
 @router.get("/spending", response_model=List[SpendingByCategory])
 async def get_spending_by_category(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     current_user=Depends(get_current_user),
 ):
-    """Get spending breakdown by category for a date range."""
-    # TODO: Implement using DuckDB for fast aggregation
-    return []
+    """
+    Get spending breakdown by category for a date range.
+
+    Send ``Accept: application/vnd.apache.arrow.stream`` to receive the
+    rows as an Arrow IPC stream instead of JSON.
+    """
+    if wants_arrow(request):
+        return Response(
+            content=await get_spending_by_category_arrow(
+                str(current_user["id"]), start_date, end_date
+            ),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+        )
+
+    return await get_spending_by_category_duckdb(
+        str(current_user["id"]), start_date, end_date
+    )
 
 
 @router.get("/trends")
@@ -79,12 +113,23 @@ async def get_spending_trends(
 
 @router.get("/monthly-summary", response_model=List[MonthlySummary])
 async def get_monthly_summary(
+    request: Request,
     months: int = Query(default=6, ge=1, le=24),
     current_user=Depends(get_current_user),
 ):
-    """Get monthly income/expense summary."""
-    # TODO: Implement monthly summary using DuckDB
-    return []
+    """
+    Get monthly income/expense summary.
+
+    Send ``Accept: application/vnd.apache.arrow.stream`` to receive the
+    rows as an Arrow IPC stream instead of JSON.
+    """
+    if wants_arrow(request):
+        return Response(
+            content=await get_monthly_summary_arrow(str(current_user["id"]), months),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+        )
+
+    return await get_monthly_summary_duckdb(str(current_user["id"]), months)
 
 
 @router.get("/merchants")
@@ -95,8 +140,9 @@ async def get_top_merchants(
     current_user=Depends(get_current_user),
 ):
     """Get top merchants by spending."""
-    # TODO: Implement merchant analysis
-    return []
+    return await get_top_merchants_duckdb(
+        str(current_user["id"]), limit, start_date, end_date
+    )
 
 
 @router.get("/recurring")
@@ -105,18 +151,37 @@ async def get_recurring_transactions(
 ):
     """Get detected recurring transactions."""
     # TODO: Implement recurring transaction listing
-    return []
+    return empty_list_response()
 
 
 @router.get("/export")
 async def export_data(
-    format: str = Query(default="csv", regex="^(csv|json|excel)$"),
+    format: str = Query(default="csv", regex="^(csv|json|excel|parquet)$"),
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     current_user=Depends(get_current_user),
 ):
-    """Export transaction data in various formats."""
-    # TODO: Implement data export using DuckDB
-    raise HTTPException(
-        status_code=501, detail="Export functionality not yet implemented"
+    """
+    Export transaction data in various formats.
+
+    The file is written by DuckDB and streamed back from disk in chunks, so
+    neither step holds the full export in memory.
+    """
+    export_format = EXPORT_FORMATS[format]
+    fd, path = tempfile.mkstemp(suffix=f".{export_format['extension']}")
+    os.close(fd)
+
+    try:
+        await export_transactions_duckdb(
+            str(current_user["id"]), path, format, start_date, end_date
+        )
+    except Exception:
+        os.remove(path)
+        raise
+
+    return FileResponse(
+        path,
+        media_type=export_format["media_type"],
+        filename=f"transactions.{export_format['extension']}",
+        background=BackgroundTask(os.remove, path),
     )
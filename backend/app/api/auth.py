@@ -2,19 +2,30 @@
 Authentication API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocketException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import time
+import bcrypt
+import jwt
+from cachetools import TTLCache
 from app.config import settings
+from app.models import User
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 
 router = APIRouter()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login", auto_error=False)
+
+# Resolved users keyed on the raw bearer token, so repeat requests within a
+# token's lifetime skip jwt.decode and the user lookup. Entries are stored
+# with the token's ``exp`` and never served past it.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Decode settings built once rather than per request
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+_JWT_OPTIONS = {"require": ["exp", "sub"]}
 
 
 class UserCreate(BaseModel):
@@ -41,12 +52,14 @@ class TokenData(BaseModel):
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode(), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -63,13 +76,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-async def get_current_user():
+async def get_current_user(token: Optional[str] = Depends(oauth2_scheme)):
     """
     Get the current authenticated user.
 
-    TEMPORARY: Authentication is disabled for development.
-    Returns a default test user without requiring token validation.
+    Bearer tokens are validated and resolved to a user.
+    TEMPORARY: Requests without a token fall back to a default test user.
     """
+    if token:
+        return await _get_token_user(token)
+
     # Default test user for development (no authentication required)
     default_user_id = "00000000-0000-0000-0000-000000000001"
     default_email = "test@fins.dev"
@@ -85,6 +101,60 @@ async def get_current_user():
     }
 
 
+async def get_current_ws_user(token: Optional[str] = Query(default=None)):
+    """
+    Get the current user for a WebSocket connection.
+
+    Browsers can't set headers on WebSocket requests, so the bearer token is
+    passed as a ``token`` query parameter instead.
+    """
+    try:
+        return await get_current_user(token)
+    except HTTPException:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+
+
+async def _get_token_user(token: str) -> dict:
+    """Resolve a bearer token to a user dict, using the token cache."""
+    cached = _TOKEN_CACHE.get(token)
+    if cached and cached[1] > time.time():
+        return cached[0]
+
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=_JWT_ALGORITHMS,
+            options=_JWT_OPTIONS,
+        )
+    except jwt.InvalidTokenError:
+        raise credentials_exception
+
+    db_user = await User.get_or_none(email=payload["sub"])
+    if db_user is None:
+        raise credentials_exception
+
+    user = {
+        "id": str(db_user.id),
+        "email": db_user.email,
+        "full_name": db_user.full_name,
+        "created_at": db_user.created_at,
+    }
+    _TOKEN_CACHE[token] = (user, payload["exp"])
+    return user
+
+
+def invalidate_token(token: str) -> None:
+    """Drop a token from the user cache (e.g. on logout)."""
+    _TOKEN_CACHE.pop(token, None)
+
+
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
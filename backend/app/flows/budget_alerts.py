@@ -2,37 +2,13 @@
 Budget monitoring and alert workflow.
 """
 
+import asyncio
 from prefect import flow, task
 from typing import List, Dict, Any
 
-
-@task
-async def check_budget_status(user_id: str) -> List[Dict[str, Any]]:
-    """Check all active budgets for a user"""
-    from app.services.analytics_service import get_active_budgets, get_period_spending
-
-    budgets = await get_active_budgets(user_id)
-    alerts = []
-
-    for budget in budgets:
-        spent = await get_period_spending(
-            user_id=user_id, category=budget["category"], period=budget["period"]
-        )
-
-        percentage = spent / budget["amount"] if budget["amount"] > 0 else 0
-
-        if percentage >= budget.get("alert_threshold", 0.8):
-            alerts.append(
-                {
-                    "budget_id": budget["id"],
-                    "category": budget["category"],
-                    "spent": spent,
-                    "budget": budget["amount"],
-                    "percentage": percentage,
-                }
-            )
-
-    return alerts
+# Notifications in flight at once; each one is I/O bound on the
+# notification provider.
+ALERT_CONCURRENCY = 32
 
 
 @task
@@ -51,33 +27,31 @@ async def send_alert_notifications(user_id: str, alerts: List[Dict[str, Any]]):
     return len(alerts)
 
 
-async def get_all_users() -> List[Dict[str, Any]]:
-    """Get all users in the system"""
-    # TODO: Implement database query
-    return []
-
-
 @flow(name="budget-alerts", log_prints=True)
 async def budget_alerts_flow():
     """
     Check budgets and send alerts.
     Runs daily.
     """
-    users = await get_all_users()
+    from app.services.analytics_service import get_budget_alerts
+
+    alerts_by_user = await get_budget_alerts()
+
+    if not alerts_by_user:
+        print("No budgets over their alert threshold")
+        return {"users_alerted": 0, "alerts_sent": 0}
 
-    if not users:
-        print("No users to check")
-        return {"total_users": 0, "alerts_sent": 0}
+    semaphore = asyncio.Semaphore(ALERT_CONCURRENCY)
 
-    total_alerts = 0
+    async def notify(user_id: str, alerts: List[Dict[str, Any]]) -> int:
+        async with semaphore:
+            return await send_alert_notifications(user_id, alerts)
 
-    for user in users:
-        alerts = await check_budget_status(user["id"])
-        if alerts:
-            sent = await send_alert_notifications(user["id"], alerts)
-            total_alerts += sent
-            print(f"Sent {sent} alerts to user {user['id']}")
+    sent = await asyncio.gather(
+        *(notify(user_id, alerts) for user_id, alerts in alerts_by_user.items())
+    )
+    total_alerts = sum(sent)
 
     print(f"✅ Sent {total_alerts} total budget alerts")
 
-    return {"total_users": len(users), "alerts_sent": total_alerts}
+    return {"users_alerted": len(alerts_by_user), "alerts_sent": total_alerts}
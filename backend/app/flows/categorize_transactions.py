@@ -2,10 +2,18 @@
 AI-powered transaction categorization workflow.
 """
 
+import asyncio
 from prefect import flow, task
-import json
+import orjson
 from typing import List, Dict, Any
 
+from app.config import settings
+
+# categorization_flow maps every batch at once; only the LLM call is bounded
+# so cache and rule lookups still run in parallel while provider rate limits
+# see at most LLM_CONCURRENCY requests from this process.
+_LLM_SEMAPHORE = asyncio.Semaphore(settings.LLM_CONCURRENCY)
+
 
 @task(retries=2, retry_delay_seconds=30)
 async def categorize_batch(
@@ -14,24 +22,42 @@ async def categorize_batch(
     """
     Categorize a batch of transactions using LLM.
     Batch size: 20-50 transactions for cost efficiency.
+
+    Each user's own rules are applied first. LLM results are cached by
+    (merchant, description) across users, so only pairs never seen before
+    reach the LLM.
     """
+    from redis.asyncio import Redis
+
     from app.services.categorization import (
-        check_categorization_rules,
+        cache_categorizations,
+        categorization_cache_key,
+        get_cached_categorizations,
+        load_rule_matcher,
     )
     from app.services.ai_service import llm_service
 
-    # Check for learned patterns first
-    categorized_by_rules = []
-    needs_ai = []
+    categorized = []
+
+    # Check for learned patterns first, compiling each user's rules once
+    unmatched = []
+    matchers = {}
 
     for txn in transaction_batch:
-        rule = await check_categorization_rules(
-            txn.get("merchant_name"), txn.get("description")
-        )
+        user_id = txn.get("user_id")
+        rule = None
+        if user_id:
+            if user_id not in matchers:
+                matchers[user_id] = await load_rule_matcher(user_id)
+            rule = matchers[user_id].match(
+                txn.get("merchant_name"), txn.get("description")
+            )
         if rule and rule.get("confidence_score", 0) > 0.8:
-            categorized_by_rules.append(
+            categorized.append(
                 {
                     "id": txn["id"],
+                    "user_id": user_id,
+                    "merchant_name": txn.get("merchant_name"),
                     "category": rule["category"],
                     "subcategory": rule.get("subcategory"),
                     "confidence": rule["confidence_score"],
@@ -39,87 +65,124 @@ async def categorize_batch(
                 }
             )
         else:
-            needs_ai.append(txn)
-
-    # AI categorize remaining transactions
-    ai_results = []
-    if needs_ai:
-        prompt = build_categorization_prompt(needs_ai)
-
-        messages = [{"role": "user", "content": prompt}]
-        response = await llm_service.complete(messages, max_tokens=4096)
-
-        ai_results = json.loads(response)
-
-    return categorized_by_rules + ai_results
+            unmatched.append(txn)
+
+    if not unmatched:
+        return categorized
+
+    async with Redis.from_url(settings.REDIS_URL) as redis:
+        cached = await get_cached_categorizations(redis, unmatched)
+
+        # Transactions sharing a merchant/description pair are categorized once
+        needs_ai: Dict[str, List[Dict[str, Any]]] = {}
+
+        for txn, hit in zip(unmatched, cached):
+            if hit is not None:
+                categorized.append({"id": txn["id"], **hit, "method": "cache"})
+            else:
+                key = categorization_cache_key(
+                    txn.get("merchant_name"), txn.get("description")
+                )
+                needs_ai.setdefault(key, []).append(txn)
+
+        # AI categorize remaining transactions
+        if needs_ai:
+            groups = list(needs_ai.values())
+            prompt = build_categorization_prompt([group[0] for group in groups])
+
+            messages = [{"role": "user", "content": prompt}]
+            async with _LLM_SEMAPHORE:
+                response = await llm_service.complete(messages, max_tokens=4096)
+
+            ai_results = {str(r["id"]): r for r in orjson.loads(response)}
+            new_results = []
+            for group in groups:
+                result = ai_results.get(str(group[0]["id"]))
+                if result is None:
+                    continue
+                result = {**result, "method": "ai"}
+                new_results.append((group[0], result))
+                for txn in group:
+                    categorized.append(
+                        {
+                            **result,
+                            "id": txn["id"],
+                            "user_id": txn.get("user_id"),
+                            "merchant_name": txn.get("merchant_name"),
+                        }
+                    )
+
+            await cache_categorizations(redis, new_results)
+
+    return categorized
 
 
 @task
 async def save_categorizations(categorization_results: List[Dict[str, Any]]):
     """Save categorization results to database"""
     from app.services.categorization import (
-        update_transaction_category,
-        create_categorization_rule,
+        update_transaction_categories,
+        create_categorization_rules,
     )
 
-    for result in categorization_results:
-        await update_transaction_category(
-            transaction_id=result["id"],
-            category=result["category"],
-            subcategory=result.get("subcategory"),
-            confidence=result["confidence"],
-            ai_categorized=(result.get("method") == "ai"),
-        )
-
-        # Learn from high-confidence AI categorizations
-        if result.get("method") == "ai" and result["confidence"] > 0.9:
-            await create_categorization_rule(result)
+    await update_transaction_categories(categorization_results)
 
+    # Learn from high-confidence AI categorizations
+    await create_categorization_rules(
+        [
+            result
+            for result in categorization_results
+            if result.get("method") == "ai" and result["confidence"] > 0.9
+        ]
+    )
 
-def build_categorization_prompt(transactions: List[Dict[str, Any]]) -> str:
-    """
-    Build prompt for batch transaction categorization.
-    """
 
-    categories = {
-        "Income": ["Salary", "Freelance", "Investment Income", "Gifts", "Refunds"],
-        "Housing": [
-            "Rent/Mortgage",
-            "Utilities",
-            "Internet",
-            "Home Maintenance",
-            "Furniture",
-        ],
-        "Transportation": [
-            "Gas",
-            "Public Transit",
-            "Ride Share",
-            "Car Maintenance",
-            "Parking",
-        ],
-        "Food": ["Groceries", "Restaurants", "Coffee Shops", "Fast Food", "Delivery"],
-        "Shopping": ["Clothing", "Electronics", "Home Goods", "Personal Care", "Books"],
-        "Entertainment": [
-            "Streaming Services",
-            "Movies",
-            "Gaming",
-            "Hobbies",
-            "Events",
-        ],
-        "Healthcare": ["Medical", "Dental", "Pharmacy", "Health Insurance", "Fitness"],
-        "Financial": ["Bank Fees", "Interest", "Investments", "Insurance", "Taxes"],
-        "Personal": ["Haircut", "Spa", "Subscriptions", "Gifts", "Education"],
-        "Travel": ["Flights", "Hotels", "Vacation", "Travel Insurance"],
-        "Other": ["Uncategorized"],
-    }
-
-    prompt = f"""You are a financial transaction categorization expert. Analyze these transactions and categorize each one.
+CATEGORIES = {
+    "Income": ["Salary", "Freelance", "Investment Income", "Gifts", "Refunds"],
+    "Housing": [
+        "Rent/Mortgage",
+        "Utilities",
+        "Internet",
+        "Home Maintenance",
+        "Furniture",
+    ],
+    "Transportation": [
+        "Gas",
+        "Public Transit",
+        "Ride Share",
+        "Car Maintenance",
+        "Parking",
+    ],
+    "Food": ["Groceries", "Restaurants", "Coffee Shops", "Fast Food", "Delivery"],
+    "Shopping": ["Clothing", "Electronics", "Home Goods", "Personal Care", "Books"],
+    "Entertainment": [
+        "Streaming Services",
+        "Movies",
+        "Gaming",
+        "Hobbies",
+        "Events",
+    ],
+    "Healthcare": ["Medical", "Dental", "Pharmacy", "Health Insurance", "Fitness"],
+    "Financial": ["Bank Fees", "Interest", "Investments", "Insurance", "Taxes"],
+    "Personal": ["Haircut", "Spa", "Subscriptions", "Gifts", "Education"],
+    "Travel": ["Flights", "Hotels", "Vacation", "Travel Insurance"],
+    "Other": ["Uncategorized"],
+}
+
+# The prompt only varies in the transactions it lists, so everything around
+# them, including the serialized category list, is built once at import.
+_PROMPT_HEAD = (
+    """You are a financial transaction categorization expert. Analyze these transactions and categorize each one.
 
 Available categories and subcategories:
-{json.dumps(categories, indent=2)}
+"""
+    + orjson.dumps(CATEGORIES, option=orjson.OPT_INDENT_2).decode()
+    + """
 
 Transactions to categorize:
-{json.dumps(transactions, indent=2)}
+"""
+)
+_PROMPT_TAIL = """
 
 For each transaction, determine:
 1. The most appropriate category and subcategory
@@ -128,14 +191,14 @@ For each transaction, determine:
 
 Return ONLY a JSON array with this structure:
 [
-  {{
+  {
     "id": "transaction_id",
     "category": "category_name",
     "subcategory": "subcategory_name",
     "is_recurring": true/false,
     "confidence": 0.95,
     "reasoning": "brief explanation"
-  }}
+  }
 ]
 
 Guidelines:
@@ -146,7 +209,18 @@ Guidelines:
 - If truly unclear, use confidence < 0.5 and suggest "Other"
 """
 
-    return prompt
+
+def build_categorization_prompt(transactions: List[Dict[str, Any]]) -> str:
+    """
+    Build prompt for batch transaction categorization.
+    """
+    # Compact JSON: indentation only adds tokens to every request. Dates and
+    # UUIDs serialize natively; default=str covers Decimal amounts.
+    return (
+        _PROMPT_HEAD
+        + orjson.dumps(transactions, default=str).decode()
+        + _PROMPT_TAIL
+    )
 
 
 @flow(name="ai-categorization", log_prints=True)
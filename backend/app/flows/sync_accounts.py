@@ -27,16 +27,28 @@ async def sync_single_account(account_id: str) -> Dict[str, Any]:
     return {"account_id": account_id, "new_transactions": 0, "success": True}
 
 
-@task
-async def deduplicate_transactions(user_id: str, account_id: str):
-    """Remove duplicate transactions based on amount, date, and merchant"""
+@task(retries=3, retry_delay_seconds=60)
+async def sync_and_dedupe(account: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sync an account, remove duplicate transactions and collect the ones
+    still needing categorization, as one task per account.
+
+    Returns: sync_single_account's result plus 'removed' and 'new_ids'
+    """
     from app.services.import_service import remove_duplicates
 
-    print(f"Deduplicating transactions for account {account_id}")
-    removed_count = await remove_duplicates(user_id, account_id)
-    print(f"Removed {removed_count} duplicate transactions")
+    result = await sync_single_account.fn(account["id"])
 
-    return removed_count
+    removed_count = await remove_duplicates(account["user_id"], account["id"])
+    print(f"Removed {removed_count} duplicate transactions from {account['id']}")
+
+    uncategorized = await get_uncategorized_transactions(account["id"])
+
+    return {
+        **result,
+        "removed": removed_count,
+        "new_ids": [t["id"] for t in uncategorized],
+    }
 
 
 @task
@@ -59,8 +71,8 @@ async def get_all_active_accounts() -> List[Dict[str, Any]]:
     return []
 
 
-async def get_uncategorized_transactions() -> List[Dict[str, Any]]:
-    """Get all uncategorized transactions"""
+async def get_uncategorized_transactions(account_id: str) -> List[Dict[str, Any]]:
+    """Get an account's uncategorized transactions"""
     # TODO: Implement database query
     return []
 
@@ -82,22 +94,14 @@ async def daily_account_sync_flow(user_id: str = None):
         print("No accounts to sync")
         return {"total_accounts": 0, "successful_syncs": 0, "new_transactions": 0}
 
-    # Sync all accounts in parallel
-    sync_results = await sync_single_account.map(
-        [account["id"] for account in accounts]
-    )
-
-    # Deduplicate transactions for each account
-    await deduplicate_transactions.map(
-        [(account["user_id"], account["id"]) for account in accounts]
-    )
+    # Sync and deduplicate all accounts in parallel
+    sync_results = await sync_and_dedupe.map(accounts)
 
-    # Get all new uncategorized transactions
-    uncategorized = await get_uncategorized_transactions()
+    uncategorized_ids = [i for r in sync_results for i in r["new_ids"]]
 
-    if uncategorized:
-        print(f"Found {len(uncategorized)} uncategorized transactions")
-        await queue_for_categorization([t["id"] for t in uncategorized])
+    if uncategorized_ids:
+        print(f"Found {len(uncategorized_ids)} uncategorized transactions")
+        await queue_for_categorization(uncategorized_ids)
 
     # Log summary
     total_new = sum(r["new_transactions"] for r in sync_results if r["success"])
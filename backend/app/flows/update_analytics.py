@@ -2,10 +2,318 @@
 Analytics database update workflow - sync PostgreSQL to DuckDB.
 """
 
+import asyncio
+import logging
+import time
+import uuid
+import pyarrow as pa
 from prefect import flow, task
-import duckdb
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.database import get_duckdb_connection
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS transactions (
+        id UUID PRIMARY KEY,
+        user_id UUID NOT NULL,
+        account_id UUID NOT NULL,
+        transaction_date DATE NOT NULL,
+        amount DECIMAL(15, 2) NOT NULL,
+        currency VARCHAR,
+        description VARCHAR,
+        merchant_name VARCHAR,
+        category VARCHAR,
+        subcategory VARCHAR,
+        is_recurring BOOLEAN,
+        created_at TIMESTAMPTZ,
+        updated_at TIMESTAMPTZ
+    );
+    CREATE TABLE IF NOT EXISTS sync_metadata (
+        table_name VARCHAR PRIMARY KEY,
+        last_synced_at TIMESTAMPTZ,
+        last_max_id UUID
+    );
+    -- Keys touched by the last sync, before and after the change
+    CREATE TABLE IF NOT EXISTS sync_affected (
+        user_id UUID,
+        transaction_date DATE,
+        merchant_name VARCHAR
+    );
+    CREATE TABLE IF NOT EXISTS daily_spending (
+        user_id UUID,
+        transaction_date DATE,
+        category VARCHAR,
+        subcategory VARCHAR,
+        total_amount DECIMAL(18, 2),
+        transaction_count BIGINT,
+        avg_amount DOUBLE
+    );
+    CREATE TABLE IF NOT EXISTS monthly_summary (
+        user_id UUID,
+        month DATE,
+        category VARCHAR,
+        income DECIMAL(18, 2),
+        expenses DECIMAL(18, 2),
+        transaction_count BIGINT
+    );
+    CREATE TABLE IF NOT EXISTS merchant_stats (
+        user_id UUID,
+        merchant_name VARCHAR,
+        category VARCHAR,
+        visit_count BIGINT,
+        total_spent DECIMAL(18, 2),
+        avg_spent DOUBLE,
+        first_visit DATE,
+        last_visit DATE
+    );
+    CREATE TABLE IF NOT EXISTS mv_refresh_log (
+        name VARCHAR,
+        refresh_started_at TIMESTAMPTZ,
+        refresh_completed_at TIMESTAMPTZ,
+        rows_affected BIGINT
+    );
+"""
+
+# Postgres stores amounts in cents; DuckDB's DECIMAL(15, 2) is the same
+# 64-bit integer underneath, so converting once here keeps its SUMs integral.
+_TRANSACTION_COLUMNS = (
+    "id, user_id, account_id, transaction_date, "
+    "(amount / 100)::DECIMAL(15, 2) AS amount, currency, description, "
+    "merchant_name, category, subcategory, is_recurring, created_at, updated_at"
+)
+
+# Summary tables rebuilt incrementally after each sync: for every table, the
+# groups matching a key in sync_affected are deleted and re-aggregated from
+# transactions, so the work scales with the rows synced, not the table.
+_SUMMARY_REFRESHES = {
+    "daily_spending": (
+        """
+        DELETE FROM daily_spending s WHERE EXISTS (
+            SELECT 1 FROM sync_affected a
+            WHERE a.user_id = s.user_id
+                AND a.transaction_date = s.transaction_date
+        )
+        """,
+        """
+        INSERT INTO daily_spending
+        SELECT
+            user_id,
+            transaction_date,
+            category,
+            subcategory,
+            SUM(amount) AS total_amount,
+            COUNT(*) AS transaction_count,
+            AVG(amount) AS avg_amount
+        FROM transactions t
+        WHERE EXISTS (
+            SELECT 1 FROM sync_affected a
+            WHERE a.user_id = t.user_id
+                AND a.transaction_date = t.transaction_date
+        )
+        GROUP BY ALL
+        """,
+    ),
+    "monthly_summary": (
+        """
+        DELETE FROM monthly_summary s WHERE EXISTS (
+            SELECT 1 FROM sync_affected a
+            WHERE a.user_id = s.user_id
+                AND date_trunc('month', a.transaction_date) = s.month
+        )
+        """,
+        """
+        INSERT INTO monthly_summary
+        SELECT
+            user_id,
+            date_trunc('month', transaction_date)::DATE AS month,
+            category,
+            SUM(CASE WHEN amount > 0 THEN amount ELSE 0 END) AS income,
+            SUM(CASE WHEN amount < 0 THEN amount ELSE 0 END) AS expenses,
+            COUNT(*) AS transaction_count
+        FROM transactions t
+        WHERE EXISTS (
+            SELECT 1 FROM sync_affected a
+            WHERE a.user_id = t.user_id
+                AND date_trunc('month', a.transaction_date)
+                    = date_trunc('month', t.transaction_date)
+        )
+        GROUP BY ALL
+        """,
+    ),
+    "merchant_stats": (
+        """
+        DELETE FROM merchant_stats s WHERE EXISTS (
+            SELECT 1 FROM sync_affected a
+            WHERE a.user_id = s.user_id AND a.merchant_name = s.merchant_name
+        )
+        """,
+        """
+        INSERT INTO merchant_stats
+        SELECT
+            user_id,
+            merchant_name,
+            category,
+            COUNT(*) AS visit_count,
+            SUM(amount) AS total_spent,
+            AVG(amount) AS avg_spent,
+            MIN(transaction_date) AS first_visit,
+            MAX(transaction_date) AS last_visit
+        FROM transactions t
+        WHERE t.merchant_name IS NOT NULL AND EXISTS (
+            SELECT 1 FROM sync_affected a
+            WHERE a.user_id = t.user_id AND a.merchant_name = t.merchant_name
+        )
+        GROUP BY ALL
+        """,
+    ),
+}
+
+
+def _sync_transactions(conn) -> Dict[str, Any]:
+    """
+    Copy transactions changed since the last sync from Postgres.
+
+    Rows are read through the attached ``pg`` database as Arrow record
+    batches of DUCKDB_SYNC_BATCH_SIZE rows and each batch is upserted with
+    one INSERT ... SELECT, so memory stays bounded by the batch while rows
+    never pass through Python one at a time.
+
+    Only rows updated after the stored watermark are read, up to a fixed
+    upper bound taken before the copy starts, so rows written while the sync
+    runs are left for the next run instead of moving the target mid-copy.
+
+    The keys each changed row had before and after the sync are recorded in
+    sync_affected for the summary refreshes; it is emptied when nothing
+    changed, so the refreshes don't redo the previous run's keys.
+
+    Returns:
+        Batch metrics: rows_synced, batch_count, rows_per_batch (the
+        configured batch size) and batch_duration_ms (mean per batch)
+    """
+    conn.execute(_SCHEMA_SQL)
+
+    last_sync = get_last_sync_timestamp(conn)
+    logger.info("Last sync: %s", last_sync)
+
+    lower, params = ("updated_at > ?", [last_sync]) if last_sync else ("TRUE", [])
+    upper, max_id = conn.execute(
+        f"SELECT max(updated_at), arg_max(id, updated_at) FROM pg.transactions "
+        f"WHERE {lower}",
+        params,
+    ).fetchone()
+    if upper is None:
+        logger.info("No transactions changed since the last sync")
+        conn.execute("DELETE FROM sync_affected")
+        return _batch_metrics(0, [])
+    where, params = f"WHERE {lower} AND updated_at <= ?", params + [upper]
+
+    # Postgres is read on a separate cursor so batches can be written while
+    # the scan is still streaming
+    reader = conn.cursor()
+    synced = 0
+    batch_durations = []
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        batches = reader.execute(
+            f"SELECT {_TRANSACTION_COLUMNS} FROM pg.transactions {where}", params
+        ).fetch_record_batch(settings.DUCKDB_SYNC_BATCH_SIZE)
+        conn.execute("DELETE FROM sync_affected")
+
+        for batch in batches:
+            started = time.perf_counter()
+            conn.register("sync_batch", pa.Table.from_batches([batch]))
+            try:
+                conn.execute(
+                    """
+                    INSERT INTO sync_affected
+                    SELECT user_id, transaction_date, merchant_name FROM sync_batch
+                    UNION
+                    SELECT t.user_id, t.transaction_date, t.merchant_name
+                    FROM transactions t JOIN sync_batch b ON b.id = t.id
+                    """
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO transactions SELECT * FROM sync_batch"
+                )
+                synced += conn.fetchone()[0]
+            finally:
+                conn.unregister("sync_batch")
+            batch_durations.append((time.perf_counter() - started) * 1000)
+
+        update_sync_timestamp(conn, upper, max_id)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        reader.close()
+
+    metrics = _batch_metrics(synced, batch_durations)
+    if batch_durations:
+        logger.info(
+            "Wrote %d batches of up to %d rows, %.0f ms per batch",
+            metrics["batch_count"],
+            metrics["rows_per_batch"],
+            metrics["batch_duration_ms"],
+        )
+
+    return metrics
+
+
+def _batch_metrics(synced: int, batch_durations: List[float]) -> Dict[str, Any]:
+    """Sync metrics recorded on the run's SyncJob, for tuning the batch size."""
+    return {
+        "rows_synced": synced,
+        "batch_count": len(batch_durations),
+        "rows_per_batch": settings.DUCKDB_SYNC_BATCH_SIZE,
+        "batch_duration_ms": (
+            round(sum(batch_durations) / len(batch_durations), 1)
+            if batch_durations
+            else None
+        ),
+    }
+
+
+def _refresh_summary(conn, name: str) -> int:
+    """
+    Re-aggregate one summary table for the keys in sync_affected and record
+    the run in mv_refresh_log.
+
+    Returns:
+        Number of summary rows written
+    """
+    delete_sql, insert_sql = _SUMMARY_REFRESHES[name]
+    started_at = datetime.now(timezone.utc)
+
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        conn.execute(delete_sql)
+        conn.execute(insert_sql)
+        rows = conn.fetchone()[0]
+        conn.execute(
+            "INSERT INTO mv_refresh_log VALUES (?, ?, ?, ?)",
+            [name, started_at, datetime.now(timezone.utc), rows],
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    return rows
+
+
+def _with_cursor(fn, *args):
+    """Call ``fn(cursor, *args)`` on a fresh DuckDB cursor, then close it."""
+    cursor = get_duckdb_connection()
+    try:
+        return fn(cursor, *args)
+    finally:
+        cursor.close()
 
 
 @task
@@ -13,68 +321,86 @@ async def sync_to_duckdb():
     """
     Sync data from PostgreSQL to DuckDB for analytics.
     Uses incremental updates based on last sync timestamp.
-    """
-    from app.config import settings
-
-    conn = duckdb.connect(settings.DUCKDB_PATH)
 
-    # Get last sync timestamp
-    last_sync = await get_last_sync_timestamp()
-    print(f"Last sync: {last_sync}")
+    Every DuckDB call, including opening the connection, runs in a worker
+    thread so the event loop stays free for Prefect and concurrent tasks.
 
-    # Export new/updated transactions from PostgreSQL
-    # TODO: Implement actual PostgreSQL query
-    print("Syncing transactions from PostgreSQL to DuckDB")
+    Each run is tracked as an "analytics_sync" SyncJob, with the batch
+    metrics in its metadata.
+    """
+    from app.services.sync_job_service import SyncJobService
 
-    # Update materialized views
+    job_service = SyncJobService()
+    job_id = str(uuid.uuid4())
+    await job_service.create_job(None, job_id, "analytics_sync", stage="syncing")
     try:
-        conn.execute("CALL refresh_daily_spending()")
-        conn.execute("CALL refresh_monthly_summary()")
-        conn.execute("CALL refresh_merchant_stats()")
+        metrics = await asyncio.to_thread(_with_cursor, _sync_transactions)
     except Exception as e:
-        print(f"Note: Materialized view refresh failed (views may not exist yet): {e}")
+        await job_service.update_job(
+            job_id, status="failed", stage="failed", error_message=str(e)
+        )
+        raise
+    await job_service.update_job(
+        job_id, status="completed", stage="completed", metadata=metrics
+    )
+    logger.info(
+        "Synced %d transactions from PostgreSQL to DuckDB", metrics["rows_synced"]
+    )
 
-    await update_sync_timestamp()
-
-    print("✅ Synced data to DuckDB")
-    conn.close()
+    # Update summary tables for what changed. They write disjoint tables, so
+    # each runs in its own thread on its own cursor.
+    names = list(_SUMMARY_REFRESHES)
+    refreshes = (asyncio.to_thread(_with_cursor, _refresh_summary, n) for n in names)
+    for name, rows in zip(names, await asyncio.gather(*refreshes)):
+        logger.info("Refreshed %s: %d rows", name, rows)
 
 
 @task
 async def generate_insights():
-    """Generate AI-powered insights from analytics data"""
-    from app.services.analytics_service import generate_ai_insights
+    """Generate AI-powered insights, storing each as it arrives; returns the count"""
+    from app.services.analytics_service import generate_ai_insights, save_insight
 
-    print("Generating AI insights from analytics data")
-    # TODO: Implement insight generation
-    insights = await generate_ai_insights()
-    print(f"Generated {len(insights)} insights")
+    logger.info("Generating AI insights from analytics data")
+    count = 0
+    async for insight in generate_ai_insights():
+        await save_insight(insight)
+        count += 1
+    logger.info("Generated %d insights", count)
 
-    return insights
+    return count
 
 
-async def get_last_sync_timestamp() -> Optional[datetime]:
-    """Get the last sync timestamp from metadata table"""
-    # TODO: Implement
-    return datetime.now()
+def get_last_sync_timestamp(conn) -> Optional[datetime]:
+    """Get the last sync watermark from the sync_metadata table"""
+    row = conn.execute(
+        "SELECT last_synced_at FROM sync_metadata WHERE table_name = 'transactions'"
+    ).fetchone()
+    return row[0] if row else None
 
 
-async def update_sync_timestamp():
-    """Update the last sync timestamp"""
-    # TODO: Implement
-    pass
+def update_sync_timestamp(conn, synced_at: datetime, max_id):
+    """Advance the sync watermark to the newest synced row"""
+    conn.execute(
+        "INSERT OR REPLACE INTO sync_metadata VALUES ('transactions', ?, ?)",
+        [synced_at, max_id],
+    )
 
 
-@flow(name="analytics-update", log_prints=True)
+@flow(name="analytics-update")
 async def analytics_update_flow():
     """
     Update analytics database and generate insights.
     Runs every 6 hours.
+
+    Insights are generated from the data committed by the previous run,
+    so they run alongside this run's sync rather than after it: the sync is
+    database-bound and insight generation waits on the LLM.
     """
-    await sync_to_duckdb()
-    insights = await generate_insights()
+    _, insights_generated = await asyncio.gather(
+        sync_to_duckdb(), generate_insights()
+    )
 
     return {
         "sync_completed": True,
-        "insights_generated": len(insights) if insights else 0,
+        "insights_generated": insights_generated,
     }
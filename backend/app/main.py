@@ -2,16 +2,24 @@
 Main FastAPI application.
 """
 
+import asyncio
 import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from arq import create_pool
+from arq.connections import RedisSettings
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from tortoise.contrib.fastapi import register_tortoise
-from app.admin import admin_app, init_admin
+from app.admin import admin_app, init_admin, close_admin
 from app.config import settings
-from app.database import TORTOISE_ORM
+from app.database import TORTOISE_ORM, close_duckdb_connections, get_analytics_connection
 from app.api import auth, accounts, transactions, analytics, ai_chat, chat
+from app.api.responses import ORJSONResponse
+from app.services.ai_service import llm_service
+from app.services.sync_job_service import SyncJobService
 
 # Configure logging
 logging.basicConfig(
@@ -19,12 +27,39 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-logger.info(f"DEBUG setting: {settings.DEBUG}")
+logger.info("DEBUG setting: %s", settings.DEBUG)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up shared resources on startup and release them on shutdown."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=settings.THREAD_POOL_SIZE, thread_name_prefix="fins-worker"
+        )
+    )
+    await init_admin()
+    app.state.arq = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    app.state.sync_job_service = SyncJobService(redis=app.state.arq)
+    llm_service.redis = app.state.arq
+    # Open the analytics connection up front so the first request doesn't
+    # pay for loading extensions and attaching Postgres.
+    await asyncio.to_thread(get_analytics_connection)
+    try:
+        yield
+    finally:
+        close_duckdb_connections()
+        await llm_service.aclose()
+        await app.state.arq.aclose()
+        await close_admin()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="AI-powered personal finance tracking application",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.mount("/admin", admin_app)
@@ -32,15 +67,13 @@ app.mount("/admin", admin_app)
 register_tortoise(
     app,
     config=TORTOISE_ORM,
-    generate_schemas=True,
+    # Production schemas come from aerich migrations (aerich upgrade) run
+    # before deploy; creating tables at boot is only a development shortcut.
+    generate_schemas=settings.DEBUG,
     add_exception_handlers=True,
 )
 
 
-@app.on_event("startup")
-async def setup_admin():
-    await init_admin()
-
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -55,10 +88,10 @@ app.add_middleware(
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Catch all unhandled exceptions and log them with full details."""
-    logger.error(f"Unhandled exception on {request.method} {request.url}")
-    logger.error(f"Exception type: {type(exc).__name__}")
-    logger.error(f"Exception message: {str(exc)}")
-    logger.error(f"Traceback:\n{traceback.format_exc()}")
+    logger.error("Unhandled exception on %s %s", request.method, request.url)
+    logger.error("Exception type: %s", type(exc).__name__)
+    logger.error("Exception message: %s", exc)
+    logger.error("Traceback:\n%s", traceback.format_exc())
 
     return JSONResponse(
         status_code=500,
@@ -74,15 +107,17 @@ async def global_exception_handler(request: Request, exc: Exception):
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all incoming requests and responses."""
-    logger.info(f"Request: {request.method} {request.url}")
-    logger.debug(f"Headers: {request.headers}")
+    # Lazy %-formatting: arguments are only rendered if a handler emits them
+    logger.info("Request: %s %s", request.method, request.url.path)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Headers: %s", request.headers)
 
     try:
         response = await call_next(request)
-        logger.info(f"Response status: {response.status_code}")
+        logger.info("Response status: %s", response.status_code)
         return response
     except Exception as e:
-        logger.error(f"Request failed: {str(e)}")
+        logger.error("Request failed: %s", e)
         raise
 
 
@@ -9,6 +9,7 @@ from app.models.transaction import Transaction
 from app.models.categorization_rule import CategorizationRule
 from app.models.budget import Budget
 from app.models.sync_job import SyncJob
+from app.models.monthly_rollup import UserMonthlyRollup
 
 __all__ = [
     "User",
@@ -18,4 +19,5 @@ __all__ = [
     "CategorizationRule",
     "Budget",
     "SyncJob",
+    "UserMonthlyRollup",
 ]
@@ -3,6 +3,7 @@ Account model - Bank accounts, credit cards, investments.
 """
 
 from tortoise import fields
+from tortoise.indexes import Index
 from tortoise.models import Model
 
 
@@ -37,6 +38,19 @@ class Account(Model):
 
     class Meta:
         table = "accounts"
+        indexes = (
+            # get_user_accounts: active accounts for a user, newest first
+            Index(
+                fields=("user_id", "is_active", "created_at"),
+                name="idx_accounts_user_active_created",
+            ),
+            Index(
+                fields=("user_id", "account_number_last4"),
+                name="idx_accounts_user_last4",
+            ),
+        )
+        # The trigram index on lower(institution) used for institution
+        # matching is an expression index, so it only lives in the migrations.
 
     def __str__(self):
         return f"<Account(id={self.id}, name={self.account_name}, type={self.account_type})>"
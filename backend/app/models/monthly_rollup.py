@@ -0,0 +1,34 @@
+"""
+Monthly rollup model - Per-user monthly totals maintained by a database trigger.
+"""
+
+from tortoise import fields
+from tortoise.models import Model
+
+
+class UserMonthlyRollup(Model):
+    """
+    Income and expense totals per user, month and category.
+
+    Rows are written by the ``transactions_user_monthly_rollup`` trigger on
+    the transactions table, never by the application.
+    """
+
+    id = fields.BigIntField(pk=True)
+    user = fields.ForeignKeyField(
+        "models.User", related_name="monthly_rollups", on_delete=fields.CASCADE
+    )
+
+    month = fields.DateField()  # First day of the month
+    category = fields.CharField(max_length=100)
+
+    income = fields.BigIntField(default=0)  # cents
+    expense = fields.BigIntField(default=0)  # cents
+    transaction_count = fields.IntField(default=0)
+
+    class Meta:
+        table = "user_monthly_rollup"
+        unique_together = (("user", "month", "category"),)
+
+    def __str__(self):
+        return f"<UserMonthlyRollup(user={self.user_id}, month={self.month}, category={self.category})>"
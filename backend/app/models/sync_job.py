@@ -10,8 +10,9 @@ class SyncJob(Model):
     """Processing job tracking model."""
 
     id = fields.UUIDField(pk=True)
+    # None for system jobs that aren't run for a user, e.g. analytics syncs
     user = fields.ForeignKeyField(
-        "models.User", related_name="sync_jobs", on_delete=fields.CASCADE
+        "models.User", related_name="sync_jobs", on_delete=fields.CASCADE, null=True
     )
 
     job_type = fields.CharField(max_length=50)
@@ -3,6 +3,8 @@ Transaction model.
 """
 
 from tortoise import fields
+from tortoise.contrib.postgres.indexes import GinIndex
+from tortoise.indexes import Index
 from tortoise.models import Model
 
 
@@ -19,7 +21,7 @@ class Transaction(Model):
 
     transaction_date = fields.DateField()
     post_date = fields.DateField(null=True)
-    amount = fields.DecimalField(max_digits=15, decimal_places=2)
+    amount = fields.BigIntField()  # cents, see app.utils.money
     currency = fields.CharField(max_length=3, default="USD")
 
     description = fields.TextField()
@@ -45,9 +47,18 @@ class Transaction(Model):
     class Meta:
         table = "transactions"
         indexes = [
-            ("transaction_date",),
             ("account", "transaction_date"),
-            ("user", "transaction_date"),
+            # Newest-first keyset pagination of a user's transactions. The
+            # migration adds INCLUDE (amount, category, merchant_name,
+            # account_id) so per-user date-range aggregates are index-only.
+            Index(
+                fields=("user_id", "transaction_date", "id"),
+                name="idx_tx_user_date_covering",
+            ),
+            # Containment lookups on the JSONB columns (tags @> '["x"]');
+            # the migration builds meta's with jsonb_path_ops
+            GinIndex(fields=("tags",), name="idx_transactions_tags_gin"),
+            GinIndex(fields=("meta",), name="idx_transactions_meta_gin"),
         ]
 
     def __str__(self):
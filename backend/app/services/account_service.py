@@ -3,10 +3,60 @@ Account service - Database operations for accounts.
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from operator import itemgetter
+
+from tortoise import connections
+from tortoise.expressions import Case, Q, When
+from tortoise.functions import Lower
 
 from app.models.account import Account
 
+# Match tiers find_matching_accounts reports as match_rank, best first
+MATCH_EXACT = 1  # institution + account type + last 4 digits
+MATCH_STRONG = 2  # institution + account type
+MATCH_MEDIUM = 3  # institution + last 4 digits
+MATCH_WEAK = 4  # institution
+MATCH_TYPE = 5  # account type only
+
+# Columns of an account as returned by the service, in output key order
+_ACCOUNT_FIELDS = (
+    "id",
+    "user_id",
+    "account_name",
+    "account_type",
+    "institution",
+    "account_number_last4",
+    "currency",
+    "current_balance",
+    "available_balance",
+    "credit_limit",
+    "is_active",
+    "last_synced_at",
+    "sync_error",
+    "meta",
+    "created_at",
+    "updated_at",
+)
+_account_values = itemgetter(*_ACCOUNT_FIELDS)
+_RETURNING_COLUMNS = ", ".join(f'"{field}"' for field in _ACCOUNT_FIELDS)
+
+# Fields update_account is allowed to change
+_UPDATABLE_FIELDS = frozenset(
+    {
+        "account_name",
+        "institution",
+        "account_type",
+        "account_number_last4",
+        "current_balance",
+        "available_balance",
+        "credit_limit",
+        "is_active",
+        "last_synced_at",
+        "sync_error",
+        "meta",
+    }
+)
+
 
 class AccountService:
     """Service for account-related database operations."""
@@ -18,13 +68,13 @@ class AccountService:
         Returns:
             List of account dictionaries
         """
-        accounts = await (
+        rows = await (
             Account.filter(user_id=user_id, is_active=True)
             .order_by("-created_at")
-            .all()
+            .values(*_ACCOUNT_FIELDS)
         )
 
-        return [self._account_to_dict(account) for account in accounts]
+        return [self._row_to_dict(row) for row in rows]
 
     async def get_account_by_id(
         self, account_id: str, user_id: str
@@ -39,9 +89,36 @@ class AccountService:
         Returns:
             Account dictionary or None
         """
-        account = await Account.filter(id=account_id, user_id=user_id).first()
+        row = (
+            await Account.filter(id=account_id, user_id=user_id)
+            .first()
+            .values(*_ACCOUNT_FIELDS)
+        )
+
+        return self._row_to_dict(row) if row else None
+
+    async def get_accounts_by_ids(
+        self, account_ids: List[str], user_id: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get several accounts by ID in one query.
 
-        return self._account_to_dict(account) if account else None
+        Args:
+            account_ids: Account IDs; duplicates are fetched once
+            user_id: User ID (for security check)
+
+        Returns:
+            Account dictionary or None for each ID, in the order given
+        """
+        if not account_ids:
+            return []
+
+        rows = await Account.filter(
+            id__in=set(account_ids), user_id=user_id
+        ).values(*_ACCOUNT_FIELDS)
+        accounts = {row["id"]: row for row in map(self._row_to_dict, rows)}
+
+        return [accounts.get(str(account_id)) for account_id in account_ids]
 
     async def find_matching_accounts(
         self,
@@ -60,56 +137,70 @@ class AccountService:
             account_number_last4: Last 4 digits of account number
 
         Returns:
-            List of matching accounts, ordered by match quality
+            Accounts in the best matching tier, newest first, each with its
+            match_rank (MATCH_EXACT ... MATCH_TYPE)
         """
-        query = Account.filter(user_id=user_id, is_active=True)
-
-        # Exact match on all criteria (best match)
-        if institution and account_type and account_number_last4:
-            exact_matches = await (
-                query.filter(institution__icontains=institution)
-                .filter(account_type=account_type)
-                .filter(account_number_last4=account_number_last4)
-                .all()
-            )
-            if exact_matches:
-                return [self._account_to_dict(acc) for acc in exact_matches]
-
-        # Strong match: institution + account_type
+        # Fast path: when institution and account type are both given, the
+        # strongest tier is usually the one that matches, and on its own it
+        # narrows to a handful of rows through the (user_id, last4) index.
+        # It returns every account in that tier, so a substring match on the
+        # institution is reported alongside an exact one.
         if institution and account_type:
-            strong_matches = await (
-                query.filter(institution__icontains=institution)
-                .filter(account_type=account_type)
-                .all()
+            lookup = {"account_type": account_type}
+            if account_number_last4:
+                lookup["account_number_last4"] = account_number_last4
+            rows = await (
+                Account.filter(user_id=user_id, is_active=True, **lookup)
+                .annotate(institution_lower=Lower("institution"))
+                .filter(institution_lower__contains=institution.lower())
+                .order_by("-created_at")
+                .values(*_ACCOUNT_FIELDS)
             )
-            if strong_matches:
-                return [self._account_to_dict(acc) for acc in strong_matches]
-
-        # Medium match: institution + last4
+            if rows:
+                rank = MATCH_EXACT if account_number_last4 else MATCH_STRONG
+                for row in rows:
+                    row["match_rank"] = rank
+                return [self._row_to_dict(row) for row in rows]
+
+        # Rank every candidate in one query instead of one query per tier.
+        # A tier only takes part when all of its inputs were provided.
+        # Institution matching compares lower(institution) so the pg_trgm
+        # index on that expression can serve the substring search.
+        institution_match = Q(institution_lower__contains=(institution or "").lower())
+        type_match = Q(account_type=account_type)
+        last4_match = Q(account_number_last4=account_number_last4)
+
+        tiers = []
+        if institution and account_type and account_number_last4:
+            tiers.append((MATCH_EXACT, institution_match & type_match & last4_match))
+        if institution and account_type:
+            tiers.append((MATCH_STRONG, institution_match & type_match))
         if institution and account_number_last4:
-            medium_matches = await (
-                query.filter(institution__icontains=institution)
-                .filter(account_number_last4=account_number_last4)
-                .all()
-            )
-            if medium_matches:
-                return [self._account_to_dict(acc) for acc in medium_matches]
-
-        # Weak match: just institution
+            tiers.append((MATCH_MEDIUM, institution_match & last4_match))
         if institution:
-            weak_matches = await query.filter(
-                institution__icontains=institution
-            ).all()
-            if weak_matches:
-                return [self._account_to_dict(acc) for acc in weak_matches]
-
-        # Very weak match: just account_type
+            tiers.append((MATCH_WEAK, institution_match))
         if account_type:
-            type_matches = await query.filter(account_type=account_type).all()
-            if type_matches:
-                return [self._account_to_dict(acc) for acc in type_matches]
+            tiers.append((MATCH_TYPE, type_match))
+
+        if not tiers:
+            return []
 
-        return []
+        rows = await (
+            Account.filter(user_id=user_id, is_active=True)
+            .annotate(institution_lower=Lower("institution"))
+            .filter(Q(*(tier for _, tier in tiers), join_type=Q.OR))
+            .annotate(
+                match_rank=Case(*(When(tier, then=rank) for rank, tier in tiers))
+            )
+            .order_by("match_rank", "-created_at")
+            .values(*_ACCOUNT_FIELDS, "match_rank")
+        )
+
+        # Keep only the best tier, as the sequential cascade used to
+        best_rank = rows[0]["match_rank"] if rows else None
+        return [
+            self._row_to_dict(row) for row in rows if row["match_rank"] == best_rank
+        ]
 
     async def create_account(
         self, user_id: str, account_data: Dict[str, Any]
@@ -152,65 +243,62 @@ class AccountService:
         Returns:
             Updated account dictionary or None
         """
-        account = await Account.filter(id=account_id, user_id=user_id).first()
-
-        if not account:
-            return None
-
-        # Update allowed fields
-        allowed_fields = [
-            "account_name",
-            "institution",
-            "account_type",
-            "account_number_last4",
-            "current_balance",
-            "available_balance",
-            "credit_limit",
-            "is_active",
-            "last_synced_at",
-            "sync_error",
-            "meta",
+        fields = [field for field in updates if field in _UPDATABLE_FIELDS]
+        fields_map = Account._meta.fields_map
+
+        # A single UPDATE ... RETURNING replaces fetching the model, saving it
+        # and converting it back
+        assignments = [f'"{field}" = ${i}' for i, field in enumerate(fields, 1)]
+        assignments.append('"updated_at" = now()')
+        sql = (
+            f'UPDATE "{Account._meta.db_table}" SET {", ".join(assignments)} '
+            f'WHERE "id" = ${len(fields) + 1} AND "user_id" = ${len(fields) + 2} '
+            f"RETURNING {_RETURNING_COLUMNS}"
+        )
+        values = [
+            fields_map[field].to_db_value(updates[field], Account) for field in fields
         ]
 
-        for field, value in updates.items():
-            if field in allowed_fields and hasattr(account, field):
-                setattr(account, field, value)
-
-        account.updated_at = datetime.utcnow()
-
-        await account.save()
+        rows = await connections.get("default").execute_query_dict(
+            sql, values + [account_id, user_id]
+        )
+        if not rows:
+            return None
 
-        return self._account_to_dict(account)
+        row = rows[0]
+        row["meta"] = fields_map["meta"].to_python_value(row["meta"])
+        return self._row_to_dict(row)
 
     def _account_to_dict(self, account: Account) -> Dict[str, Any]:
         """Convert Account model to dictionary."""
-        return {
-            "id": str(account.id),
-            "user_id": str(account.user_id),
-            "account_name": account.account_name,
-            "account_type": account.account_type,
-            "institution": account.institution,
-            "account_number_last4": account.account_number_last4,
-            "currency": account.currency,
-            "current_balance": float(account.current_balance)
-            if account.current_balance
-            else None,
-            "available_balance": float(account.available_balance)
-            if account.available_balance
-            else None,
-            "credit_limit": float(account.credit_limit)
-            if account.credit_limit
-            else None,
-            "is_active": account.is_active,
-            "last_synced_at": account.last_synced_at.isoformat()
-            if account.last_synced_at
-            else None,
-            "sync_error": account.sync_error,
-            "meta": account.meta,
-            "created_at": account.created_at.isoformat()
-            if account.created_at
-            else None,
-            "updated_at": account.updated_at.isoformat()
-            if account.updated_at
-            else None,
-        }
+        # Field values live in the instance __dict__, so read them in one go
+        # rather than through getattr for each field
+        return self._row_to_dict(
+            dict(zip(_ACCOUNT_FIELDS, _account_values(account.__dict__)))
+        )
+
+    @staticmethod
+    def _row_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert an account row from ``.values(*_ACCOUNT_FIELDS)`` to the
+        service's dictionary form. Read paths fetch rows rather than models,
+        so no Account instances are built just to be converted back.
+        """
+        # Unrolled per field: this runs once per account on every listing
+        row["id"] = str(row["id"])
+        row["user_id"] = str(row["user_id"])
+
+        value = row["current_balance"]
+        row["current_balance"] = float(value) if value else None
+        value = row["available_balance"]
+        row["available_balance"] = float(value) if value else None
+        value = row["credit_limit"]
+        row["credit_limit"] = float(value) if value else None
+
+        value = row["last_synced_at"]
+        row["last_synced_at"] = value.isoformat() if value else None
+        value = row["created_at"]
+        row["created_at"] = value.isoformat() if value else None
+        value = row["updated_at"]
+        row["updated_at"] = value.isoformat() if value else None
+        return row
@@ -2,11 +2,42 @@
 Generic AI service supporting multiple LLM providers via LiteLLM.
 """
 
-from litellm import completion
 from app.config import settings
+import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+
+import orjson
+import httpx
+from cachetools import LRUCache
+from redis.asyncio import Redis
+
+from app.services.account_service import MATCH_EXACT, MATCH_STRONG
+from app.services.llm_cache import (
+    COMPLETION_TTL,
+    STATEMENT_TTL,
+    completion_key,
+    get_or_compute,
+    statement_cache_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-request timeout (seconds) and connection pool size for LLM API calls
+_LLM_TIMEOUT = 60.0
+_LLM_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# Decodes JSON values one at a time from streamed LLM output
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize prompt data to JSON; values orjson can't encode fall back to str."""
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(obj, default=str, option=option).decode()
 
 
 class LLMService:
@@ -21,6 +52,18 @@ class LLMService:
         self.api_base = settings.LLM_API_BASE
         self.temperature = settings.LLM_TEMPERATURE
         self.max_tokens = settings.LLM_MAX_TOKENS
+        self.fallback_models = settings.LLM_FALLBACK_MODELS
+        # Model -> monotonic time until which it is tried after the others
+        self._cooldowns: Dict[str, float] = {}
+        # One pooled HTTP client for every LLM call on an event loop, so
+        # connections (and their TLS handshakes) are reused across requests
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Redis for the LLM caches. The API and worker set it to their shared
+        # connection at startup; elsewhere one is opened per event loop.
+        self.redis: Optional[Redis] = None
+        self._own_redis: Optional[Redis] = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
         self.logger.info("LLM config: provider=%s model=%s api_base=%s", self.provider, self.model, self.api_base)
 
     def _get_model_name(self) -> str:
@@ -79,11 +122,139 @@ class LLMService:
 
         Returns:
             The text response from the LLM
+
+        Deterministic (temperature 0) requests are answered from the cache
+        when the same request was made recently.
         """
+        kwargs = self._completion_kwargs(
+            messages, temperature, max_tokens, response_format
+        )
+        if kwargs["temperature"] != 0:
+            return await self._acomplete(kwargs)
+
+        # The API key isn't part of the request's identity
+        key = completion_key({k: v for k, v in kwargs.items() if k != "api_key"})
+        return await _cached_result(
+            key, COMPLETION_TTL, lambda: self._acomplete(kwargs)
+        )
+
+    async def batch_complete(
+        self,
+        batches: List[List[Dict[str, str]]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> List[Union[str, BaseException]]:
+        """
+        Get completions for several independent prompts concurrently.
+
+        Args:
+            batches: One message list per prompt
+            temperature, max_tokens, response_format: As for complete()
+
+        Returns:
+            The text response, or the exception raised, for each prompt in
+            the order given
+        """
+        # Start every request before awaiting any, so total latency is the
+        # slowest call rather than the sum
+        tasks = [
+            asyncio.create_task(
+                self.complete(messages, temperature, max_tokens, response_format)
+            )
+            for messages in batches
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _acomplete(self, kwargs: Dict[str, Any]) -> str:
+        """
+        Send a completion request and return the response text.
+
+        When a model is rate limited, times out or is unreachable, the request
+        moves on to the next of the fallback models, and the failing model is
+        tried last until its cooldown expires.
+        """
+        litellm = self._litellm()
+        failover_errors = (
+            litellm.RateLimitError,
+            litellm.Timeout,
+            litellm.APIConnectionError,
+            litellm.ServiceUnavailableError,
+        )
+
+        candidates = [kwargs] + [
+            self._fallback_kwargs(kwargs, model) for model in self.fallback_models
+        ]
+        now = time.monotonic()
+        candidates.sort(
+            key=lambda request: self._cooldowns.get(request["model"], 0) > now
+        )
+
+        for attempt, request in enumerate(candidates, 1):
+            model = request["model"]
+            try:
+                response = await litellm.acompletion(**request)
+            except failover_errors as e:
+                if attempt == len(candidates):
+                    raise
+                self._cooldowns[model] = (
+                    time.monotonic() + settings.LLM_FALLBACK_COOLDOWN
+                )
+                self.logger.warning(
+                    "LLM model %s failed (%s), trying the next model", model, e
+                )
+                continue
+
+            if model != self.model:
+                self.logger.info("LLM request served by fallback model %s", model)
+            return response.choices[0].message.content
+
+    @staticmethod
+    def _fallback_kwargs(kwargs: Dict[str, Any], model: str) -> Dict[str, Any]:
+        """Completion arguments for a fallback model, without the primary's key."""
+        request = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in {"api_key", "api_base", "custom_llm_provider"}
+        }
+        request["model"] = model
+        return request
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from the LLM.
+
+        Takes the same arguments as complete() and yields the response text
+        in chunks as the model generates it.
+        """
+        kwargs = self._completion_kwargs(messages, temperature, max_tokens, None)
+        kwargs["stream"] = True
+
+        response = await self._litellm().acompletion(**kwargs)
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    def _completion_kwargs(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        response_format: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the litellm completion arguments for a request."""
         kwargs = {
             "model": self.model,
             "messages": messages,
-            "temperature": temperature or self.temperature,
+            "temperature": (
+                temperature if temperature is not None else self.temperature
+            ),
             "max_tokens": max_tokens or self.max_tokens,
         }
 
@@ -102,36 +273,74 @@ class LLMService:
         if response_format:
             kwargs["response_format"] = response_format
 
-        response = completion(**kwargs)
-        return response.choices[0].message.content
+        return kwargs
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings from the configured embedding model.
+
+        Credentials come from the embedding provider's usual environment
+        variables, since it often isn't the chat provider.
+        """
+        response = await self._litellm().aembedding(
+            model=settings.LLM_EMBEDDING_MODEL, input=texts
+        )
+        return [item["embedding"] for item in response.data]
+
+    def _litellm(self):
+        """Import litellm and point it at the shared HTTP client."""
+        # litellm takes seconds to import; load it on the first request
+        # rather than at app startup.
+        import litellm
+
+        # Async connections belong to the loop that opened them, and flows
+        # started with asyncio.run each get a fresh loop
+        loop = asyncio.get_running_loop()
+        if self._http_loop is not loop:
+            self._http_client = httpx.AsyncClient(
+                timeout=_LLM_TIMEOUT, limits=_LLM_HTTP_LIMITS
+            )
+            self._http_loop = loop
+        litellm.aclient_session = self._http_client
+        return litellm
+
+    def cache_redis(self) -> Redis:
+        """Redis client for the LLM caches."""
+        if self.redis is not None:
+            return self.redis
+
+        loop = asyncio.get_running_loop()
+        if self._redis_loop is not loop:
+            self._own_redis = Redis.from_url(settings.REDIS_URL)
+            self._redis_loop = loop
+        return self._own_redis
+
+    async def aclose(self):
+        """Close the shared HTTP client's and this service's Redis connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_loop = None
+        if self._own_redis is not None:
+            await self._own_redis.aclose()
+            self._own_redis = None
+            self._redis_loop = None
 
 
 # Global LLM service instance
 llm_service = LLMService()
 
 
-async def process_nl_query(user_id: str, query: str) -> Dict[str, Any]:
-    """
-    Process natural language financial queries.
-
-    Examples:
-    - "How much did I spend on restaurants last month?"
-    - "Show me my top 5 spending categories this year"
-    - "Am I on track with my grocery budget?"
-    """
-    # Get user's financial context
-    context = await get_user_financial_context(user_id)
-
-    prompt = f"""You are a financial analysis assistant. Analyze this user's financial data and answer their question.
+_NL_QUERY_PROMPT = """You are a financial analysis assistant. Analyze this user's financial data and answer their question.
 
 User's Financial Context:
-- Total accounts: {context.get("account_count", 0)}
-- Current month spending: ${context.get("current_month_spending", 0)}
-- Active budgets: {json.dumps(context.get("budgets", []))}
-- Top categories: {json.dumps(context.get("top_categories", []))}
+- Total accounts: {account_count}
+- Current month spending: ${current_month_spending}
+- Active budgets: {budgets}
+- Top categories: {top_categories}
 
 Recent transactions (last 30 days):
-{json.dumps(context.get("recent_transactions", [])[:50], indent=2, default=str)}
+{recent_transactions}
 
 User's question: {query}
 
@@ -143,38 +352,49 @@ Provide a clear, concise answer with specific numbers. Format your response as J
 }}
 """
 
+
+async def process_nl_query(user_id: str, query: str) -> Dict[str, Any]:
+    """
+    Process natural language financial queries.
+
+    Examples:
+    - "How much did I spend on restaurants last month?"
+    - "Show me my top 5 spending categories this year"
+    - "Am I on track with my grocery budget?"
+    """
+    # Get user's financial context
+    context = await get_user_financial_context(user_id)
+
+    prompt = _NL_QUERY_PROMPT.format(
+        account_count=context.get("account_count", 0),
+        current_month_spending=context.get("current_month_spending", 0),
+        budgets=_dumps(context.get("budgets", [])),
+        top_categories=_dumps(context.get("top_categories", [])),
+        recent_transactions=_dumps(
+            context.get("recent_transactions", [])[:50], indent=True
+        ),
+        query=query,
+    )
+
     messages = [{"role": "user", "content": prompt}]
     response = await llm_service.complete(messages)
 
     try:
-        result = json.loads(response)
+        result = orjson.loads(response)
         return result
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # If response isn't JSON, wrap it
         return {"response": response, "query_type": "general", "data": None}
 
 
-async def generate_insights(user_id: str) -> List[Dict[str, Any]]:
-    """
-    Generate AI-powered financial insights.
-
-    Returns insights about:
-    - Spending anomalies
-    - Budget warnings
-    - Savings opportunities
-    - Trend analysis
-    """
-    # Get user's financial data
-    context = await get_user_financial_context(user_id)
-
-    prompt = f"""You are a financial advisor AI. Analyze this user's financial data and generate actionable insights.
+_INSIGHTS_PROMPT = """You are a financial advisor AI. Analyze this user's financial data and generate actionable insights.
 
 Financial Data:
-- Current month spending: ${context.get("current_month_spending", 0)}
-- Previous month spending: ${context.get("previous_month_spending", 0)}
-- Budgets: {json.dumps(context.get("budgets", []))}
-- Top spending categories: {json.dumps(context.get("top_categories", []))}
-- Recent transactions: {json.dumps(context.get("recent_transactions", [])[:30], default=str)}
+- Current month spending: ${current_month_spending}
+- Previous month spending: ${previous_month_spending}
+- Budgets: {budgets}
+- Top spending categories: {top_categories}
+- Recent transactions: {recent_transactions}
 
 Generate 3-5 insights as a JSON array:
 [
@@ -194,13 +414,35 @@ Focus on:
 4. Positive trends to celebrate
 """
 
+
+async def generate_insights(user_id: str) -> List[Dict[str, Any]]:
+    """
+    Generate AI-powered financial insights.
+
+    Returns insights about:
+    - Spending anomalies
+    - Budget warnings
+    - Savings opportunities
+    - Trend analysis
+    """
+    # Get user's financial data
+    context = await get_user_financial_context(user_id)
+
+    prompt = _INSIGHTS_PROMPT.format(
+        current_month_spending=context.get("current_month_spending", 0),
+        previous_month_spending=context.get("previous_month_spending", 0),
+        budgets=_dumps(context.get("budgets", [])),
+        top_categories=_dumps(context.get("top_categories", [])),
+        recent_transactions=_dumps(context.get("recent_transactions", [])[:30]),
+    )
+
     messages = [{"role": "user", "content": prompt}]
     response = await llm_service.complete(messages)
 
     try:
-        insights = json.loads(response)
+        insights = orjson.loads(response)
         return insights
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return []
 
 
@@ -224,18 +466,48 @@ async def analyze_statement_structure(content: Dict[str, Any]) -> Dict[str, Any]
             "confidence": 0.95
         }
     """
-    # Build prompt based on content type
-    if content.get("format_type") == "pdf":
-        pdf_content = content.get("content", {})
-        account_info = content.get("account_info", {})
+    # CSV files carry no institution or account details, so their metadata is
+    # fully determined by the parser; there's nothing for the LLM to add
+    if content.get("format_type") != "pdf":
+        date_range = content.get("date_range", {})
+        return {
+            "institution": None,
+            "account_number_last4": None,
+            "account_type": "unknown",
+            "statement_period": {
+                "start_date": date_range.get("start", ""),
+                "end_date": date_range.get("end", ""),
+            },
+            "format_type": "csv",
+            "confidence": 0.7,
+        }
 
-        prompt = f"""Analyze this bank statement and extract metadata.
+    # Re-uploads of the same statement reuse the earlier analysis
+    metadata = await _cached_result(
+        statement_cache_key("structure", content),
+        STATEMENT_TTL,
+        lambda: _analyze_pdf_structure(content),
+    )
+    if metadata is None:
+        # Return fallback metadata
+        return {
+            "institution": None,
+            "account_number_last4": None,
+            "account_type": "unknown",
+            "statement_period": content.get("date_range", {}),
+            "format_type": content.get("format_type", "unknown"),
+            "confidence": 0.3,
+        }
+    return metadata
+
+
+_ANALYZE_STATEMENT_PROMPT = """Analyze this bank statement and extract metadata.
 
 PDF Content:
-- Full Text Sample: {pdf_content.get("full_text", "")[:2000]}
-- Transaction Section: {pdf_content.get("transaction_section", "")[:1500]}
-- Has Tables: {pdf_content.get("has_tables", False)}
-- Detected Account Info: {json.dumps(account_info)}
+- Full Text Sample: {full_text}
+- Transaction Section: {transaction_section}
+- Has Tables: {has_tables}
+- Detected Account Info: {account_info}
 
 Return JSON with this structure:
 {{
@@ -254,48 +526,27 @@ Guidelines:
 - Extract statement date range
 - Set confidence based on how much information you can extract
 """
-    else:
-        # CSV format
-        csv_metadata = content
-        date_range = csv_metadata.get("date_range", {})
 
-        prompt = f"""Analyze this CSV bank statement metadata and extract information.
 
-CSV Metadata:
-- Format: CSV
-- Transaction count: {csv_metadata.get("transaction_count", 0)}
-- Date range: {date_range.get("start")} to {date_range.get("end")}
-
-Return JSON with this structure:
-{{
-  "institution": "bank name or null",
-  "account_number_last4": "null for CSV",
-  "account_type": "unknown",
-  "statement_period": {{"start_date": "{date_range.get("start", "")}", "end_date": "{date_range.get("end", "")}"}},
-  "format_type": "csv",
-  "confidence": 0.7
-}}
+async def _analyze_pdf_structure(content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Ask the LLM for a PDF statement's metadata; None if the reply isn't JSON."""
+    pdf_content = content.get("content", {})
+    account_info = content.get("account_info", {})
 
-Note: CSV files typically don't contain institution or account info, so those will be null/unknown.
-The user will need to specify the account during import.
-"""
+    prompt = _ANALYZE_STATEMENT_PROMPT.format(
+        full_text=pdf_content.get("full_text", "")[:2000],
+        transaction_section=pdf_content.get("transaction_section", "")[:1500],
+        has_tables=pdf_content.get("has_tables", False),
+        account_info=_dumps(account_info),
+    )
 
     messages = [{"role": "user", "content": prompt}]
-    response = await llm_service.complete(messages, temperature=0.1)
+    response = await llm_service.complete(messages, temperature=0)
 
     try:
-        metadata = json.loads(response)
-        return metadata
-    except json.JSONDecodeError:
-        # Return fallback metadata
-        return {
-            "institution": None,
-            "account_number_last4": None,
-            "account_type": "unknown",
-            "statement_period": content.get("date_range", {}),
-            "format_type": content.get("format_type", "unknown"),
-            "confidence": 0.3,
-        }
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
+        return None
 
 
 async def extract_transactions(
@@ -324,16 +575,23 @@ async def extract_transactions(
         # Already parsed CSV transactions - just add AI categorization
         return await categorize_transactions_batch(content)
 
-    # PDF content - need to extract transactions from text/tables
-    pdf_content = content.get("content", {})
+    # PDF content - need to extract transactions from text/tables. Re-uploads
+    # of the same statement reuse the earlier extraction.
+    transactions = await _cached_result(
+        statement_cache_key("transactions", content, statement_info),
+        STATEMENT_TTL,
+        lambda: _extract_pdf_transactions(content, statement_info),
+    )
+    return transactions if transactions is not None else []
+
 
-    prompt = f"""Extract transactions from this bank statement.
+_EXTRACT_TRANSACTIONS_PROMPT = """Extract transactions from this bank statement.
 
-Statement Info: {json.dumps(statement_info)}
+Statement Info: {statement_info}
 
 Content:
-- Transaction Section: {pdf_content.get("transaction_section", "")}
-- Tables: {json.dumps(pdf_content.get("tables", [])[:2])}
+- Transaction Section: {transaction_section}
+- Tables: {tables}
 
 Return JSON array of transactions:
 [{{
@@ -357,14 +615,132 @@ Guidelines:
 Categories: Income, Housing, Transportation, Food, Shopping, Entertainment, Healthcare, Financial, Personal, Travel, Other
 """
 
+
+async def _extract_pdf_transactions(
+    content: Dict[str, Any], statement_info: Dict[str, Any]
+) -> Optional[List[Dict[str, Any]]]:
+    """Ask the LLM for a PDF statement's transactions; None if the reply isn't JSON."""
+    pdf_content = content.get("content", {})
+
+    prompt = _EXTRACT_TRANSACTIONS_PROMPT.format(
+        statement_info=_dumps(statement_info),
+        transaction_section=pdf_content.get("transaction_section", ""),
+        tables=_dumps(pdf_content.get("tables", [])[:2]),
+    )
+
     messages = [{"role": "user", "content": prompt}]
-    response = await llm_service.complete(messages, max_tokens=4096, temperature=0.1)
+    chunks = llm_service.stream(messages, max_tokens=4096, temperature=0.1)
 
-    try:
-        transactions = json.loads(response)
-        return transactions
-    except json.JSONDecodeError:
-        return []
+    # Parse transactions as they arrive rather than after the whole reply.
+    # A reply cut off at max_tokens still yields every complete transaction.
+    transactions = [
+        item async for item in _iter_json_array(chunks) if isinstance(item, dict)
+    ]
+    return transactions or None
+
+
+async def _iter_json_array(chunks: AsyncIterator[str]) -> AsyncIterator[Any]:
+    """
+    Yield the elements of a JSON array streamed in text chunks, each as soon
+    as it is complete. Text before the opening bracket (e.g. a code fence)
+    is skipped, and an element left unfinished by the stream is dropped.
+    """
+    buffer = ""
+    started = False
+    async for chunk in chunks:
+        buffer += chunk
+        if not started:
+            start = buffer.find("[")
+            if start < 0:
+                continue
+            buffer = buffer[start + 1 :]
+            started = True
+
+        while True:
+            buffer = buffer.lstrip(" \t\r\n,")
+            if buffer.startswith("]"):
+                return
+            # orjson has no partial decoding; the stdlib decoder can parse a
+            # prefix and report where the element ended
+            try:
+                item, end = _JSON_DECODER.raw_decode(buffer)
+            except ValueError:
+                break
+            yield item
+            buffer = buffer[end:]
+
+
+async def _cached_result(
+    key: str, ttl: int, compute: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Get an LLM result from the cache, or compute and cache it."""
+    value, _ = await get_or_compute(llm_service.cache_redis(), key, ttl, compute)
+    return value
+
+
+# Category structure offered to the categorization prompt
+_CATEGORIES = {
+    "Income": ["Salary", "Freelance", "Investment Income", "Gifts", "Refunds"],
+    "Housing": [
+        "Rent/Mortgage",
+        "Utilities",
+        "Internet",
+        "Home Maintenance",
+        "Furniture",
+    ],
+    "Transportation": [
+        "Gas",
+        "Public Transit",
+        "Ride Share",
+        "Car Maintenance",
+        "Parking",
+    ],
+    "Food": ["Groceries", "Restaurants", "Coffee Shops", "Fast Food", "Delivery"],
+    "Shopping": ["Clothing", "Electronics", "Home Goods", "Personal Care", "Books"],
+    "Entertainment": [
+        "Streaming Services",
+        "Movies",
+        "Gaming",
+        "Hobbies",
+        "Events",
+    ],
+    "Healthcare": ["Medical", "Dental", "Pharmacy", "Health Insurance", "Fitness"],
+    "Financial": ["Bank Fees", "Interest", "Investments", "Insurance", "Taxes"],
+    "Personal": ["Haircut", "Spa", "Subscriptions", "Gifts", "Education"],
+    "Travel": ["Flights", "Hotels", "Vacation", "Travel Insurance"],
+    "Other": ["Uncategorized"],
+}
+_CATEGORIES_JSON = _dumps(_CATEGORIES, indent=True)
+
+# Concurrent categorization calls per process, to stay within provider rate limits
+_LLM_SEMAPHORE = asyncio.Semaphore(settings.LLM_CONCURRENCY)
+
+# Attempts per batch and the initial backoff delay (seconds) between them
+_CATEGORIZE_ATTEMPTS = 3
+_CATEGORIZE_RETRY_DELAY = 1.0
+
+# Confident categorizations by normalized merchant, kept across imports in
+# this process. Statements repeat the same few merchants constantly, so most
+# transactions never need to reach the LLM.
+_MERCHANT_CATEGORIES: LRUCache = LRUCache(maxsize=10_000)
+_MEMO_MIN_CONFIDENCE = 0.9
+
+# Category labels for embedding classification, as (category, subcategory).
+# Label embeddings are computed on first use; merchant embeddings are kept
+# across imports so repeat merchants aren't embedded again.
+_LABELS = [(cat, sub) for cat, subs in _CATEGORIES.items() for sub in subs]
+_label_vectors = None
+_MERCHANT_VECTORS: LRUCache = LRUCache(maxsize=10_000)
+_EMBEDDING_BATCH_SIZE = 200
+
+# Fields categorization sets on a transaction, and their fallback values
+_CATEGORY_FIELDS = ("category", "subcategory", "confidence")
+_UNCATEGORIZED = {"category": "Other", "subcategory": "Uncategorized", "confidence": 0.0}
+
+
+def _merchant_key(merchant_name: Optional[str]) -> str:
+    """Normalize a merchant name for the memo ("Starbucks #123" -> "STARBUCKS")."""
+    return re.sub(r"[^A-Z]+", "", (merchant_name or "").upper())[:24]
 
 
 async def categorize_transactions_batch(
@@ -382,65 +758,118 @@ async def categorize_transactions_batch(
     if not transactions:
         return []
 
-    # Define category structure
-    categories = {
-        "Income": ["Salary", "Freelance", "Investment Income", "Gifts", "Refunds"],
-        "Housing": [
-            "Rent/Mortgage",
-            "Utilities",
-            "Internet",
-            "Home Maintenance",
-            "Furniture",
-        ],
-        "Transportation": [
-            "Gas",
-            "Public Transit",
-            "Ride Share",
-            "Car Maintenance",
-            "Parking",
-        ],
-        "Food": ["Groceries", "Restaurants", "Coffee Shops", "Fast Food", "Delivery"],
-        "Shopping": ["Clothing", "Electronics", "Home Goods", "Personal Care", "Books"],
-        "Entertainment": [
-            "Streaming Services",
-            "Movies",
-            "Gaming",
-            "Hobbies",
-            "Events",
-        ],
-        "Healthcare": ["Medical", "Dental", "Pharmacy", "Health Insurance", "Fitness"],
-        "Financial": ["Bank Fees", "Interest", "Investments", "Insurance", "Taxes"],
-        "Personal": ["Haircut", "Spa", "Subscriptions", "Gifts", "Education"],
-        "Travel": ["Flights", "Hotels", "Vacation", "Travel Insurance"],
-        "Other": ["Uncategorized"],
-    }
+    # Merchants categorized confidently before are filled in from the memo;
+    # only the rest go to the LLM
+    unknown = []
+    for txn in transactions:
+        memo = _MERCHANT_CATEGORIES.get(_merchant_key(txn.get("merchant_name")))
+        if memo is not None:
+            txn.update(memo)
+        else:
+            unknown.append(txn)
+
+    # Nearest-label embeddings settle most of the rest far more cheaply;
+    # only low-similarity transactions need the chat model
+    residual = unknown
+    if settings.LLM_EMBEDDING_MODEL and unknown:
+        try:
+            residual = await _categorize_by_embedding(unknown)
+        except Exception:
+            logger.warning("Embedding categorization failed", exc_info=True)
 
     # Limit batch size to avoid token limits
     batch_size = 30
-    all_categorized = []
+    batches = [
+        residual[i : i + batch_size] for i in range(0, len(residual), batch_size)
+    ]
+
+    # Batches are independent, so categorize them concurrently
+    await asyncio.gather(*(_categorize_batch(batch) for batch in batches))
 
-    for i in range(0, len(transactions), batch_size):
-        batch = transactions[i : i + batch_size]
+    for txn in unknown:
+        key = _merchant_key(txn.get("merchant_name"))
+        if key and txn["confidence"] >= _MEMO_MIN_CONFIDENCE:
+            _MERCHANT_CATEGORIES[key] = {
+                field: txn[field] for field in _CATEGORY_FIELDS
+            }
 
-        prompt = f"""You are a financial transaction categorization expert. Analyze these transactions and categorize each one.
+    return transactions
+
+
+async def _categorize_by_embedding(
+    transactions: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Categorize transactions in place by the most similar category label.
+
+    Cosine similarity is used as the confidence. Returns the transactions
+    whose best match is below EMBEDDING_MIN_CONFIDENCE, left uncategorized.
+    """
+    import numpy as np
+
+    global _label_vectors
+    if _label_vectors is None:
+        _label_vectors = await _embed([f"{cat}: {sub}" for cat, sub in _LABELS])
+
+    texts = [
+        txn.get("merchant_name") or (txn.get("description") or "")[:64]
+        for txn in transactions
+    ]
+
+    # Each distinct merchant is embedded once, then remembered across imports
+    vectors = {}
+    missing = []
+    for text in dict.fromkeys(texts):
+        vector = _MERCHANT_VECTORS.get(text)
+        if vector is None:
+            missing.append(text)
+        else:
+            vectors[text] = vector
+    if missing:
+        for text, vector in zip(missing, await _embed(missing)):
+            vectors[text] = _MERCHANT_VECTORS[text] = vector
+
+    similarity = np.stack([vectors[text] for text in texts]) @ _label_vectors.T
+    best = similarity.argmax(axis=1)
+    scores = similarity[np.arange(len(best)), best]
+
+    residual = []
+    for txn, label, score in zip(transactions, best, scores):
+        if score < settings.EMBEDDING_MIN_CONFIDENCE:
+            residual.append(txn)
+            continue
+        txn["category"], txn["subcategory"] = _LABELS[label]
+        txn["confidence"] = round(float(score), 2)
+    return residual
+
+
+async def _embed(texts: List[str]):
+    """Embed texts in batches, returning a matrix of unit-length rows."""
+    import numpy as np
+
+    vectors = []
+    for i in range(0, len(texts), _EMBEDDING_BATCH_SIZE):
+        vectors.extend(await llm_service.embed(texts[i : i + _EMBEDDING_BATCH_SIZE]))
+    matrix = np.asarray(vectors, dtype=np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+_CATEGORIZE_PROMPT = """You are a financial transaction categorization expert. Analyze these transactions and categorize each one.
 
 Available categories and subcategories:
-{json.dumps(categories, indent=2)}
+{categories}
 
-Transactions to categorize:
-{json.dumps(batch, indent=2, default=str)}
+Transactions to categorize (i: index, d: date, a: amount, negative for expenses, m: merchant or description):
+{transactions}
 
 For each transaction, determine:
 1. The most appropriate category and subcategory
 2. Your confidence level (0.0 to 1.0)
 
-Return ONLY a JSON array with this structure:
+Return ONLY a JSON array with one entry per transaction, using its index:
 [
   {{
-    "date": "YYYY-MM-DD",
-    "amount": -50.00,
-    "description": "...",
-    "merchant_name": "...",
+    "i": 0,
     "category": "category_name",
     "subcategory": "subcategory_name",
     "confidence": 0.95
@@ -454,34 +883,127 @@ Guidelines:
 - If truly unclear, use confidence < 0.5 and suggest "Other"
 """
 
-        messages = [{"role": "user", "content": prompt}]
-        response = await llm_service.complete(
-            messages, max_tokens=4096, temperature=0.1
-        )
 
+async def _categorize_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Categorize one batch of transactions in place, retrying failed LLM calls
+    with exponential backoff.
+
+    Transactions the LLM doesn't return a category for, including the whole
+    batch if it can't be reached or its response isn't valid JSON, fall back
+    to "Other", so one bad batch doesn't fail the import.
+    """
+    # Send only what the model needs to categorize; results come back keyed
+    # by index and are merged into the original dicts
+    slim = [
+        {
+            "i": i,
+            "d": txn.get("date"),
+            "a": txn.get("amount"),
+            "m": txn.get("merchant_name") or (txn.get("description") or "")[:60],
+        }
+        for i, txn in enumerate(batch)
+    ]
+
+    prompt = _CATEGORIZE_PROMPT.format(
+        categories=_CATEGORIES_JSON,
+        transactions=_dumps(slim),
+    )
+
+    messages = [{"role": "user", "content": prompt}]
+
+    response = None
+    for attempt in range(_CATEGORIZE_ATTEMPTS):
+        try:
+            async with _LLM_SEMAPHORE:
+                response = await llm_service.complete(
+                    messages, max_tokens=4096, temperature=0
+                )
+            break
+        except Exception:
+            logger.warning(
+                "Categorization attempt %d/%d failed",
+                attempt + 1,
+                _CATEGORIZE_ATTEMPTS,
+                exc_info=True,
+            )
+            if attempt + 1 < _CATEGORIZE_ATTEMPTS:
+                await asyncio.sleep(_CATEGORIZE_RETRY_DELAY * 2**attempt)
+
+    results = {}
+    if response is not None:
         try:
-            categorized_batch = json.loads(response)
-            all_categorized.extend(categorized_batch)
-        except json.JSONDecodeError:
-            # If parsing fails, return original batch with default category
-            for txn in batch:
-                txn["category"] = "Other"
-                txn["subcategory"] = "Uncategorized"
-                txn["confidence"] = 0.0
-            all_categorized.extend(batch)
+            results = {
+                result.get("i"): result
+                for result in orjson.loads(response)
+                if isinstance(result, dict)
+            }
+        except (orjson.JSONDecodeError, TypeError):
+            pass
+
+    for i, txn in enumerate(batch):
+        result = results.get(i, _UNCATEGORIZED)
+        for field in _CATEGORY_FIELDS:
+            txn[field] = result.get(field, _UNCATEGORIZED[field])
+    return batch
+
+
+# Confidence and explanation for the deterministic account match tiers that
+# are trusted without asking the LLM
+_MATCH_CONFIDENCE = {MATCH_EXACT: 1.0, MATCH_STRONG: 0.8}
+_MATCH_REASONING = {
+    MATCH_EXACT: "Institution, account type and last 4 digits match this account",
+    MATCH_STRONG: "Institution and account type match this account",
+}
 
-    return all_categorized
+
+_ACCOUNT_MATCH_PROMPT = """You are a financial account matching expert. Determine which account this statement belongs to.
+
+Statement Metadata:
+{statement_metadata}
+
+User's Existing Accounts:
+{accounts}
+
+Analyze and return JSON:
+{{
+  "suggested_account_id": "uuid of best match or null",
+  "confidence": 0.95,
+  "reasoning": "explanation of why this account matches",
+  "should_create_new": true/false,
+  "suggested_account_name": "name for new account if creating"
+}}
+
+Matching criteria (in order of importance):
+1. Institution name + account_number_last4 = EXACT match (confidence 1.0)
+2. Institution name + account_type = STRONG match (confidence 0.8)
+3. Account_type only = WEAK match (confidence 0.5)
+4. No matches = suggest creating new account
+
+Guidelines:
+- If there are zero existing accounts, always suggest creating a new account
+- If there are zero existing accounts, set suggested_account_id to null and confidence to 0.9
+- If multiple accounts match, choose the most recent or active one
+- If no good match (confidence < 0.7), suggest creating new account
+- For new accounts, suggest a descriptive name like "Chase Checking (...1234)"
+"""
 
 
 async def suggest_account_match(
-    statement_metadata: Dict[str, Any], user_accounts: List[Dict[str, Any]]
+    statement_metadata: Dict[str, Any],
+    user_accounts: List[Dict[str, Any]],
+    matching_accounts: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """
     Suggest which account this statement belongs to.
 
+    A single exact or strong match from find_matching_accounts is returned
+    directly; the LLM only weighs in on weaker or ambiguous matches.
+
     Args:
         statement_metadata: Extracted metadata from analyze_statement_structure()
         user_accounts: List of user's existing accounts
+        matching_accounts: Result of AccountService.find_matching_accounts()
 
     Returns:
         {
@@ -509,42 +1031,28 @@ async def suggest_account_match(
             "suggested_account_name": account_name,
         }
 
-    prompt = f"""You are a financial account matching expert. Determine which account this statement belongs to.
-
-Statement Metadata:
-{json.dumps(statement_metadata, indent=2)}
-
-User's Existing Accounts:
-{json.dumps(user_accounts, indent=2)}
-
-Analyze and return JSON:
-{{
-  "suggested_account_id": "uuid of best match or null",
-  "confidence": 0.95,
-  "reasoning": "explanation of why this account matches",
-  "should_create_new": true/false,
-  "suggested_account_name": "name for new account if creating"
-}}
-
-Matching criteria (in order of importance):
-1. Institution name + account_number_last4 = EXACT match (confidence 1.0)
-2. Institution name + account_type = STRONG match (confidence 0.8)
-3. Account_type only = WEAK match (confidence 0.5)
-4. No matches = suggest creating new account
-
-Guidelines:
-- If there are zero existing accounts, always suggest creating a new account
-- If there are zero existing accounts, set suggested_account_id to null and confidence to 0.9
-- If multiple accounts match, choose the most recent or active one
-- If no good match (confidence < 0.7), suggest creating new account
-- For new accounts, suggest a descriptive name like "Chase Checking (...1234)"
-"""
+    if matching_accounts and len(matching_accounts) == 1:
+        match = matching_accounts[0]
+        confidence = _MATCH_CONFIDENCE.get(match["match_rank"])
+        if confidence is not None:
+            return {
+                "suggested_account_id": match["id"],
+                "confidence": confidence,
+                "reasoning": _MATCH_REASONING[match["match_rank"]],
+                "should_create_new": False,
+                "suggested_account_name": match["account_name"],
+            }
+
+    prompt = _ACCOUNT_MATCH_PROMPT.format(
+        statement_metadata=_dumps(statement_metadata, indent=True),
+        accounts=_dumps(user_accounts, indent=True),
+    )
 
     messages = [{"role": "user", "content": prompt}]
-    response = await llm_service.complete(messages, temperature=0.1)
+    response = await llm_service.complete(messages, temperature=0)
 
     try:
-        suggestion = json.loads(response)
+        suggestion = orjson.loads(response)
         if suggestion.get("should_create_new") and not suggestion.get(
             "suggested_account_name"
         ):
@@ -558,7 +1066,7 @@ Guidelines:
 
             suggestion["suggested_account_name"] = account_name
         return suggestion
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # Return fallback - suggest creating new account
         institution = statement_metadata.get("institution", "Unknown")
         account_type = statement_metadata.get("account_type", "Unknown")
@@ -2,17 +2,34 @@
 Analytics service for financial insights and data aggregation.
 """
 
-from typing import List, Dict, Any
-from datetime import datetime
-from app.database import get_duckdb_connection
+import asyncio
+import uuid
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from datetime import date, datetime
+from tortoise import connections
+from app.database import get_analytics_connection
 
 
-async def generate_ai_insights() -> List[Dict[str, Any]]:
-    """Generate AI-powered insights from analytics data."""
+async def generate_ai_insights() -> AsyncIterator[Dict[str, Any]]:
+    """
+    Generate AI-powered insights from analytics data.
+
+    Insights are yielded one at a time as they are produced, so callers can
+    store each one without holding the whole set in memory.
+    """
     # TODO: Implement insight generation
     # Use DuckDB to query trends and patterns
-    # Use AI service to generate natural language insights
-    return []
+    # Use AI service to generate natural language insights, yielding each
+    # as its call completes (asyncio.as_completed over per-category tasks)
+    insights: List[Dict[str, Any]] = []
+    for insight in insights:
+        yield insight
+
+
+async def save_insight(insight: Dict[str, Any]):
+    """Store a generated insight."""
+    # TODO: Implement insight storage
+    pass
 
 
 async def find_recurring_patterns(
@@ -65,31 +82,395 @@ async def get_period_spending(user_id: str, category: str, period: str) -> float
     return 0.0
 
 
+# Transaction amounts and rollup totals are stored in cents; each query
+# aggregates cents and converts only the figures it returns.
+
+_DASHBOARD_SQL = """
+    WITH month AS (
+        SELECT amount, COALESCE(category, 'Uncategorized') AS category
+        FROM transactions
+        WHERE user_id = $1
+            AND transaction_date >= date_trunc('month', current_date)
+    ),
+    month_spending AS (
+        SELECT category, SUM(-amount) AS total_amount
+        FROM month
+        WHERE amount < 0
+        GROUP BY category
+    )
+    SELECT json_build_object(
+        'current_month_spending', (
+            SELECT round(COALESCE(SUM(total_amount), 0) / 100.0, 2)
+            FROM month_spending
+        ),
+        'current_month_income', (
+            SELECT round(COALESCE(SUM(amount), 0) / 100.0, 2)
+            FROM month WHERE amount > 0
+        ),
+        'budget_status', COALESCE((
+            SELECT json_agg(json_build_object(
+                'category', b.category,
+                'budget', b.amount,
+                'spent', round(COALESCE(s.total_amount, 0) / 100.0, 2),
+                -- spent is in cents, so cents / budget is already a percentage
+                'percentage_used',
+                    round(COALESCE(s.total_amount, 0) / NULLIF(b.amount, 0), 1)
+            ) ORDER BY b.category)
+            FROM budgets b
+            LEFT JOIN month_spending s ON s.category = b.category
+            WHERE b.user_id = $1 AND b.is_active AND b.period = 'monthly'
+        ), '[]'::json),
+        'recent_transactions', COALESCE((
+            SELECT json_agg(r)
+            FROM (
+                SELECT
+                    id, transaction_date, round(amount / 100.0, 2) AS amount,
+                    description, merchant_name, category, subcategory
+                FROM transactions
+                WHERE user_id = $1
+                ORDER BY transaction_date DESC, created_at DESC
+                LIMIT 10
+            ) r
+        ), '[]'::json),
+        'top_categories', COALESCE((
+            SELECT json_agg(c)
+            FROM (
+                SELECT category, round(total_amount / 100.0, 2) AS total_amount
+                FROM month_spending
+                ORDER BY total_amount DESC
+                LIMIT 5
+            ) c
+        ), '[]'::json)
+    )::text AS dashboard
+"""
+
+_SPENDING_BY_CATEGORY_SQL = """
+    SELECT
+        COALESCE(category, 'Uncategorized') AS category,
+        subcategory,
+        (SUM(ABS(amount)) / 100)::DECIMAL(18, 2) AS total_amount,
+        COUNT(*) AS transaction_count,
+        (SUM(ABS(amount)) * 100.0 / SUM(SUM(ABS(amount))) OVER ())::DOUBLE
+            AS percentage
+    FROM pg.transactions
+    WHERE user_id = ?::UUID
+        AND transaction_date BETWEEN ? AND ?
+        AND amount < 0
+    GROUP BY 1, 2
+    ORDER BY total_amount DESC
+"""
+
+_MONTHLY_SUMMARY_SQL = """
+    WITH recent AS (
+        SELECT
+            strftime(month, '%Y-%m') AS month,
+            category,
+            (income / 100)::DECIMAL(18, 2) AS income,
+            (expense / 100)::DECIMAL(18, 2) AS expense
+        FROM pg.user_monthly_rollup
+        WHERE user_id = ?::UUID
+            AND month >= date_trunc('month', current_date) - to_months(? - 1)
+            AND transaction_count > 0
+    ),
+    totals AS (
+        SELECT
+            month,
+            SUM(income) AS total_income,
+            SUM(expense) AS total_expenses
+        FROM recent
+        GROUP BY month
+    ),
+    by_category AS (
+        SELECT
+            month,
+            category,
+            expense AS total_amount,
+            row_number() OVER (PARTITION BY month ORDER BY expense DESC) AS rank
+        FROM recent
+        WHERE expense > 0
+    )
+    SELECT
+        t.month,
+        t.total_income,
+        t.total_expenses,
+        t.total_income - t.total_expenses AS net,
+        COALESCE(
+            list(
+                {'category': c.category, 'total_amount': c.total_amount}
+                ORDER BY c.rank
+            ) FILTER (WHERE c.rank <= 3),
+            []
+        ) AS top_categories
+    FROM totals t
+    LEFT JOIN by_category c ON c.month = t.month
+    GROUP BY t.month, t.total_income, t.total_expenses
+    ORDER BY t.month DESC
+"""
+
+
+_BUDGET_SPENDING_SQL = """
+    WITH active AS (
+        SELECT
+            id,
+            user_id,
+            category,
+            amount,
+            alert_threshold,
+            CASE period
+                WHEN 'quarterly' THEN date_trunc('quarter', current_date)
+                WHEN 'yearly' THEN date_trunc('year', current_date)
+                ELSE date_trunc('month', current_date)
+            END::DATE AS period_start
+        FROM pg.budgets
+        WHERE is_active
+            AND start_date <= current_date
+            AND (end_date IS NULL OR end_date >= current_date)
+    )
+    SELECT
+        b.id::VARCHAR AS budget_id,
+        b.user_id::VARCHAR AS user_id,
+        b.category,
+        b.amount::DOUBLE AS budget,
+        b.alert_threshold,
+        COALESCE(SUM(ABS(t.amount)), 0) / 100 AS spent
+    FROM active b
+    LEFT JOIN pg.transactions t
+        ON t.user_id = b.user_id
+        AND t.category = b.category
+        AND t.amount < 0
+        AND t.transaction_date >= b.period_start
+    GROUP BY ALL
+"""
+
+
+def _budget_alerts() -> Dict[str, List[Dict[str, Any]]]:
+    """Aggregate period spending per budget and keep those over threshold."""
+    cursor = get_analytics_connection().cursor()
+    try:
+        df = cursor.execute(_BUDGET_SPENDING_SQL).fetch_df()
+    finally:
+        cursor.close()
+
+    df = df[df["budget"] > 0].assign(percentage=lambda d: d["spent"] / d["budget"])
+    alerts = df[df["percentage"] >= df["alert_threshold"]]
+
+    columns = ["budget_id", "category", "spent", "budget", "percentage"]
+    return {
+        user_id: group[columns].to_dict("records")
+        for user_id, group in alerts.groupby("user_id")
+    }
+
+
+async def get_budget_alerts() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Find every active budget past its alert threshold for the current period.
+
+    Spending for all users and budgets is aggregated in one query rather
+    than one query per budget.
+
+    Returns:
+        Alerts grouped by user ID
+    """
+    return await asyncio.to_thread(_budget_alerts)
+
+
+async def get_dashboard_summary_json(user_id: str) -> str:
+    """
+    Get the dashboard summary as a JSON document.
+
+    Every figure comes from one Postgres statement, so transactions for the
+    current month are scanned once and the result is already encoded.
+    """
+    rows = await connections.get("default").execute_query_dict(
+        _DASHBOARD_SQL, [uuid.UUID(str(user_id))]
+    )
+    return rows[0]["dashboard"]
+
+
+def _date_filters(
+    start_date: Optional[date], end_date: Optional[date]
+) -> Tuple[str, List[Any]]:
+    """Build optional transaction_date bounds for a WHERE clause."""
+    clauses, params = "", []
+    if start_date:
+        clauses += " AND transaction_date >= ?"
+        params.append(start_date)
+    if end_date:
+        clauses += " AND transaction_date <= ?"
+        params.append(end_date)
+    return clauses, params
+
+
+def _query(sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+    """Run an analytics query on its own cursor and return rows as dicts."""
+    cursor = get_analytics_connection().cursor()
+    try:
+        cursor.execute(sql, params)
+        columns = [col[0] for col in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def _query_arrow(sql: str, params: List[Any]) -> bytes:
+    """Run an analytics query and encode the result as an Arrow IPC stream."""
+    cursor = get_analytics_connection().cursor()
+    try:
+        table = cursor.execute(sql, params).fetch_arrow_table()
+    finally:
+        cursor.close()
+
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
 async def get_spending_by_category_duckdb(
-    user_id: str, start_date: datetime, end_date: datetime
+    user_id: str, start_date: date, end_date: date
 ) -> List[Dict[str, Any]]:
     """
     Get spending breakdown by category using DuckDB.
 
     This is much faster than PostgreSQL for analytics queries.
     """
-    conn = get_duckdb_connection()
-
-    # TODO: Implement DuckDB query
-    # Example:
-    # query = '''
-    #     SELECT
-    #         category,
-    #         subcategory,
-    #         SUM(ABS(amount)) as total_amount,
-    #         COUNT(*) as transaction_count
-    #     FROM transactions
-    #     WHERE user_id = ?
-    #         AND transaction_date BETWEEN ? AND ?
-    #         AND amount < 0
-    #     GROUP BY category, subcategory
-    #     ORDER BY total_amount DESC
-    # '''
-
-    conn.close()
-    return []
+    return await asyncio.to_thread(
+        _query, _SPENDING_BY_CATEGORY_SQL, [user_id, start_date, end_date]
+    )
+
+
+async def get_spending_by_category_arrow(
+    user_id: str, start_date: date, end_date: date
+) -> bytes:
+    """Same as get_spending_by_category_duckdb, as an Arrow IPC stream."""
+    return await asyncio.to_thread(
+        _query_arrow, _SPENDING_BY_CATEGORY_SQL, [user_id, start_date, end_date]
+    )
+
+
+async def get_monthly_summary_duckdb(
+    user_id: str, months: int
+) -> List[Dict[str, Any]]:
+    """
+    Get income, expenses and top spending categories per month using DuckDB.
+
+    Reads the trigger-maintained user_monthly_rollup table, so the cost
+    depends on the number of months, not transactions. Covers the current
+    month and the ``months - 1`` before it, newest first.
+    """
+    return await asyncio.to_thread(_query, _MONTHLY_SUMMARY_SQL, [user_id, months])
+
+
+async def get_monthly_summary_arrow(user_id: str, months: int) -> bytes:
+    """Same as get_monthly_summary_duckdb, as an Arrow IPC stream."""
+    return await asyncio.to_thread(
+        _query_arrow, _MONTHLY_SUMMARY_SQL, [user_id, months]
+    )
+
+
+async def get_top_merchants_duckdb(
+    user_id: str,
+    limit: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[Dict[str, Any]]:
+    """Get merchants ranked by total spending using DuckDB."""
+    date_clauses, date_params = _date_filters(start_date, end_date)
+    query = f"""
+        SELECT
+            COALESCE(merchant_name, description) AS merchant,
+            (SUM(ABS(amount)) / 100)::DECIMAL(18, 2) AS total_amount,
+            COUNT(*) AS transaction_count
+        FROM pg.transactions
+        WHERE user_id = ?::UUID
+            AND amount < 0{date_clauses}
+        GROUP BY 1
+        ORDER BY total_amount DESC
+        LIMIT ?
+    """
+    return await asyncio.to_thread(
+        _query, query, [user_id, *date_params, limit]
+    )
+
+
+# DuckDB COPY options, file extension and media type for each export format
+EXPORT_FORMATS: Dict[str, Dict[str, str]] = {
+    "csv": {
+        "options": "FORMAT CSV, HEADER",
+        "extension": "csv",
+        "media_type": "text/csv",
+    },
+    "json": {
+        "options": "FORMAT JSON, ARRAY true",
+        "extension": "json",
+        "media_type": "application/json",
+    },
+    "excel": {
+        "options": "FORMAT xlsx, HEADER true",
+        "extension": "xlsx",
+        "media_type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    },
+    # Columnar and compressed: loads straight into DuckDB, pandas or Arrow
+    "parquet": {
+        "options": "FORMAT PARQUET, COMPRESSION ZSTD",
+        "extension": "parquet",
+        "media_type": "application/vnd.apache.parquet",
+    },
+}
+
+
+def _copy_transactions(
+    path: str, format: str, user_id: str, date_clauses: str, params: List[Any]
+):
+    """Write a user's transactions to ``path`` with DuckDB's COPY."""
+    options = EXPORT_FORMATS[format]["options"]
+    query = f"""
+        COPY (
+            SELECT
+                transaction_date,
+                post_date,
+                (amount / 100)::DECIMAL(15, 2) AS amount,
+                currency,
+                description,
+                merchant_name,
+                category,
+                subcategory,
+                notes
+            FROM pg.transactions
+            WHERE user_id = ?::UUID{date_clauses}
+            ORDER BY transaction_date, created_at
+        ) TO '{path}' ({options})
+    """
+    cursor = get_analytics_connection().cursor()
+    try:
+        cursor.execute(query, [user_id, *params])
+    finally:
+        cursor.close()
+
+
+async def export_transactions_duckdb(
+    user_id: str,
+    path: str,
+    format: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """
+    Export a user's transactions to a file using DuckDB.
+
+    COPY streams rows from Postgres to disk in vectors, so memory use stays
+    flat regardless of how many transactions are exported.
+
+    Args:
+        user_id: User ID
+        path: Destination file path (generated by the caller)
+        format: 'csv', 'json', 'excel' or 'parquet'
+        start_date: Optional earliest transaction date
+        end_date: Optional latest transaction date
+    """
+    date_clauses, date_params = _date_filters(start_date, end_date)
+    await asyncio.to_thread(
+        _copy_transactions, path, format, user_id, date_clauses, date_params
+    )
@@ -2,21 +2,212 @@
 Transaction categorization service.
 """
 
-from typing import List, Dict, Any, Optional
+import hashlib
+import logging
+import re
+import uuid
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from tortoise import connections
+
+from app.database import bulk_upsert
+from app.models.categorization_rule import CategorizationRule
+
+logger = logging.getLogger(__name__)
+
+# LLM categorizations are shared across users: the same merchant and
+# description get the same category no matter whose statement they came from.
+# Each pair has its own key so every entry expires on its own.
+CATEGORY_CACHE_PREFIX = "cat:"
+CATEGORY_CACHE_TTL = 30 * 24 * 3600  # 30 days
+_CACHED_FIELDS = ("category", "subcategory", "confidence")
+
+# Numbered or named backreferences in a rule's pattern
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+_RULE_COLUMNS = (
+    "id",
+    "user_id",
+    "pattern_type",
+    "pattern_value",
+    "category",
+    "subcategory",
+    "confidence_score",
+    "usage_count",
+    "created_at",
+)
+
+
+def categorization_cache_key(
+    merchant_name: Optional[str], description: Optional[str]
+) -> str:
+    """Categorization cache key for a merchant/description pair."""
+    raw = f"{merchant_name or ''}|{description or ''}".lower()
+    return CATEGORY_CACHE_PREFIX + hashlib.sha1(raw.encode()).hexdigest()
+
+
+async def get_cached_categorizations(
+    redis: Redis, transactions: List[Dict[str, Any]]
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Look up cached categorizations for a batch in a single round-trip.
+
+    Returns one entry per transaction, None on a miss. Redis errors are
+    logged and treated as a miss for the whole batch.
+    """
+    if not transactions:
+        return []
+
+    keys = [
+        categorization_cache_key(t.get("merchant_name"), t.get("description"))
+        for t in transactions
+    ]
+    try:
+        cached = await redis.mget(keys)
+    except RedisError as e:
+        logger.warning("Categorization cache read failed: %s", e)
+        return [None] * len(transactions)
+
+    return [orjson.loads(value) if value is not None else None for value in cached]
+
+
+async def cache_categorizations(
+    redis: Redis, entries: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+):
+    """
+    Store (transaction, result) pairs in the categorization cache.
+
+    Only pass LLM results: rule results come from one user's rules and must
+    not be served to others. Only category, subcategory and confidence are
+    kept, each entry expiring CATEGORY_CACHE_TTL after it was written.
+    """
+    if not entries:
+        return
+
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for txn, result in entries:
+            pipe.set(
+                categorization_cache_key(
+                    txn.get("merchant_name"), txn.get("description")
+                ),
+                orjson.dumps({field: result.get(field) for field in _CACHED_FIELDS}),
+                ex=CATEGORY_CACHE_TTL,
+            )
+        await pipe.execute()
+    except RedisError as e:
+        logger.warning("Categorization cache write failed: %s", e)
+
+
+class RuleMatcher:
+    """
+    A user's categorization rules, compiled for matching many transactions.
+
+    Merchant rules are an exact, case-insensitive lookup. Description rules
+    are regular expressions tried in rule order (highest confidence first).
+    When the patterns can be combined, one alternation of all of them is
+    checked first, so descriptions no rule matches are scanned only once.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self._by_merchant: Dict[str, Dict[str, Any]] = {}
+        self._descriptions: List[Tuple[re.Pattern, Dict[str, Any]]] = []
+
+        for rule in rules:
+            if rule["pattern_type"] == "merchant":
+                self._by_merchant.setdefault(rule["pattern_value"].lower(), rule)
+            elif rule["pattern_type"] == "description":
+                try:
+                    pattern = re.compile(rule["pattern_value"], re.IGNORECASE)
+                except re.error as e:
+                    logger.warning(
+                        "Skipping invalid categorization rule %s: %s", rule["id"], e
+                    )
+                    continue
+                self._descriptions.append((pattern, rule))
+
+        self._any_description_re = self._combine(
+            [pattern.pattern for pattern, _ in self._descriptions]
+        )
+
+    @staticmethod
+    def _combine(patterns: List[str]) -> Optional[re.Pattern]:
+        """
+        Compile patterns into one alternation matching wherever any of them
+        does, or None if they can't be combined safely.
+        """
+        # Backreferences would point at other rules' groups once combined
+        if not patterns or any(_BACKREFERENCE.search(p) for p in patterns):
+            return None
+        try:
+            # Fails on e.g. a group name used by two rules, or an inline
+            # flag that isn't at the start of the combined pattern
+            return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+        except re.error:
+            return None
+
+    def match(
+        self, merchant_name: Optional[str], description: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the rule matching a transaction, merchant rules first."""
+        if merchant_name:
+            rule = self._by_merchant.get(merchant_name.lower())
+            if rule:
+                return rule
+
+        if not self._descriptions or not description:
+            return None
+        if self._any_description_re and not self._any_description_re.search(
+            description
+        ):
+            return None
+
+        for pattern, rule in self._descriptions:
+            if pattern.search(description):
+                return rule
+        return None
+
+
+async def load_rule_matcher(user_id: str) -> RuleMatcher:
+    """Load and compile a user's categorization rules."""
+    rules = (
+        await CategorizationRule.filter(user_id=user_id)
+        .order_by("-confidence_score")
+        .values(
+            "id",
+            "pattern_type",
+            "pattern_value",
+            "category",
+            "subcategory",
+            "confidence_score",
+        )
+    )
+    return RuleMatcher(rules)
 
 
 async def check_categorization_rules(
-    merchant_name: Optional[str], description: str
+    merchant_name: Optional[str],
+    description: str,
+    user_id: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Check if there's a learned categorization rule for this transaction.
 
+    Rules are per user, so nothing matches without a user_id. To check many
+    transactions, load a RuleMatcher once and call its match method.
+
     Returns:
         Rule dict with category, subcategory, and confidence_score, or None
     """
-    # TODO: Implement database query for categorization rules
-    # Query by merchant_name (exact match) or description (pattern match)
-    return None
+    if not user_id:
+        return None
+
+    matcher = await load_rule_matcher(user_id)
+    return matcher.match(merchant_name, description)
 
 
 async def update_transaction_category(
@@ -31,17 +222,87 @@ async def update_transaction_category(
     pass
 
 
-async def create_categorization_rule(result: Dict[str, Any]):
+async def update_transaction_categories(results: List[Dict[str, Any]]) -> int:
+    """
+    Apply a batch of categorization results in a single UPDATE.
+
+    Args:
+        results: Dicts with id, category, subcategory, confidence and method
+
+    Returns:
+        Number of transactions updated
     """
-    Create a new categorization rule from a high-confidence AI result.
+    if not results:
+        return 0
+
+    # One array parameter per column keeps the statement shape fixed, so
+    # asyncpg reuses its prepared statement whatever the batch size.
+    sql = (
+        'UPDATE "transactions" AS t SET "category" = c.category, '
+        '"subcategory" = c.subcategory, "confidence_score" = c.confidence, '
+        '"ai_categorized" = c.ai_categorized, "updated_at" = now() '
+        "FROM unnest($1::uuid[], $2::text[], $3::text[], $4::float8[], $5::bool[]) "
+        "AS c(id, category, subcategory, confidence, ai_categorized) "
+        "WHERE t.id = c.id"
+    )
+    rows_affected, _ = await connections.get("default").execute_query(
+        sql,
+        [
+            [uuid.UUID(str(r["id"])) for r in results],
+            [r["category"] for r in results],
+            [r.get("subcategory") for r in results],
+            [float(r["confidence"]) for r in results],
+            [r.get("method") == "ai" for r in results],
+        ],
+    )
+    return rows_affected
+
+
+async def create_categorization_rules(results: List[Dict[str, Any]]) -> int:
+    """
+    Learn merchant rules from high-confidence AI results.
+
+    Each (user, merchant) pair becomes one merchant rule; an existing rule
+    for the pair takes the new category and confidence.
 
     Args:
-        result: Dict with transaction details and categorization
+        results: Categorization dicts with user_id and merchant_name
+
+    Returns:
+        Number of rules written
     """
-    # TODO: Implement rule creation
-    # Extract merchant name or description pattern
-    # Store rule for future use
-    pass
+    rules = {}
+    for result in results:
+        merchant_name = result.get("merchant_name")
+        if not result.get("user_id") or not merchant_name:
+            continue
+        key = (uuid.UUID(str(result["user_id"])), merchant_name.lower())
+        rules[key] = result
+    if not rules:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    await bulk_upsert(
+        CategorizationRule._meta.db_table,
+        _RULE_COLUMNS,
+        ("user_id", "pattern_type", "pattern_value"),
+        ("category", "subcategory", "confidence_score"),
+        [
+            (
+                uuid.uuid4(),
+                user_id,
+                "merchant",
+                merchant_name,
+                result["category"],
+                result.get("subcategory"),
+                float(result["confidence"]),
+                0,
+                now,
+            )
+            for (user_id, merchant_name), result in rules.items()
+        ],
+    )
+    return len(rules)
 
 
 async def get_uncategorized_transactions(limit: int = 500) -> List[Dict[str, Any]]:
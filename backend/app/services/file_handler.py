@@ -2,13 +2,19 @@
 File upload handling service.
 """
 
+import asyncio
+import codecs
 import os
+import shutil
 import uuid
-import magic
 from pathlib import Path
 from fastapi import UploadFile, HTTPException
 from app.config import settings
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+_HEADER_SIZE = 2048  # bytes sniffed to detect the file type
+_PDF_SIGNATURE = b"%PDF-"
+
 
 def ensure_upload_dir():
     """Create upload directory if it doesn't exist."""
@@ -24,7 +30,11 @@ def generate_job_id() -> str:
 
 def validate_file_type(file: UploadFile) -> str:
     """
-    Validate file type using magic numbers.
+    Validate file type from the file's leading bytes.
+
+    Only CSV and PDF are accepted, so a signature check is enough: PDFs
+    start with "%PDF-", and CSVs are UTF-8 text with commas or semicolons
+    (or any text with a .csv filename).
 
     Returns:
         File extension ('csv' or 'pdf')
@@ -33,28 +43,17 @@ def validate_file_type(file: UploadFile) -> str:
         HTTPException if file type is not supported
     """
     # Read first 2048 bytes to check file type
-    file_header = file.file.read(2048)
+    file_header = file.file.read(_HEADER_SIZE)
     file.file.seek(0)  # Reset file pointer
 
-    # Detect MIME type
-    mime = magic.Magic(mime=True)
-    file_type = mime.from_buffer(file_header)
+    if file_header.startswith(_PDF_SIGNATURE):
+        return "pdf"
 
-    # Check if it's a supported type
-    if file_type == "text/csv" or file_type == "text/plain":
-        # Additional check for CSV
+    if _is_text(file_header):
         if file.filename and file.filename.endswith(".csv"):
             return "csv"
-        # Check if content looks like CSV
-        try:
-            content = file_header.decode("utf-8")
-            if "," in content or ";" in content:
-                return "csv"
-        except (UnicodeDecodeError, AttributeError):
-            pass
-
-    if file_type == "application/pdf":
-        return "pdf"
+        if b"," in file_header or b";" in file_header:
+            return "csv"
 
     # Fallback to filename extension
     if file.filename:
@@ -64,40 +63,68 @@ def validate_file_type(file: UploadFile) -> str:
 
     raise HTTPException(
         status_code=400,
-        detail=f"Unsupported file type: {file_type}. Please upload CSV or PDF files.",
+        detail="Unsupported file type. Please upload CSV or PDF files.",
     )
 
 
-def validate_file_size(file: UploadFile):
-    """
-    Validate file size.
+def _is_text(header: bytes) -> bool:
+    """Whether header looks like UTF-8 text (no NULs, decodes cleanly)."""
+    if b"\0" in header:
+        return False
+    try:
+        # Incremental decoding tolerates a character cut off at the end
+        codecs.getincrementaldecoder("utf-8")().decode(header)
+    except UnicodeDecodeError:
+        return False
+    return True
 
-    Raises:
-        HTTPException if file is too large
-    """
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset
 
-    if file_size > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE / (1024 * 1024):.1f}MB",
-        )
+def file_too_large_error() -> HTTPException:
+    """Build the error raised when an upload exceeds MAX_UPLOAD_SIZE."""
+    return HTTPException(
+        status_code=400,
+        detail=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE / (1024 * 1024):.1f}MB",
+    )
+
+
+class _SizeLimitedWriter:
+    """File wrapper that raises once more than max_size bytes are written."""
+
+    def __init__(self, f, max_size: int):
+        self._f = f
+        self._max_size = max_size
+        self.size = 0
+
+    def write(self, chunk: bytes) -> int:
+        self.size += len(chunk)
+        if self.size > self._max_size:
+            raise file_too_large_error()
+        return self._f.write(chunk)
 
-    return file_size
+
+def _copy_upload(src, file_path: Path) -> int:
+    """Copy an upload's spooled file to file_path, returning its size."""
+    with open(file_path, "wb") as f:
+        writer = _SizeLimitedWriter(f, settings.MAX_UPLOAD_SIZE)
+        shutil.copyfileobj(src, writer, UPLOAD_CHUNK_SIZE)
+    return writer.size
 
 
 async def save_uploaded_file(file: UploadFile, job_id: str) -> tuple[str, int, str]:
     """
     Save uploaded file to temporary directory.
 
+    The upload is copied in UPLOAD_CHUNK_SIZE pieces so memory use stays
+    constant regardless of file size, and oversize files are rejected as
+    soon as they cross MAX_UPLOAD_SIZE. The whole copy runs in one worker
+    thread rather than hopping to the thread pool for every chunk read
+    and write.
+
     Returns:
         Tuple of (file_path, file_size, file_type)
     """
     # Validate file
     file_type = validate_file_type(file)
-    file_size = validate_file_size(file)
 
     # Create upload directory
     upload_dir = ensure_upload_dir()
@@ -107,9 +134,11 @@ async def save_uploaded_file(file: UploadFile, job_id: str) -> tuple[str, int, s
     file_path = upload_dir / safe_filename
 
     # Save file
-    content = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(content)
+    try:
+        file_size = await asyncio.to_thread(_copy_upload, file.file, file_path)
+    except BaseException:
+        cleanup_temp_file(str(file_path))
+        raise
 
     return str(file_path), file_size, file_type
 
@@ -0,0 +1,97 @@
+"""
+Redis cache for LLM-generated responses.
+
+Answers to natural language queries are keyed on a normalized form of the
+question, so trivially different phrasings ("Top 5 categories?" vs
+"top 5 categories") share an entry. Insights are keyed per user per day.
+Statement analysis and extraction are keyed on a hash of the statement
+content, so re-uploading a statement skips the LLM. Deterministic
+(temperature 0) completions are keyed on a hash of the whole request.
+"""
+
+import hashlib
+import logging
+import re
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+NL_QUERY_TTL = 600  # 10 minutes
+INSIGHTS_TTL = 3600  # 1 hour
+STATEMENT_TTL = 7 * 24 * 3600  # 7 days
+COMPLETION_TTL = 3600  # 1 hour
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return _WHITESPACE.sub(" ", _NON_WORD.sub(" ", query.lower())).strip()
+
+
+def nl_query_key(user_id: str, query: str) -> str:
+    """Cache key for a natural language query."""
+    digest = hashlib.sha1(normalize_query(query).encode()).hexdigest()
+    return f"nlq:{user_id}:{digest}"
+
+
+def insights_key(user_id: str) -> str:
+    """Cache key for today's insights."""
+    return f"insights:{user_id}:{date.today().isoformat()}"
+
+
+def statement_cache_key(kind: str, *content: Any) -> str:
+    """Cache key for an LLM result derived from parsed statement content."""
+    digest = hashlib.blake2b(
+        orjson.dumps(content, default=str, option=orjson.OPT_SORT_KEYS),
+        digest_size=20,
+    ).hexdigest()
+    return f"stmt:{kind}:{digest}"
+
+
+def completion_key(request: Dict[str, Any]) -> str:
+    """Cache key for an LLM completion request (model, messages, options)."""
+    digest = hashlib.sha256(
+        orjson.dumps(request, default=str, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    return f"llm:{digest}"
+
+
+async def get_or_compute(
+    redis: Redis, key: str, ttl: int, compute: Callable[[], Awaitable[Any]]
+) -> Tuple[Any, bool]:
+    """
+    Return the cached value for key, computing and storing it on a miss.
+
+    Redis errors are logged and treated as a miss, so an unavailable cache
+    never fails the request. None results aren't stored, so a compute that
+    signals failure with None is retried next time.
+
+    Returns:
+        Tuple of (value, hit)
+    """
+    try:
+        cached = await redis.get(key)
+    except RedisError as e:
+        logger.warning("LLM cache read failed for %s: %s", key, e)
+        cached = None
+
+    if cached is not None:
+        return orjson.loads(cached), True
+
+    value = await compute()
+    if value is None:
+        return value, False
+
+    try:
+        await redis.set(key, orjson.dumps(value), ex=ttl)
+    except RedisError as e:
+        logger.warning("LLM cache write failed for %s: %s", key, e)
+
+    return value, False
@@ -11,10 +11,15 @@ Processing stages:
 7. Database save
 """
 
+import asyncio
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List, Optional
 
-from app.utils.csv_parser import parse_csv_file, extract_statement_metadata
-from app.utils.pdf_parser import parse_pdf_file
+from app.config import settings
+from app.utils.statement_parser import parse_statement_file
 from app.services.ai_service import (
     analyze_statement_structure,
     extract_transactions,
@@ -26,6 +31,38 @@ from app.services.transaction_service import TransactionService
 from app.services.sync_job_service import SyncJobService
 from app.models.account import Account
 
+# Bounds concurrent file parses per process. Parsing is CPU heavy; extra
+# statements wait here instead of all queueing on the parse pool at once.
+_PARSE_SEMAPHORE = asyncio.Semaphore(settings.STATEMENT_PARSE_CONCURRENCY)
+
+# Parsing runs in worker processes so it doesn't hold the GIL against the
+# event loop. Created on first use to keep imports cheap.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the process pool used for statement parsing."""
+    global _parse_pool
+    if _parse_pool is None:
+        max_workers = settings.STATEMENT_PARSE_PROCESSES or math.ceil(
+            (os.cpu_count() or 1) / 2
+        )
+        # spawn, not fork: forking a process with a running event loop and
+        # live connection pools is unsafe
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    """Stop the statement parsing processes, if started."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
+
 
 class ProcessingStage:
     """Constants for processing stages."""
@@ -125,8 +162,14 @@ class StatementProcessor:
             )
 
             user_accounts = await self._get_user_accounts(user_id)
+            matching_accounts = await self.account_service.find_matching_accounts(
+                user_id,
+                institution=statement_metadata.get("institution"),
+                account_type=statement_metadata.get("account_type"),
+                account_number_last4=statement_metadata.get("account_number_last4"),
+            )
             account_match = await suggest_account_match(
-                statement_metadata, user_accounts
+                statement_metadata, user_accounts, matching_accounts
             )
 
             status.update(ProcessingStage.MATCHING_ACCOUNT, 55, "Account match found")
@@ -272,21 +315,11 @@ class StatementProcessor:
             return self._build_result(status, {"error": str(e)})
 
     async def _parse_file(self, file_path: str, file_type: str) -> Dict[str, Any]:
-        """Parse CSV or PDF file."""
-        try:
-            if file_type == "csv":
-                # Parse CSV
-                transactions = parse_csv_file(file_path)
-                metadata = extract_statement_metadata(file_path)
-
-                return {"format_type": "csv", "transactions": transactions, **metadata}
-            else:
-                # Parse PDF
-                result = parse_pdf_file(file_path)
-                return result
-
-        except Exception as e:
-            return {"error": f"Failed to parse {file_type}: {str(e)}"}
+        """Parse CSV or PDF file in the parse process pool."""
+        async with _PARSE_SEMAPHORE:
+            return await asyncio.get_running_loop().run_in_executor(
+                _get_parse_pool(), parse_statement_file, file_path, file_type
+            )
 
     async def _get_user_accounts(self, user_id: str) -> List[Dict[str, Any]]:
         """Get user's existing accounts."""
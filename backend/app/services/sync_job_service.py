@@ -2,26 +2,87 @@
 Sync job service - Database operations for job tracking.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
+import asyncio
+import logging
 import uuid
+from contextlib import asynccontextmanager
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from tortoise import connections
 
 from app.models.sync_job import SyncJob
 
+logger = logging.getLogger(__name__)
+
+# Status hashes for jobs still running or awaiting confirmation, and for
+# jobs that have finished and will only be polled a few more times.
+JOB_STATUS_TTL = 24 * 60 * 60
+FINISHED_JOB_STATUS_TTL = 60 * 60
+
+_STATUS_FIELDS = (
+    "id",
+    "user_id",
+    "status",
+    "stage",
+    "progress",
+    "error_message",
+    "account_match",
+    "statement_metadata",
+)
+
+
+def job_events_channel(job_id: str) -> str:
+    """Redis pub/sub channel carrying a job's status changes."""
+    return f"job:{job_id}:events"
+
 
 class SyncJobService:
     """Service for sync job tracking operations."""
 
+    def __init__(self, redis: Optional[Redis] = None):
+        # Optional Redis mirror of each job's status, kept in a
+        # ``job:{job_id}`` hash so status polling doesn't hit Postgres.
+        self.redis = redis
+        # Per-job locks so that, within this process, a job's status reaches
+        # Redis in the same order its updates were applied in Postgres. Each
+        # lock is kept only while some write holds or waits for it.
+        self._job_locks: Dict[str, asyncio.Lock] = {}
+        self._job_lock_users: Dict[str, int] = {}
+
+    @asynccontextmanager
+    async def _job_lock(self, job_id: str):
+        """Hold the lock serializing status writes for a job."""
+        key = str(job_id)
+        lock = self._job_locks.setdefault(key, asyncio.Lock())
+        self._job_lock_users[key] = self._job_lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._job_lock_users[key] -= 1
+            if not self._job_lock_users[key]:
+                del self._job_lock_users[key]
+                del self._job_locks[key]
+
     async def create_job(
-        self, user_id: str, job_id: str, job_type: str = "file_upload"
+        self,
+        user_id: Optional[str],
+        job_id: str,
+        job_type: str = "file_upload",
+        stage: str = "uploading",
     ) -> Dict[str, Any]:
         """
         Create a new sync job.
 
         Args:
-            user_id: User ID
+            user_id: User ID, or None for a system job
             job_id: Unique job identifier
             job_type: Type of job (file_upload, account_sync, etc.)
+            stage: Initial stage
 
         Returns:
             Created job dictionary
@@ -31,13 +92,15 @@ class SyncJobService:
             user_id=user_id,
             job_type=job_type,
             status="pending",
-            stage="uploading",
+            stage=stage,
             progress={"percentage": 0, "message": "Initializing..."},
             started_at=datetime.utcnow(),
             meta={},
         )
 
-        return self._job_to_dict(job)
+        job_dict = self._job_to_dict(job)
+        await self._cache_status(job_id, self._status_fields(job_dict))
+        return job_dict
 
     async def get_job(
         self, job_id: str, user_id: Optional[str] = None
@@ -61,6 +124,56 @@ class SyncJobService:
 
         return self._job_to_dict(job) if job else None
 
+    async def get_job_status(
+        self, job_id: str, user_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the fields needed to report a job's progress.
+
+        Served from the job's Redis hash when available. Otherwise, unlike
+        get_job, this leaves the bulky parts of the job metadata (parsed
+        file content) in the database and fetches only the keys the status
+        endpoint returns, in a single query.
+
+        Args:
+            job_id: Job ID
+            user_id: User ID for security check
+
+        Returns:
+            Status dictionary or None
+        """
+        cached = await self._get_cached_status(job_id)
+        if cached is not None:
+            return cached if cached["user_id"] == str(user_id) else None
+
+        sql = (
+            'SELECT "id", "status", "stage", "progress", "error_message", '
+            '"meta" -> \'account_match\' AS "account_match", '
+            '"meta" -> \'statement_metadata\' AS "statement_metadata" '
+            'FROM "sync_jobs" WHERE "id" = $1 AND "user_id" = $2'
+        )
+        rows = await connections.get("default").execute_query_dict(
+            sql, [uuid.UUID(str(job_id)), uuid.UUID(str(user_id))]
+        )
+
+        if not rows:
+            return None
+
+        row = rows[0]
+        json_field = SyncJob._meta.fields_map["meta"]
+        return {
+            "id": str(row["id"]),
+            "user_id": str(user_id),
+            "status": row["status"],
+            "stage": row["stage"],
+            "progress": json_field.to_python_value(row["progress"]) or {},
+            "error_message": row["error_message"],
+            "account_match": json_field.to_python_value(row["account_match"]),
+            "statement_metadata": json_field.to_python_value(
+                row["statement_metadata"]
+            ),
+        }
+
     async def update_job(
         self,
         job_id: str,
@@ -84,42 +197,203 @@ class SyncJobService:
         Returns:
             Updated job dictionary or None
         """
-        job = await SyncJob.filter(id=job_id).first()
+        assignments: List[str] = []
+        values: List[Any] = []
 
-        if not job:
-            return None
+        def assign(column: str, value: Any, expr: str = "${}"):
+            values.append(value)
+            assignments.append(f'"{column}" = ' + expr.format(len(values)))
 
         if status:
-            job.status = status
+            assign("status", status)
 
         if stage:
-            job.stage = stage
+            assign("stage", stage)
 
         if progress:
-            job.progress = progress
+            assign("progress", self._db_value("progress", progress), "${}::jsonb")
 
         if error_message:
-            job.error_message = error_message
+            assign("error_message", error_message)
 
         if metadata:
             # Merge with existing metadata
-            existing_meta = job.meta or {}
-            existing_meta.update(metadata)
-            job.meta = existing_meta
+            assign("meta", self._db_value("meta", metadata), '"meta" || ${}::jsonb')
 
         # Mark as completed if status is completed or failed
         if status in ["completed", "failed"]:
-            job.completed_at = datetime.utcnow()
+            assign("completed_at", self._db_value("completed_at", datetime.utcnow()))
+
+        if not assignments:
+            return await self.get_job(job_id)
+
+        # Single round trip: apply the update and read back the row
+        values.append(uuid.UUID(str(job_id)))
+        sql = (
+            f'UPDATE "sync_jobs" SET {", ".join(assignments)} '
+            f'WHERE "id" = ${len(values)} RETURNING *'
+        )
+        async with self._job_lock(job_id):
+            rows = await connections.get("default").execute_query_dict(sql, values)
+
+            if not rows:
+                return None
+
+            job_dict = self._job_to_dict(SyncJob._init_from_db(**rows[0]))
+            await self._cache_status(job_id, self._status_fields(job_dict))
+
+        return job_dict
+
+    async def transition_job(
+        self,
+        job_id: str,
+        user_id: str,
+        from_stage: str,
+        to_stage: str,
+        progress: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Move a job to a new stage only if it is currently in from_stage.
+
+        The check and the update are one statement that locks the job row,
+        so two callers cannot both claim the same transition, and a refused
+        transition still reports the job's current stage without a second
+        query.
+
+        Args:
+            job_id: Job ID
+            user_id: User ID for security check
+            from_stage: Stage the job must currently be in
+            to_stage: Stage to move the job to
+            progress: Progress information
+
+        Returns:
+            Dictionary with the job id, its stage after the call, whether it
+            was transitioned and its statement metadata, or None if the job
+            does not exist
+        """
+        sql = (
+            'WITH "current" AS ('
+            'SELECT "id", "stage" FROM "sync_jobs" '
+            'WHERE "id" = $3 AND "user_id" = $4 FOR UPDATE'
+            '), "moved" AS ('
+            'UPDATE "sync_jobs" AS j SET "status" = \'running\', "stage" = $1, '
+            '"progress" = $2::jsonb '
+            'FROM "current" AS c WHERE j."id" = c."id" AND c."stage" = $5 '
+            'RETURNING j."meta" -> \'statement_metadata\' AS "statement_metadata"'
+            ') '
+            'SELECT c."id", c."stage", '
+            'EXISTS (SELECT 1 FROM "moved") AS "transitioned", '
+            '(SELECT "statement_metadata" FROM "moved") AS "statement_metadata" '
+            'FROM "current" AS c'
+        )
+        async with self._job_lock(job_id):
+            rows = await connections.get("default").execute_query_dict(
+                sql,
+                [
+                    to_stage,
+                    self._db_value("progress", progress),
+                    uuid.UUID(str(job_id)),
+                    uuid.UUID(str(user_id)),
+                    from_stage,
+                ],
+            )
+
+            if not rows:
+                return None
+
+            row = rows[0]
+            if not row["transitioned"]:
+                return {
+                    "id": str(row["id"]),
+                    "stage": row["stage"],
+                    "transitioned": False,
+                    "statement_metadata": None,
+                }
+
+            await self._cache_status(
+                job_id, {"status": "running", "stage": to_stage, "progress": progress}
+            )
+
+        return {
+            "id": str(row["id"]),
+            "stage": to_stage,
+            "transitioned": True,
+            "statement_metadata": SyncJob._meta.fields_map["meta"].to_python_value(
+                row["statement_metadata"]
+            )
+            or {},
+        }
+
+    @staticmethod
+    def _status_fields(job: Dict[str, Any]) -> Dict[str, Any]:
+        """Pick the fields reported by get_job_status from a job dictionary."""
+        metadata = job["metadata"]
+        return {
+            "id": job["id"],
+            "user_id": job["user_id"],
+            "status": job["status"],
+            "stage": job["stage"],
+            "progress": job["progress"],
+            "error_message": job["error_message"],
+            "account_match": metadata.get("account_match"),
+            "statement_metadata": metadata.get("statement_metadata"),
+        }
+
+    async def _cache_status(self, job_id: str, fields: Dict[str, Any]):
+        """
+        Write status fields to the job's Redis hash (values JSON-encoded)
+        and publish them on the job's events channel.
+        """
+        if self.redis is None:
+            return
+
+        key = f"job:{job_id}"
+        ttl = (
+            FINISHED_JOB_STATUS_TTL
+            if fields.get("status") in ["completed", "failed"]
+            else JOB_STATUS_TTL
+        )
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={k: orjson.dumps(v) for k, v in fields.items()})
+                pipe.expire(key, ttl)
+                pipe.publish(job_events_channel(job_id), orjson.dumps(fields))
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Failed to cache status for job %s: %s", job_id, e)
+
+    async def _get_cached_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Read a job's status from Redis, or None if absent or incomplete."""
+        if self.redis is None:
+            return None
+
+        try:
+            cached = await self.redis.hgetall(f"job:{job_id}")
+        except RedisError as e:
+            logger.warning("Failed to read cached status for job %s: %s", job_id, e)
+            return None
+
+        status = {
+            (k.decode() if isinstance(k, bytes) else k): orjson.loads(v)
+            for k, v in cached.items()
+        }
+        if not all(field in status for field in _STATUS_FIELDS):
+            return None
 
-        await job.save()
+        status["progress"] = status["progress"] or {}
+        return status
 
-        return self._job_to_dict(job)
+    @staticmethod
+    def _db_value(field_name: str, value: Any) -> Any:
+        """Encode a value the same way the model field would on save."""
+        return SyncJob._meta.fields_map[field_name].to_db_value(value, SyncJob)
 
     def _job_to_dict(self, job: SyncJob) -> Dict[str, Any]:
         """Convert SyncJob model to dictionary."""
         return {
             "id": str(job.id),
-            "user_id": str(job.user_id),
+            "user_id": str(job.user_id) if job.user_id else None,
             "job_type": job.job_type,
             "prefect_flow_run_id": job.prefect_flow_run_id,
             "status": job.status,
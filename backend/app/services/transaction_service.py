@@ -2,11 +2,72 @@
 Transaction service - Database operations for transactions.
 """
 
-from typing import List, Optional, Dict, Any
+import base64
+import uuid
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, date, timedelta
-from decimal import Decimal
 
+import orjson
+from tortoise.expressions import Q
+
+from app.database import bulk_copy
 from app.models.transaction import Transaction
+from app.utils.money import from_cents, to_cents
+
+# Imports at least this large are written with COPY; smaller ones with a
+# multi-row INSERT, where COPY's setup cost isn't worth it.
+BULK_COPY_THRESHOLD = 100
+
+# Transactions checked for duplicates per query, and the date offsets an
+# existing transaction may be from an imported one and still duplicate it
+_DUPLICATE_CHECK_BATCH = 1000
+_DUPLICATE_DATE_OFFSETS = (timedelta(days=-1), timedelta(0), timedelta(days=1))
+
+# Encoded to JSON text for COPY, which doesn't go through Tortoise's fields
+_JSON_COLUMNS = frozenset({"tags", "meta"})
+
+_COPY_COLUMNS = (
+    "id",
+    "account_id",
+    "user_id",
+    "transaction_date",
+    "amount",
+    "currency",
+    "description",
+    "merchant_name",
+    "category",
+    "subcategory",
+    "tags",
+    "is_recurring",
+    "confidence_score",
+    "ai_categorized",
+    "user_verified",
+    "notes",
+    "meta",
+    "created_at",
+    "updated_at",
+)
+
+
+def encode_cursor(transaction_date: date, transaction_id: str) -> str:
+    """Encode a keyset pagination cursor for the last row of a page."""
+    raw = f"{transaction_date.isoformat()}|{transaction_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[date, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        last_date, last_id = raw.split("|")
+        return date.fromisoformat(last_date), uuid.UUID(last_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
 
 
 class TransactionService:
@@ -40,58 +101,87 @@ class TransactionService:
         duplicates = []
         new_transactions = []
 
-        for txn in transactions:
-            if await self._is_duplicate(account_id, txn):
-                duplicates.append(txn)
-            else:
-                new_transactions.append(txn)
+        for start in range(0, len(transactions), _DUPLICATE_CHECK_BATCH):
+            batch = transactions[start : start + _DUPLICATE_CHECK_BATCH]
+            keys = [self._duplicate_key(txn) for txn in batch]
+            existing = await self._existing_by_date_amount(account_id, keys)
+
+            for txn, (txn_date, amount) in zip(batch, keys):
+                candidates = [
+                    candidate
+                    for offset in _DUPLICATE_DATE_OFFSETS
+                    for candidate in existing.get((txn_date + offset, amount), ())
+                ]
+                if candidates and self._is_duplicate(txn, candidates):
+                    duplicates.append(txn)
+                else:
+                    new_transactions.append(txn)
 
         return {"duplicates": duplicates, "new": new_transactions}
 
-    async def _is_duplicate(self, account_id: str, txn: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _duplicate_key(txn: Dict[str, Any]) -> Tuple[date, int]:
+        """The (date, amount in cents) a transaction's duplicates share."""
+        txn_date = txn.get("date")
+        if isinstance(txn_date, str):
+            txn_date = datetime.strptime(txn_date, "%Y-%m-%d").date()
+        return txn_date, to_cents(txn.get("amount", 0))
+
+    async def _existing_by_date_amount(
+        self, account_id: str, keys: List[Tuple[date, int]]
+    ) -> Dict[Tuple[date, int], List[Tuple[str, str]]]:
         """
-        Check if a single transaction is a duplicate.
+        Fetch the account's transactions that could duplicate any of keys,
+        in one query, grouped by (date, amount).
+
+        Returns:
+            {(date, amount): [(description, merchant_name), ...]}, lowercased
+        """
+        dates = [txn_date for txn_date, _ in keys]
+        rows = await Transaction.filter(
+            account_id=account_id,
+            transaction_date__gte=min(dates) - timedelta(days=1),
+            transaction_date__lte=max(dates) + timedelta(days=1),
+            amount__in={amount for _, amount in keys},
+        ).values_list("transaction_date", "amount", "description", "merchant_name")
+
+        existing: Dict[Tuple[date, int], List[Tuple[str, str]]] = {}
+        for txn_date, amount, description, merchant_name in rows:
+            existing.setdefault((txn_date, amount), []).append(
+                (description.lower(), (merchant_name or "").lower())
+            )
+        return existing
+
+    @staticmethod
+    def _is_duplicate(
+        txn: Dict[str, Any], candidates: List[Tuple[str, str]]
+    ) -> bool:
+        """
+        Check if a transaction duplicates one of the existing transactions
+        with its amount within a day of its date.
 
         Args:
-            account_id: Account ID
-            txn: Transaction dictionary with 'date', 'amount', 'description', 'merchant_name'
+            txn: Transaction dictionary with 'description' and 'merchant_name'
+            candidates: Lowercased (description, merchant_name) of the
+                existing transactions
 
         Returns:
             True if duplicate exists, False otherwise
         """
-        txn_date = txn.get("date")
-        if isinstance(txn_date, str):
-            txn_date = datetime.strptime(txn_date, "%Y-%m-%d").date()
-
-        amount = Decimal(str(txn.get("amount", 0)))
         description = txn.get("description", "").lower()
         merchant_name = txn.get("merchant_name", "").lower()
 
-        # Check for existing transaction with same account, date (±1 day), and amount
-        date_from = txn_date - timedelta(days=1)
-        date_to = txn_date + timedelta(days=1)
-
-        existing = await Transaction.filter(
-            account_id=account_id,
-            transaction_date__gte=date_from,
-            transaction_date__lte=date_to,
-            amount=amount,
-        ).all()
-
-        # Check if any existing transaction has similar description/merchant
-        for existing_txn in existing:
+        for existing_description, existing_merchant in candidates:
             # Exact match on description or merchant is a duplicate
-            if existing_txn.description.lower() == description or (
-                merchant_name
-                and existing_txn.merchant_name
-                and existing_txn.merchant_name.lower() == merchant_name
+            if existing_description == description or (
+                merchant_name and existing_merchant == merchant_name
             ):
                 return True
 
             # Very similar description (contains each other) is likely a duplicate
             if (
-                description in existing_txn.description.lower()
-                or existing_txn.description.lower() in description
+                description in existing_description
+                or existing_description in description
             ):
                 return True
 
@@ -114,41 +204,65 @@ class TransactionService:
         if not transactions:
             return 0
 
-        saved_count = 0
-
-        transaction_models = []
         now = datetime.utcnow()
-        for txn_data in transactions:
-            txn_date = txn_data.get("date")
-            if isinstance(txn_date, str):
-                txn_date = datetime.strptime(txn_date, "%Y-%m-%d").date()
-
-            transaction_models.append(
-                Transaction(
-                    account_id=account_id,
-                    user_id=user_id,
-                    transaction_date=txn_date,
-                    amount=Decimal(str(txn_data.get("amount", 0))),
-                    currency=txn_data.get("currency", "USD"),
-                    description=txn_data.get("description", ""),
-                    merchant_name=txn_data.get("merchant_name"),
-                    category=txn_data.get("category"),
-                    subcategory=txn_data.get("subcategory"),
-                    tags=txn_data.get("tags", []),
-                    confidence_score=txn_data.get("confidence"),
-                    ai_categorized=txn_data.get("category") is not None,
-                    user_verified=False,
-                    notes=txn_data.get("notes"),
-                    meta=txn_data.get("meta", {}),
-                    created_at=now,
-                    updated_at=now,
-                )
+        rows = [
+            self._transaction_row(account_id, user_id, txn_data, now)
+            for txn_data in transactions
+        ]
+
+        if len(rows) >= BULK_COPY_THRESHOLD:
+            # Large imports never build Transaction instances: rows go
+            # straight from dicts to COPY tuples.
+            await bulk_copy(
+                Transaction._meta.db_table,
+                _COPY_COLUMNS,
+                [self._copy_record(row) for row in rows],
             )
-            saved_count += 1
+        else:
+            await Transaction.bulk_create([Transaction(**row) for row in rows])
+
+        return len(rows)
 
-        await Transaction.bulk_create(transaction_models)
+    @staticmethod
+    def _transaction_row(
+        account_id: str, user_id: str, txn_data: Dict[str, Any], now: datetime
+    ) -> Dict[str, Any]:
+        """Column values for a new transaction, keyed by _COPY_COLUMNS."""
+        txn_date = txn_data.get("date")
+        if isinstance(txn_date, str):
+            txn_date = datetime.strptime(txn_date, "%Y-%m-%d").date()
 
-        return saved_count
+        return {
+            "id": uuid.uuid4(),
+            "account_id": uuid.UUID(str(account_id)),
+            "user_id": uuid.UUID(str(user_id)),
+            "transaction_date": txn_date,
+            "amount": to_cents(txn_data.get("amount", 0)),
+            "currency": txn_data.get("currency", "USD"),
+            "description": txn_data.get("description", ""),
+            "merchant_name": txn_data.get("merchant_name"),
+            "category": txn_data.get("category"),
+            "subcategory": txn_data.get("subcategory"),
+            "tags": txn_data.get("tags", []),
+            "is_recurring": False,
+            "confidence_score": txn_data.get("confidence"),
+            "ai_categorized": txn_data.get("category") is not None,
+            "user_verified": False,
+            "notes": txn_data.get("notes"),
+            "meta": txn_data.get("meta", {}),
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    @staticmethod
+    def _copy_record(row: Dict[str, Any]) -> tuple:
+        """Row tuple for bulk_copy, in _COPY_COLUMNS order."""
+        return tuple(
+            orjson.dumps(row[column]).decode()
+            if column in _JSON_COLUMNS
+            else row[column]
+            for column in _COPY_COLUMNS
+        )
 
     async def get_user_transactions(
         self,
@@ -181,6 +295,67 @@ class TransactionService:
 
         return [self._transaction_to_dict(txn) for txn in transactions]
 
+    async def list_transactions(
+        self,
+        user_id: str,
+        account_id: Optional[str] = None,
+        category: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List a user's transactions, newest first, one page at a time.
+
+        Pages are keyed on (transaction_date, id) rather than an offset, so
+        each page is an index range scan from the previous page's last row
+        instead of scanning and discarding every earlier row.
+
+        Args:
+            user_id: User ID
+            account_id: Optional account ID filter
+            category: Optional category filter
+            start_date: Optional earliest transaction date
+            end_date: Optional latest transaction date
+            cursor: Cursor returned with the previous page
+            limit: Maximum number of transactions to return
+
+        Returns:
+            Tuple of (transactions, cursor for the next page or None)
+
+        Raises:
+            ValueError if the cursor is malformed
+        """
+        query = Transaction.filter(user_id=user_id)
+
+        if account_id:
+            query = query.filter(account_id=account_id)
+        if category:
+            query = query.filter(category=category)
+        if start_date:
+            query = query.filter(transaction_date__gte=start_date)
+        if end_date:
+            query = query.filter(transaction_date__lte=end_date)
+
+        if cursor:
+            last_date, last_id = decode_cursor(cursor)
+            query = query.filter(
+                Q(transaction_date__lt=last_date)
+                | Q(transaction_date=last_date, id__lt=last_id)
+            )
+
+        transactions = (
+            await query.order_by("-transaction_date", "-id").limit(limit).all()
+        )
+
+        next_cursor = None
+        if len(transactions) == limit:
+            last = transactions[-1]
+            next_cursor = encode_cursor(last.transaction_date, str(last.id))
+
+        return [self._transaction_to_dict(txn) for txn in transactions], next_cursor
+
     def _transaction_to_dict(self, txn: Transaction) -> Dict[str, Any]:
         """Convert Transaction model to dictionary."""
         return {
@@ -191,7 +366,7 @@ class TransactionService:
             if txn.transaction_date
             else None,
             "post_date": txn.post_date.isoformat() if txn.post_date else None,
-            "amount": float(txn.amount) if txn.amount else 0,
+            "amount": float(from_cents(txn.amount)) if txn.amount else 0,
             "currency": txn.currency,
             "description": txn.description,
             "merchant_name": txn.merchant_name,
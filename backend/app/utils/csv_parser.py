@@ -98,6 +98,20 @@ def parse_amount(amount_str: str) -> Optional[float]:
         return None
 
 
+def _parse_amounts(values: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_amount over a column; unparseable amounts become NaN.
+    """
+    raw = values.astype(str).str.strip()
+    is_negative = raw.str.upper().str.contains("DR", regex=False) | (
+        raw.str.startswith("(")
+    )
+    amounts = pd.to_numeric(
+        raw.str.replace(r"[^\d.-]", "", regex=True), errors="coerce"
+    )
+    return amounts.mask(is_negative, -amounts.abs())
+
+
 def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize column names to standard format.
@@ -192,6 +206,18 @@ def clean_merchant_name(description: str) -> str:
     return description
 
 
+def _clean_merchant_names(descriptions: pd.Series) -> pd.Series:
+    """Vectorized clean_merchant_name over a column of strings."""
+    return (
+        descriptions.str.replace(r"#\d+", "", regex=True)
+        .str.replace(r"REF:\s*\w+", "", regex=True, flags=re.IGNORECASE)
+        .str.replace(r"\*+\d{4}", "", regex=True)
+        .str.replace(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}", "", regex=True)
+        .str.split()
+        .str.join(" ")
+    )
+
+
 def parse_csv_file(file_path: str) -> List[Dict[str, Any]]:
     """
     Parse a CSV bank statement file.
@@ -221,46 +247,43 @@ def parse_csv_file(file_path: str) -> List[Dict[str, Any]]:
     if "date" not in df.columns or "amount" not in df.columns:
         raise ValueError("CSV must contain 'date' and 'amount' columns")
 
-    # Parse transactions
-    transactions = []
-
-    for _, row in df.iterrows():
-        # Skip rows with missing critical data
-        if pd.isna(row.get("date")) or pd.isna(row.get("amount")):
-            continue
-
-        # Parse date
-        transaction_date = parse_date(row["date"])
-        if not transaction_date:
-            continue
-
-        # Parse amount
-        amount = parse_amount(str(row["amount"]))
-        if amount is None:
-            continue
+    # Parse transactions column-wise rather than row by row. Skip rows with
+    # missing critical data
+    df = df[df["date"].notna() & df["amount"].notna()]
 
-        # Get description
-        description = (
-            str(row.get("description", ""))
-            if not pd.isna(row.get("description"))
-            else ""
+    # Statements repeat the same few dates, so parse each distinct one once
+    dates = df["date"].map(
+        {value: parse_date(value) for value in df["date"].unique()}
+    )
+    amounts = _parse_amounts(df["amount"])
+
+    # Get description
+    if "description" in df.columns:
+        descriptions = df["description"].fillna("").astype(str)
+    else:
+        descriptions = pd.Series("", index=df.index)
+
+    # Extract merchant name, preferring a merchant column when present
+    merchant_names = _clean_merchant_names(descriptions)
+    if "merchant_name" in df.columns:
+        merchants = df["merchant_name"]
+        merchant_names = merchant_names.mask(
+            merchants.notna(), _clean_merchant_names(merchants.astype(str))
         )
 
-        # Extract merchant name
-        merchant_name = clean_merchant_name(description)
-        if "merchant_name" in row and not pd.isna(row["merchant_name"]):
-            merchant_name = clean_merchant_name(str(row["merchant_name"]))
-
-        transaction = {
-            "date": transaction_date,
-            "amount": amount,
-            "description": description,
-            "merchant_name": merchant_name,
+    transactions = pd.DataFrame(
+        {
+            "date": dates,
+            "amount": amounts,
+            "description": descriptions,
+            "merchant_name": merchant_names,
         }
+    )
+    transactions = transactions[
+        transactions["date"].notna() & transactions["amount"].notna()
+    ]
 
-        transactions.append(transaction)
-
-    return transactions
+    return transactions.to_dict("records")
 
 
 def extract_statement_metadata(file_path: str) -> Dict[str, Any]:
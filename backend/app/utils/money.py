@@ -0,0 +1,23 @@
+"""
+Conversions between decimal amounts and integer cents.
+
+Transaction amounts are stored as BIGINT cents; the rest of the app works in
+decimal currency units and converts at the database boundary.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+_CENT = Decimal("0.01")
+
+
+def to_cents(amount: Any) -> int:
+    """Convert an amount in currency units (e.g. "-12.34") to cents."""
+    return int(
+        Decimal(str(amount)).quantize(_CENT, rounding=ROUND_HALF_UP).scaleb(2)
+    )
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert cents back to an amount with two decimal places."""
+    return Decimal(cents).scaleb(-2)
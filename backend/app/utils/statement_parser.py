@@ -0,0 +1,30 @@
+"""
+Statement file parsing entry point.
+
+Kept free of database and AI imports so it is cheap to load in the parse
+worker processes. The parsers themselves (pandas, pdfplumber) are imported
+on first use, so the API process that only submits jobs never loads them.
+"""
+
+from typing import Any, Dict
+
+
+def parse_statement_file(file_path: str, file_type: str) -> Dict[str, Any]:
+    """Parse CSV or PDF file."""
+    from app.utils.csv_parser import parse_csv_file, extract_statement_metadata
+    from app.utils.pdf_parser import parse_pdf_file
+
+    try:
+        if file_type == "csv":
+            # Parse CSV
+            transactions = parse_csv_file(file_path)
+            metadata = extract_statement_metadata(file_path)
+
+            return {"format_type": "csv", "transactions": transactions, **metadata}
+        else:
+            # Parse PDF
+            result = parse_pdf_file(file_path)
+            return result
+
+    except Exception as e:
+        return {"error": f"Failed to parse {file_type}: {str(e)}"}
@@ -0,0 +1,127 @@
+"""
+Background worker for statement processing.
+
+Statement parsing and AI extraction run here instead of inside the API
+process, so a slow PDF never holds up request handling.
+
+Run with:
+    arq app.worker.WorkerSettings
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from arq.connections import RedisSettings
+from tortoise import Tortoise
+
+from app.config import settings
+from app.database import TORTOISE_ORM
+from app.services.ai_service import llm_service
+from app.services.statement_processor import StatementProcessor, shutdown_parse_pool
+from app.services.sync_job_service import SyncJobService
+
+
+async def process_statement_job(
+    ctx: Dict[str, Any], file_path: str, file_type: str, job_id: str, user_id: str
+):
+    """Process an uploaded statement up to the account confirmation step."""
+    processor = ctx["processor"]
+    sync_job_service = ctx["sync_job_service"]
+
+    try:
+        result = await processor.process_statement(
+            file_path=file_path, file_type=file_type, job_id=job_id, user_id=user_id
+        )
+
+        # Update job in database
+        await sync_job_service.update_job(
+            job_id=job_id,
+            status=result["stage"],
+            stage=result["stage"],
+            progress={"percentage": result["progress"], "message": result["message"]},
+            error_message=result.get("error"),
+            metadata=result.get("metadata", {}),
+        )
+
+    except Exception as e:
+        # Update job with error status
+        await sync_job_service.update_job(
+            job_id=job_id,
+            status="failed",
+            stage="failed",
+            progress={"percentage": 0, "message": f"Processing failed: {str(e)}"},
+            error_message=str(e),
+        )
+
+
+async def continue_statement_job(
+    ctx: Dict[str, Any],
+    job_id: str,
+    confirmed_account_id: Optional[str],
+    create_new_account: bool,
+    new_account_data: Optional[Dict[str, Any]],
+):
+    """Resume statement processing after the user confirms the account."""
+    processor = ctx["processor"]
+    sync_job_service = ctx["sync_job_service"]
+
+    try:
+        result = await processor.continue_after_confirmation(
+            job_id=job_id,
+            confirmed_account_id=confirmed_account_id,
+            create_new_account=create_new_account,
+            new_account_data=new_account_data,
+        )
+
+        # Update job with result
+        await sync_job_service.update_job(
+            job_id=job_id,
+            status=result["stage"],
+            stage=result["stage"],
+            progress={
+                "percentage": result["progress"],
+                "message": result["message"],
+            },
+            error_message=result.get("error"),
+        )
+    except Exception as e:
+        # Update job with error
+        await sync_job_service.update_job(
+            job_id=job_id,
+            status="failed",
+            stage="failed",
+            progress={"percentage": 0, "message": f"Processing failed: {str(e)}"},
+            error_message=str(e),
+        )
+
+
+async def startup(ctx: Dict[str, Any]):
+    # Blocking helpers run in threads; the stock executor is too small for
+    # max_jobs
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=settings.THREAD_POOL_SIZE, thread_name_prefix="fins-worker"
+        )
+    )
+    await Tortoise.init(config=TORTOISE_ORM)
+    ctx["processor"] = StatementProcessor()
+    ctx["sync_job_service"] = SyncJobService(redis=ctx["redis"])
+    llm_service.redis = ctx["redis"]
+
+
+async def shutdown(ctx: Dict[str, Any]):
+    shutdown_parse_pool()
+    await llm_service.aclose()
+    await Tortoise.close_connections()
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [process_statement_job, continue_statement_job]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
+    max_jobs = settings.STATEMENT_WORKER_MAX_JOBS
+    job_timeout = settings.PROCESSING_TIMEOUT
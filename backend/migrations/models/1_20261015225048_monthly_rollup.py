@@ -0,0 +1,130 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "user_monthly_rollup" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "month" DATE NOT NULL,
+    "category" VARCHAR(100) NOT NULL,
+    "income" DECIMAL(15,2) NOT NULL DEFAULT 0,
+    "expense" DECIMAL(15,2) NOT NULL DEFAULT 0,
+    "transaction_count" INT NOT NULL DEFAULT 0,
+    "user_id" UUID NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_user_monthl_user_id_60cc27" UNIQUE ("user_id", "month", "category")
+);
+COMMENT ON TABLE "user_monthly_rollup" IS 'Income and expense totals per user, month and category.';
+        CREATE OR REPLACE FUNCTION "user_monthly_rollup_apply"() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO "user_monthly_rollup" ("user_id", "month", "category", "income", "expense", "transaction_count")
+        VALUES (
+            OLD."user_id",
+            date_trunc('month', OLD."transaction_date")::date,
+            COALESCE(OLD."category", 'Uncategorized'),
+            -GREATEST(OLD."amount", 0),
+            -GREATEST(-OLD."amount", 0),
+            -1
+        )
+        ON CONFLICT ("user_id", "month", "category") DO UPDATE SET
+            "income" = "user_monthly_rollup"."income" + EXCLUDED."income",
+            "expense" = "user_monthly_rollup"."expense" + EXCLUDED."expense",
+            "transaction_count" = "user_monthly_rollup"."transaction_count" + EXCLUDED."transaction_count";
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO "user_monthly_rollup" ("user_id", "month", "category", "income", "expense", "transaction_count")
+        VALUES (
+            NEW."user_id",
+            date_trunc('month', NEW."transaction_date")::date,
+            COALESCE(NEW."category", 'Uncategorized'),
+            GREATEST(NEW."amount", 0),
+            GREATEST(-NEW."amount", 0),
+            1
+        )
+        ON CONFLICT ("user_id", "month", "category") DO UPDATE SET
+            "income" = "user_monthly_rollup"."income" + EXCLUDED."income",
+            "expense" = "user_monthly_rollup"."expense" + EXCLUDED."expense",
+            "transaction_count" = "user_monthly_rollup"."transaction_count" + EXCLUDED."transaction_count";
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+        CREATE TRIGGER "transactions_user_monthly_rollup"
+    AFTER INSERT OR DELETE OR UPDATE OF "user_id", "transaction_date", "amount", "category"
+    ON "transactions"
+    FOR EACH ROW EXECUTE FUNCTION "user_monthly_rollup_apply"();
+        INSERT INTO "user_monthly_rollup" ("user_id", "month", "category", "income", "expense", "transaction_count")
+SELECT
+    "user_id",
+    date_trunc('month', "transaction_date")::date,
+    COALESCE("category", 'Uncategorized'),
+    SUM(GREATEST("amount", 0)),
+    SUM(GREATEST(-"amount", 0)),
+    COUNT(*)
+FROM "transactions"
+GROUP BY 1, 2, 3
+ON CONFLICT ("user_id", "month", "category") DO NOTHING;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "transactions_user_monthly_rollup" ON "transactions";
+        DROP FUNCTION IF EXISTS "user_monthly_rollup_apply"();
+        DROP TABLE IF EXISTS "user_monthly_rollup";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v6jgW/itRPnUktmppe9tdrUaiLZ1hpi9XlO6MpnOVaxID3gabSZz2sqP739c2SU"
+    "gcJxAgQFp/qYp9Hjt5fPxyzrGdv80xcaDrH7ZsmwSYmv8y/jYxGEP2j5zVMEwwmcwzeAIF"
+    "fVfIgpmQSAR9n3rA5oUNgOtDluRA3/bQhCKCufQlwC9GCDFEaYcc6BCbIREeFsgEGP0VQI"
+    "uSIaQj6DHJ5y8sGWEHfoN+9HPyYg0QdJ3U+yCHFyDSLTqdiLSnp871jZDk9fctm7jBGM+l"
+    "J1M6IjgWDwLkHHIMzxtCDD1AoZN4URy4bshJlDR7YpZAvQDGj+rMExw4AIHL6TL/PQiwzV"
+    "kyRE38z+mPZoZAXovEV5hkE8zJR7wp2Lt/n73V/J1Fqsmruvq51T04+fSDeEvi06EnMgUj"
+    "5ncBBBTMoILXOZFhq8xYyVB6NQKemlIZJ5HLHnwVWqOEOa9zrYuIjQhbjUVzDL5ZLsRDOm"
+    "I/z44KWP1PqyuIPTsSxBLWD2Yd5D7MaYoszm9CMVltiAbisUrQKcFWYjNUwZ2R2Tw7W4JN"
+    "JpVLp8hL8xnpmfi9gn5GuHrqZ7WUBuM+9CwX+PR0JWolfC2V9nQJfk9z2T2VubUDz4PYnp"
+    "bhM4nZnpqaT4/Xa8xGaRZPlmDxJJfFEzWL1OoDF2Bb0e+voY3GwC3iM4WWaHVm8MOwmL1U"
+    "0wJGr9tXnbvW7cHxWaMpSPX/chGFKZXNTEzgFSDxNiuyqsRrXk3bgw6ilovGiJZVVAmq2T"
+    "SRbzFrA70qtPOSEBcCnLN+SuIkHvsMWNUoGi/7N83e5cPDLX/osc9oEwmdnjR+Pt1dtrsH"
+    "xxK3nfuexCmfoC1/yrqsYwGVjjJOKBpDNbNZtKymIfww+qduitrr3LUfe627zym+r1u9Ns"
+    "9pitSplHrwSZrN4kKM3zq9nw3+0/jj4b4tm2SxXO8Pkz8TCCixMHmzgJN87Sg5Sko1KG8N"
+    "C3oe8bKN2YPfqLoh06iaLNaKmq39ey/VYtGC4uCu9fsPqVa7fbj/KRJPdKCr24dLqa+MIQ"
+    "VZUn95fLhXkxrJS3Q+Yfaezw6yacNwkU+/VLaKm3sZ+gFyKbMjD3m1FTkaOBHFnMv0SurP"
+    "C5A5Z9MgZ2WFsSmN3MC4tAuDj72D84Ddadi/ajJQhUNB4TgVTJwVGzaN1A2704YNHz7Rrj"
+    "4z+8t5YBOQTbphdzoBLfC6ct/14EXpdOVsZNm7IR5EQ/wrnAoOO+w5cuys0Jv/FBazt6zN"
+    "U+eK5YG32J+fVAv2euyl4GwRe9V6vGpdt01BYh/YL2/Ac6wcNlkN2AdiEvQVZkOIvvm1C1"
+    "2Q42ANCe3NS6oXr4In0iQJflLMZbPGzbGcAjAYiqfmdfOaoqCRM0bYVEWTREajMJbERSze"
+    "zEuGk0SZBgfMAkXGgHgGHUFDlGRMAFYFmJZGbTjk1ME5i23lUIdmkbekWoWdYr1Q05rz1J"
+    "DX8o/m8en56cXJp9MLJiKeJE45LxgEI3MzP8LEW6Ws9z6J2YxLtHIWK44rTYDvvxFPoYP5"
+    "LCYxHzz+kZmM8yeWKofSy8BhA49qLA1zCgfTvpBZNi4vhHMj8nKuYmB8jtcpNlORIfFEhM"
+    "IP+smfE+ghIjSMrVY8avE1uflFh/ErWFAWDbLJJlk67pRsxloOD8dHy4yzTCp3eBB56ZFW"
+    "UvBl2ZT7RT38a1vgE4yjLUdlok0xaO2gyH4ZjStFReaD7NJTf4yoZ89uLqOIzXw9bGa79X"
+    "x6yqoiS83p1SlUkSNqP1kt0sRWry1xBLFTmqEkZk1+9iq8oKDHI65LXqFnQcyfWNEhC2OU"
+    "KvgWQ5XqdeKexSqBC1l/oyO28hkRV8HwjUtAjs2twEr0Dji4Kn6PDi+qUcSHp8vbtvG5y2"
+    "aOx04Yf4m9wSIzzWq33brVYfXKVVWHrd5FdEMRttLhDVOHN3Yc3qjSC3U1s1PR/0Q4pBsI"
+    "GjMeKYVUo8g7ZafkLY8BlvX5d4w02BDgPN/VYvFCZ9YEUAo9PD+5EP5+BW6gXVfbd13J7b"
+    "G8d1tqx1oaulVECpL6nCE0f4NYBlgXRre9SUw7W7WzdU/5ZDUOkAPZusrybbbgKmVAq8Db"
+    "tKCPD48qGQQ2YUEHPltLWbbalZ27DUBCLd4PsDFnxBpaupH9ANL2c7b4WnnzeQKrt57veO"
+    "u5dnpop4d2eminR/2cHo9TbP9C+qbC0xFlNYrcG+L4zH9Jf0mfxmeP2ND3GaEGAxlc+oX/"
+    "yPFpLBbXl2Vsp4s3ClwVrGlKuymSmHoafhW4KDw4gDa1mDXxZnkBVk48BZ4fNbyWVmAlNz"
+    "ywSYYGir3wBQZ1jNA6GnM4LNXRY0At9bCKTk740KpQw/zjlEnMBo5U7pWtV8nZSbE/aSV7"
+    "LI3UhvWuDWsynvCV8kqmtYTVjbnjxhSn7K0xG8iUc0h+CCYDrMlcoo/p62P62vW3h8OVdv"
+    "1p19+Hd/0lj3Ur3H/Sqe98F6B80HyxF/AGYdbmCLhGApvnA1wkvNgD+Jx8xPAoXsN4jm5s"
+    "FC+jFIg0OJurnYpVOxUznCtnVzWtKux7P6TC6S1NVAr0zo+p6AN361/qqK9x3cA1rslnyh"
+    "CZbwRLsLo4pLdvA3v2CKxwNXYGWBMnwxYCJzvZ2blrJvXGzhrwScGwVCQlkt8njxevsE4e"
+    "L+RbHuTTOn+oDPeLDk6moPqcr3SUOiLHGnokmJR0P6nRa1iXe7WkX2hL7t92773ibxPbvQ"
+    "Gy4jNmpQ/6Z8G6+8u76aFnvUIPsXrKspvBanLT5GJCoWKtkG9wxYCaLLd0tFFHG3W0sa7R"
+    "Rn0p+Hto2Myl4NFXwcqt5NOojxJL1tH3DUbfE8HNNQPwia+j7i13C2Pw6R6lDsPL+rcB7v"
+    "TmhYo2LwhiFbsWIsLztyuUuHWdF7boI745Mvpc0rbmjPwtBHAMkFvGzR4D6ni5eiWRn+iu"
+    "dGsE/FEZKjPAusQrt0DqgFVcOjyZAtXEI7GN0KQ2iN+D3aQN4nfasPFneJb8zETGgFnz20"
+    "W1NF5SHSHxeYvVaZh/R6OmLORdo7g6JeqLHGtKT+oahtU5SVz5UFMi9FfP0nyMCaYjd2rx"
+    "W9aDyZqUcFv3blZgV5RXM2KqdkikucnxTmQILHZVWOkWXM5x0cE2GUMDYMeA3yYQ+9CghD"
+    "JZYwI98UG4hiHKFSLR1rKsc2PFcv7Ef+IuefMN4EHjzUOUQmz0p+LTc1+/JruopXjFr19Z"
+    "a6HhkNVAWEEclIQYgp6GgeErkwhLZRy6yBbqu/iqW1Ed/yfeU7fW9baXaPiOPnj3z2bz5O"
+    "S8eXTy6eLs9Pz87OIovukum1V05d1l5ycehE8tMxd/Fi9um2WPMMSA937AQ1+vurFdo0gM"
+    "awotKzoKMgft5ihIRZeArnIOJJwLShKYQH14BpMn1MrenqrEfsg7VHWQWB/RftdRzhb0kD"
+    "0yFZZEmFNoPoC5zCKLIZ9Q/WnorX8amtk1vvJwYP5CLwGp5zqvkuAQ7xolSAzF60lgVffm"
+    "M9NdsTjJ3+WbgOxqo29lE+3GtvSWCIhsfnr5/n8JXCCb"
+)
@@ -0,0 +1,70 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_transaction_user_id_b701d8";
+        CREATE INDEX IF NOT EXISTS "idx_transaction_user_id_b963ef" ON "transactions" ("user_id", "transaction_date", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_transaction_user_id_b963ef";
+        CREATE INDEX IF NOT EXISTS "idx_transaction_user_id_b701d8" ON "transactions" ("user_id", "transaction_date");"""
+
+
+MODELS_STATE = (
+    "eJztXWtv6jga/itRPnUktmppe9pdrUaiLZ1hppcjSndG0znKMYkBb4PNJE572NH572ubJC"
+    "SOEwgQIK2/VMX2k8vj15f3eW3nb3NMHOj6hy3bJgGm5r+Mv00MxpD9I2c1DBNMJvMMnkBB"
+    "3xVlwayQSAR9n3rA5hcbANeHLMmBvu2hCUUE89KXAL8YIcQQVzvkQIfYDInwsKBMgNFfAb"
+    "QoGUI6gh4r+fyFJSPswG/Qj35OXqwBgq6Teh/k8AuIdItOJyLt6alzfSNK8vv3LZu4wRjP"
+    "S0+mdERwXDwIkHPIMTxvCDH0AIVO4kVx4LohJ1HS7IlZAvUCGD+qM09w4AAELqfL/PcgwD"
+    "ZnyRB34n9OfzQzBPK7SHyFSTbBnHzEq4K9+/fZW83fWaSa/FZXP7e6ByeffhBvSXw69ESm"
+    "YMT8LoCAghlU8DonMqyVGSsZSq9GwFNTKuMkctmDr0JrlDDndW51EbERYauxaI7BN8uFeE"
+    "hH7OfZUQGr/2l1BbFnR4JYwtrBrIHchzlNkcX5TRgmuxuigXisEnRKsJXYDE1wZ2Q2z86W"
+    "YJOVyqVT5KX5jOxM/F7BPiNcPe2zWkqDcR96lgt8eroStRK+lkZ7ugS/p7nsnsrc2oHnQW"
+    "xPy/CZxGzPTM2nx+s1RqM0iydLsHiSy+KJmkVq9YELsK1o99fQRmPgFvGZQku0OjP4YXiZ"
+    "vTTTAkav21edu9btwfFZoylI9f9yEYUpk80MTOAVIPE2K7KqxGteTduDDqKWi8aIljVUCa"
+    "rZNJFvMW8DvSqs85IQFwKcM39K4iQe+wxYVS8aT/s3zd7lw8Mtf+ixz2gTCZ2e1H8+3V22"
+    "uwfHEred+57EKR+gLX/KmqxjAZWNMk4oGkM1s1m0bKYh/DD6p26G2uvctR97rbvPKb6vW7"
+    "02z2mK1KmUevBJGs3iixi/dXo/G/yn8cfDfVt2yeJyvT9M/kwgoMTC5M0CTvK1o+QoKVWh"
+    "vDYs6HnEy1ZmD36j6opMo2oyWSuqtvbvvVSNRROKg7vW7z+kau324f6nqHiiAV3dPlxKbW"
+    "UMKciS+svjw72a1Ki8ROcTZu/57CCbNgwX+fRLZbO4ucrQD5BLmR95yG9bkdDAiSjmXKZX"
+    "Mn9+AZlzNgxyVlbom9LIDfRLu3D42Ds4D9idhu2rJh1V2BUU9lPBxFmxYtNIXbE7rdjw4R"
+    "P16jO3v5wCm4BsUobd6QC0QHXl2vXgRSm6cjay7N0QD6Ih/hVOBYcd9hw5flao5j+Fl9lb"
+    "1uapc8PywFus5yfNgr0eeyk4m8RetR6vWtdtU5DYB/bLG/AcK4dNdgfsAzEI+gq3IUTf/N"
+    "qFLsgRWENCe/Mr1YtXwRNpkgQ/KeayWePmWE4BGAzFU/N78ztFQSNnjLCpiiaJjEZhLIkX"
+    "sXg1LxlOEtc0OGAWKDIGxDPoCBriSsYEYFWAaWnUhkNOHZwz2VZ2dWgWeUuaVdgo1gs1rT"
+    "lODfld/tE8Pj0/vTj5dHrBiogniVPOCzrByN3MjzDxWimr3icxm5FEK2ex4rjSBPj+G/EU"
+    "NpjPYhLzweMfmcE4f2Cpsiu9DBzW8aj60jCnsDPtizLLxuVF4dyIvJyr6Bif43mKzUxkSD"
+    "wRofCDfvLnBHqICAtjsxWPWnxObn7RYfwKJpRFnWyySpaOOyWrsZbdw/HRMv0sK5XbPYi8"
+    "dE8rGfiybMrtoh762hb4BONoyVGZaFMMWjsosl9O40pRkXknu/TQHyPq2bKbyxhiM98Om9"
+    "lmPR+esqbIUnNadQpVJETtJ6tFltjqtSWOIHZKM5TErMnPXoUXFPR4xHXJK/QsiPkTKxpk"
+    "YYxSBd9iqFI9T9yzWCVwIWtvdMRmPiPiKhi+cQnI8bkVWIneAQdXxe/R4UU1hvjwdHnbNj"
+    "532cjx2AnjL7EaLDLTrHbbrVsdVq/cVHXY6l1ENxRhKx3eMHV4Y8fhjSpVqKuZn4r+J8Ih"
+    "3UDQmFGkFKUaReqUnSpveQywrObfMdJgQ4DztKvFxQvFrAmgFHp4vnMh/P0K3EBLV9uXru"
+    "T6WF7dluqxlo5uFZGCpD1nCM1fIJYB1oXRbS8S02KrFlv3lE92xwFyIJtXWb7NJlylHGgV"
+    "eJse9PHhUSWdwCY86MBncynLVkvZucsAJNTi9QAbEyPWsNKNrAeQlp+zydfKi88TWL30fM"
+    "dLz7XooUUPLXpo0aN+osfjFNu/kL6pUDqirEaRvCG2z/yX9JfUND57xIa+zwg1GMjgpV/4"
+    "jxxNY3FxfVjGdpp4o0CqYFVTWqZIYurp+FUgUXhwAG1qMW/izfICrBx4CpQfNbyWXmAlJz"
+    "ywQYYGirXwBQ51jNA2GnM4LNXQY0At7bCKRk5416oww/ztlEnMBrZU7pWvV8neSbE+aSV/"
+    "LI3UjvWuHWsynvCZ8kqutYTVlbnjyhS77K0x68iUY0h+CCYDrMlYorfp6236Wvrbw+5KS3"
+    "9a+vvw0l9yW7dC/pN2fedLgPJG88Uq4A3CrM4RcI0ENk8DXFR4sQL4nHzEcCtew3iOTmwU"
+    "L6MsEFlwJrch9MAvWlqsWlpUMb/sFgwV9r1vVeH0liYqBXrnm1X0trv1j3bUh7lu4DDX5D"
+    "NliMx3hSVYXWTp7XvCnj0CKxyQnQHWRGrYQvhkJ+s7d82kXt5ZAz4pGJaKp0Tl90n34jes"
+    "k+6FfMuDfFjnD5XhftH2yRRU7/aVNlRH5FhDjwSTkiKUGr2Gd7lXU/qFvuT+LfreK/42se"
+    "gbICveaVZ6u38WrJu/vKYeetYr9BC7T1l2M1hNbppcTChUzBXyHa4YUJPplo456pijjjnW"
+    "NeaojwZ/DxWbORo8+jZYuZl8GvVRIso6Br/BGHwixLlmGD7xjdS95W5hJD7dotTBeNn+Ns"
+    "CdXsJQ0RIGQaxi7UJEeP6ihRJnr/OLLfqUb04ZvTtpW2NG/hICOAbILSOzx4A6HrFeSeQn"
+    "OjHdGgF/VIbKDLAu8cotkDpgNy4dnkyBaqJIbCM0qR3i9+A3aYf4nVZs/DGeJT82kXFg1v"
+    "yCUS2dl1RDSHzkYnUa5l/TqCkLeYcprk6J+jjHmtKTOoxhdU4SBz/UlAj97bM0H2OC6cid"
+    "Wvys9WCyJiXc172bXbArrlczYqoWJNLc5KgTGQKLpQorXYPLCRcdbJMxNAB2DPhtArEPDU"
+    "ooK2tMoCc+C9cwxHVFkWhpWVbcWPE6f+I/cZe8+QbwoPHmIUohNvpT8QG6r1+TTdRSvOLX"
+    "r6y20HDI7kDYhTgoCTEEPQ0Dw1dWIrwq49BFtjDfxQfeitvxf+I1dWsdcnuJhu/os3f/bD"
+    "ZPTs6bRyefLs5Oz8/PLo7i8+6yWUUH3112fuJB+NQ0c/HH8eK6WXYLQwx47xs89CGrG1s1"
+    "ikS3prCyoq0gc9ButoJUdBToKvtAwrGgJIEJ1IdnMLlDrewZqkrshzxJVQeJ9Ubtdx3lbE"
+    "EP2SNT4UmEOYXuA5iXWeQx5BOqPxC99Q9EM7/GV24OzJ/oJSD1nOdVEhziTaMEiWHxehJY"
+    "1en5zHVXTE7yV/kmILta6FvZQLuxJb0lAiKbH16+/x8VQyH4"
+)
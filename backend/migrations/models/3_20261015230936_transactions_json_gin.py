@@ -0,0 +1,71 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_transactions_tags_gin" ON "transactions" USING GIN ("tags");
+        CREATE INDEX IF NOT EXISTS "idx_transactions_meta_gin" ON "transactions" USING GIN ("meta" jsonb_path_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_transactions_meta_gin";
+        DROP INDEX IF EXISTS "idx_transactions_tags_gin";"""
+
+
+MODELS_STATE = (
+    "eJztXW1P6zgW/itRPjFSF0GBC7NarVSg3OkML1dQdkfDXOW6idt6SZ1exwE6o/vf13aTNH"
+    "GctGmbtgF/QdT2YyePj1/OOT7O3+bIc6Dr77ds2wswNf9p/G1iMILsHzmrYZhgPJ5l8AQK"
+    "eq4oC6aFRCLo+ZQAm1fWB64PWZIDfZugMUUe5qXPAX42QoghatvnQMezGRLhQUGZAKPvAb"
+    "SoN4B0CAkr+fSVJSPswDfoRz/Hz1YfQddJvQ9yeAUi3aKTsUh7fOxcXomSvP2eZXtuMMKz"
+    "0uMJHXo4Lh4EyNnnGJ43gBgSQKGTeFEcuG7ISZQ0fWKWQEkA40d1ZgkO7IPA5XSZ/+oH2O"
+    "YsGaIl/uf432aGQN6KxFeYZHuYk494V7B3/zF9q9k7i1STN3XxS+t+7+jTT+ItPZ8OiMgU"
+    "jJg/BBBQMIUKXmdEhr0yZSVD6cUQEDWlMk4ilz34MrRGCTNeZ1IXERsRthyL5gi8WS7EAz"
+    "pkP08OClj9T+teEHtyIIj12DiYDpDbMKcpsji/CcFkrSEaiMcqQacEW4rNUAS3Rmbz5GQB"
+    "NlmpXDpFXprPSM7E7yXkM8LVUz6rpTQY9SCxXODT46WolfC1FNrjBfg9zmX3WObWDgiB2J"
+    "6U4TOJ2ZyYmo8PlyusRmkWjxZg8SiXxSM1i9TqARdgWzHuL6GNRsAt4jOFlmh1pvD9sJqd"
+    "FNMCRi/bF52b1vXe4UmjKUj1v7uIwpTIZhYm8AKQeJslWVXiNa+mTaCDqOWiEaJlBVWCaj"
+    "ZN5FtM20AvCuk89zwXApyzf0riJB57DFjVLBpv+9fN3vnd3TV/6JHPaBMJna40fz7enLfv"
+    "9w4lbju3XYlTvkBb/oQNWccCKhllnFA0gmpms2hZTEP4fvRP3QS127lpP3RbN19SfF+2um"
+    "2e0xSpEyl175O0msWVGP/tdH8x+E/jj7vbtqySxeW6f5j8mUBAPQt7rxZwkq8dJUdJqQ7l"
+    "vWFBQjyS7cwufKPqjkyjarJZK+q29u/dVI9FG4q9m9bvP6V67fru9nNUPDGALq7vzqWxMo"
+    "IUZEn99eHuVk1qVF6i8xGz93xykE0bhot8+rWyXdzMytALkEuZHrnPm63I0MCJKOZcplcS"
+    "f16BzDlbBjkrS8xNaeQa5qVtKHzsHZw77E7C8VWTiSqcCgrnqWDsLNmxaaTu2K12bPjwiX"
+    "71mdpfzgKbgKzTDLvVBWiO1ZXbrvvPSqMrZyPL3pVHIBrg3+BEcNhhz5GjZ4XW/Mewmp1l"
+    "bZY6EywCXmN7flIs2Ouxl4LTTexF6+Giddk2BYk9YD+/AuJYOWyyFrAPxCLoK9SGEH312z"
+    "10QY6BNSS0O6upXrwKnryml+AnxVw2a9QcySkAg4F4at42bylyGjkjhE2VN0lkNAp9SbyI"
+    "xbt5QXeSqNPggKmjyOh7xKBDaIiajDHAKgfTwqg1u5w6OGezrZzq0NTzlhSrcFCs5mpacZ"
+    "0a8Fb+0Tw8Pj0+O/p0fMaKiCeJU04LJsFI3cz3MPFeKWu9T2LWYxKtnMWK/Upj4PuvHlHI"
+    "YD6LScwH939kFuP8haXKqfQ8cNjEo5pLw5zCybQnyizqlxeFcz3ycq5iYnyK9yk2E5GBR4"
+    "SHwg96yZ9jSJAnJIztVgi1+J7c/Krd+BVsKIsm2WSXLOx3SnZjLaeHw4NF5llWKnd6EHnp"
+    "mVYS8EXZlMdFPexrG+ATjKIjR2W8TTFoZafIbimNS3lFZpPswkt/jKjnyG4uIojNfDlsZo"
+    "f1bHnKiiJLzRnVKVSRIWo3WS2SxFa3LXEEsVOaoSRmRX52yr2goId4ruu9QGJBzJ9YMSAL"
+    "fZQq+AZdlep94o75KoEL2XijQ7bzGXquguEr1wM5OrcCK9Hb5+Cq+D3YP6tGEO8ez6/bxp"
+    "d7tnI8dEL/S2wNFplpVu/brWvtVq9cVLXb6l14NxRuK+3eMLV7Y8vujSqtUBdTPRX9Jdwh"
+    "94GgMWORUpRqFFmn7FR5izDAojb/jpEGGwKcZ7uaX7zQmDUGlEKCZ5EL4e8X4AbadLV505"
+    "XcH4tbt6V+rKWiW4WnICnPGULzD4hlgHVhdNOHxLSxVRtbd5RP1mIfOZDtqyzfZhuuUgq0"
+    "CrxJDfpw/6CSSWAdGnTgs72UZatN2bnHACTU/PMAazNGrCClazkPIB0/Z5uvpQ+fJ7D66P"
+    "mWj55ro4c2emijhzZ61M/o8TDB9q9ez1RYOqKsRpF5Q4TP/M/rLWjT+EI8G/o+I9RgIIOX"
+    "fuY/cmwa84vryzI2M8QbBaYK1jWlzRRJTD0VvwpMFAT2oU0tpk28WiTAyoWnwPKjhtdSC6"
+    "zkhge2yNBAcRa+QKGOEVpGYw4HpQZ6DKilHFYxyD0+tSrEMD+cMolZQ0jlTul6lcROivNJ"
+    "S+ljaaRWrLetWHujMd8pL6VaS1jdmVvuTBFlb43YRKZcQ/JdMBlgTdYSHaavw/S16W8Hpy"
+    "tt+tOmvw9v+kuGdSvMf1LUd74JUA40n28FvEKY9TkCrpHA5tkA5xWebwF8Sj5iGIrXMJ6i"
+    "GxvFyygLRBKcyW0Ie+BXPl3MyGaMDHyeaMK3MVfXBCHh48yMjm9WkjCLg6zBNGA8kvzPHb"
+    "FOsf0QAfy3+UNqSSzcZVvioPktaXNp1eZSlTQtGlaiwr738BtOb2miUqB3HoCjQwlXv65S"
+    "X1C7hgtqk8+UITJfvZdgdTG1b167J/YQLHHpdwZYE/PJBlxCWzmzum0m9ZHVGvAplIkMkf"
+    "m2vKj8LtnyeIN1suUh3yKQL+v8oTLczwsJTUF1BLMUJB6RYw2IF4xLGtbU6BW0y53a0s/V"
+    "JXfvIPtO8beOg+wAWXH0XOkrDLJgPfzlOAFIrBdIEGunLLsZrCY3TS72KFTsFfIVrhhQk+"
+    "2W9qNqP6r2o9bVj6qvO38PHZu57jz63lm5nXwa9VG85PpcwRrPFSTctiseLUh893VnuZt7"
+    "uiA9otQHDGT5WwN3+lhGRccyBLGK8xgR4fkHMUrcJ88rm/d54pwyOuJqU2tG/hECOALILW"
+    "NmjwF1vDa+Es9PdAu8NQT+sAyVGWBd/JUbILXPGi7tnkyBamKR2IRrUivE70Fv0grxO+3Y"
+    "+ANDC35AI6PArPhVploqL6mBkPhwx/I0zL4QUlMW8i6IXJ4S9RWVNaUndcHE8pwkLrOoKR"
+    "H6e25pPkYepkN3YvH744PxipRwXfdmWuG9qK9mxFRtkEhzk2OdyBBYbKqw0j24mOGig21v"
+    "BA2AHQO+jSH2oUE9ysoaY0jEp+4ahqhXFImOlmWNG0vW8yf+E997r74BCDReCaIUYqM3ER"
+    "/V+/YtFW6heMVv31hvocGAteCxijgoCTEEPQ0DwxdWIqyVcegiW4jv/Et8RXP8n/hM3UoX"
+    "956jwTv6lN/PzebR0Wnz4OjT2cnx6enJ2UF8h182q+gyv/POZ+6ET20z53/wL+6bRUMYYs"
+    "B7D/DQF8eu7dQoEtOaQsqKQkFmoO2EglR0vekycSDhWlCSwATqwzOYjFArey+sEvshb4fV"
+    "TmIdfP6uvZwtSJA9NBWaRJhTqD6AWZl5GkM+ofqj1xv/6DXTa3xlcGD+Ri8Bqec+rxLnEB"
+    "8aJUgMi9eTwKq+CMBUd8XmJP+UbwKyrYO+lS20azvSW8Ihsv7l5cf/AUIfZWg="
+)
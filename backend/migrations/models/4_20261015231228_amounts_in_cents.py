@@ -0,0 +1,74 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "transactions" ALTER COLUMN "amount" TYPE BIGINT USING ("amount" * 100)::BIGINT;
+        ALTER TABLE "user_monthly_rollup" ALTER COLUMN "income" TYPE BIGINT USING ("income" * 100)::BIGINT;
+        ALTER TABLE "user_monthly_rollup" ALTER COLUMN "expense" TYPE BIGINT USING ("expense" * 100)::BIGINT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "transactions" ALTER COLUMN "amount" TYPE DECIMAL(15,2) USING ("amount" / 100.0)::DECIMAL(15,2);
+        ALTER TABLE "user_monthly_rollup" ALTER COLUMN "income" TYPE DECIMAL(15,2) USING ("income" / 100.0)::DECIMAL(15,2);
+        ALTER TABLE "user_monthly_rollup" ALTER COLUMN "expense" TYPE DECIMAL(15,2) USING ("expense" / 100.0)::DECIMAL(15,2);"""
+
+
+MODELS_STATE = (
+    "eJztXWtv6jga/itRPnUktmppe9pdrVaiLT3DTC9HlO6OpnOUYxID3gaHcZK27Oj897VNEh"
+    "LHDgQIkB5/qYrtx04ev768Fzt/mWPPga5/2LJtL8SB+Q/jLxODMaT/iFkNwwSTyTyDJQSg"
+    "7/KyYFaIJ4K+HxBgs8oGwPUhTXKgbxM0CZCHWelLgF+MCGLw2g4Z0PFsikR4WFAmxOjPEF"
+    "qBN4TBCBJa8vkrTUbYge/Qj39OXqwBgq6TeR/ksAp4uhVMJzzt6alzfcNLsvb7lu254RjP"
+    "S0+mwcjDSfEwRM4hw7C8IcSQgAA6qRfFoetGnMRJsyemCQEJYfKozjzBgQMQuowu85+DEN"
+    "uMJYO3xP6c/svMEchaEfiKkmwPM/IR6wr67t9nbzV/Z55qsqaufm51D04+/cTf0vODIeGZ"
+    "nBHzOweCAMygnNc5kVGvzFjJUXo1AkROqYgTyKUPvgqtccKc17nUxcTGhK3GojkG75YL8T"
+    "AY0Z9nRwWs/rvV5cSeHXFiPToOZgPkPspp8izGb0owaWsoCPljlaBTgK3EZiSCOyOzeXa2"
+    "BJu0lJJOnpflM5Yz/nsF+Yxx9ZTPaikNx31ILBf4welK1Ar4Wgrt6RL8nirZPRW5tUNCIL"
+    "anZfhMY7YnpubT4/Uaq1GWxZMlWDxRsngiZzGw+sAF2JaM+2toozFwi/jMoAVanRn8MKpm"
+    "L8W0gNHr9lXnrnV7cHzWaHJS/T9dFMCMyOYWJvAKEH+bFVmV4jWvpk2ggwLLRWMUlBVUAa"
+    "rZNJFvUW0DvUqk89LzXAiwYv+Uxgk89imwqlk02fZvmr3Lh4db9tBjn9LGEzo9Yf58urts"
+    "dw+OBW479z2BU7ZAW/6UDlnHAjIZpZwEaAzlzObRophG8MP4n7oJaq9z137ste6+ZPi+bv"
+    "XaLKfJU6dC6sEnYTVLKjH+0+n9bLCfxu8P921RJUvK9X432TOBMPAs7L1ZwEm/dpwcJ2U6"
+    "lPWGBQnxSL4ze/A9kHdkFlWTzVpRt7V/62V6LN5QHNy1fvsp02u3D/ef4+KpAXR1+3ApjJ"
+    "UxDECe1F8eH+7lpMblBTqfMH3PZwfZQcNwkR98rWwXN7cy9EPkBlSPPGTNVmRoYEQUcy7S"
+    "K4g/q0DknC6DjJUV5qYscgPz0i4UPvoOzgN2p9H4qslEFU0FhfNUOHFW7NgsUnfsTjs2ev"
+    "hUv/pU7S9ngU1BNmmG3ekCtMDqymzXgxep0ZWxkWfvxiMQDfGvcMo57NDnUOhZkTX/Kapm"
+    "b1mbp84Fi4C3xJ6fFgv6evSl4GwTe9V6vGpdt01OYh/YL2+AOJaCTdoC9gFfBH2J2hChb3"
+    "7tQhcoDKwRob15TfXilfPkNb0UPxnm8lnj5lhMARgM+VOztllLsdPIGSNsyrxJPKNR6Eti"
+    "RSzWzUu6k3idBgPMHEXGwCNGMIIGr8mYACxzMC2N2rDLqYMVm23pVIdmnre0WEWDYj1X05"
+    "rr1JC18rfm8en56cXJp9MLWoQ/SZJyXjAJxuqm2sPEeqWs9T6N2YxJtHIWK/YrTYDvv3lE"
+    "IoNqFtOYH9z/kVuM1QtLlVPpZejQiUc2l0Y5hZNpn5dZ1i/PCys98mKuZGJ8TvYpNhWRoU"
+    "e4h8IP++mfE0iQxyWM7lZIYLE9uflVu/Er2FAWTbLpLlna75TuxlpOD8dHy8yztJRyeuB5"
+    "2ZlWEPBl2RTHRT3sa1vgE4zjkKMy3qYEtLZTZL+UxpW8IvNJdumlP0HUc2Q3lxHEploOm/"
+    "lhPV+e8qJIUxWjOoMqMkTtJ6tFktjqtQWOIHZKM5TGrMnPXrkXJPQQz3W9V0gsiNkTSwZk"
+    "oY9SBt+iq1K+T9wzXyVwIR1vwYjufEaeK2H4xvWAQueWYAV6BwxcFb9HhxfVCOLD0+Vt2/"
+    "jSpSvHYyfyvyTWYJ6ZZbXbbt1qt3rloqrdVh/CuyFxW2n3hqndGzt2b1Rphbqa6anof9wd"
+    "0g05jTmLlKRUo8g6ZWfKW4QClrX5d4ws2OBgle1qcfFCY9YEBAEkeH5yIfr9CtxQm662b7"
+    "oS+2N567bQj7VUdKvwFKTlOUeoOkAsB6wLo9sOEtPGVm1s3VM+aYsD5EC6r7J8m264SinQ"
+    "MvA2Nejjw6NKJoFNaNChT/dSli03ZSvDAATU4niAjRkj1pDSjcQDCOHndPO1cvB5CqtDz3"
+    "cceq6NHtrooY0e2uhRP6PH4xTbv3h9U2LpiLMaReYNfnzmv15/SZvGF+LZ0PcpoQYFGaz0"
+    "C/uhsGksLq4vy9jOEG8UmCpo15Q2U6Qx9VT8KjBREDiAdmBRbeLNIiGWLjwFlh85vJZaYC"
+    "U3PNBFJgglsfAFCnWC0DKacDgsNdATQC3lsIpB7rGpVSKG6uOUacwGjlTula5XydlJHp+0"
+    "kj6WRWrFeteKtTeesJ3ySqq1gNWduePO5KfsrTGdyKRriNoFkwPWZC3Rx/T1MX1t+tvD6U"
+    "qb/rTp74c3/aWPdUvMf8Kpb7UJUDxovtgKeIMw7XMEXCOFVdkAFxVebAF8Tj9idBSvYTzH"
+    "Nzbyl5EWiCU4l9vg9sCvbLqYk00ZGfos0YTvE6aucUKix5kbHd+tNGEWA1nD2YHxWPI/d/"
+    "g6RfdDBLDf5nehJb5wl22JgRa3pM2lVZtLZdK07LESGfajH79h9JYmKgP64AdwVEcJL9FQ"
+    "GYKhPElYYfTFmlvNWQDG35vNk5Pz5tHJp4uz0/Pzs4ujJBIjn1UUknHZ+cyiMjLbS8lxBn"
+    "1z7QZurk0/U45Itd4vwOpig9++2k/sEVjhNvAcsCZ2lS34inYSzLprJnUsaw345FpGjki1"
+    "kS8uv09GPtZgnYx8yLcIZMs6e6j8PmvBWdEMVB9tFk6Px+RYQ+KFk5IWNzl6DbVzr/b6C5"
+    "XM/Ytw3yv+NhHhDpCVHKsrfbdBHqyHv3iAABLrFRJE2ynLbg6ryc2Si70ASvYKaoUrAdRk"
+    "u6UdrNrBqh2sdXWw6nvQP0LH5u5Bjz+EVm4nn0X9KO5zHXCwwYCDlD93zZiD1Adh95a7hW"
+    "EH2REljzwQ5W8D3Ol4jYriNTixkkCNmHB1hEaJi+ZZZYu+W6woo49ibWvNUMcWwDFAbhkz"
+    "ewKo433ylXh+4uvhrRHwR2WozAHr4q/cAqkD2nBp92QGVBOLxDZck1oh/gh6k1aIP2jHJl"
+    "8eWvLLGjkFZs3PNdVSeckMhNQXPVanYf7pkJqyoLo5cnVK5HdX1pSezM0Tq3OSuuWipkTo"
+    "D71l+Rh7OBi5U4tdLB9O1qSE6bp3swq7vL6aEVO1QSLLjcI6kSOw2FRhZXtwOcNFB9veGB"
+    "oAOwZ8n0DsQyPwAlrWmEDCv4HXMHi9vEgcWpY3bqxYzx/4D9z13nwDEGi8ERQEEBv9Kf/a"
+    "3rdvmXMYklf89o32FhoOaQserYiB0hCD09MwMHylJaJaKYcusrn4Lr7dlzfH/kli6ta60b"
+    "cosrx+3/jbSki52maT9M2yZxsSwEc/+aFvlN1Y1Cji01rJkZxg6nRD55YPiESLRDlmUyBN"
+    "rZLa9GG3slfMSrF14npjF81qt7I+x/6h/aItSJA9MiW6R5RTqHCAeZlFOoaaUP397K1/P5"
+    "tqQr70OKF6a5iC1HNnWIk7iQ2NEiRGxetJYFUfF6DKvmRzoo4LTkF2FRpc2UK7sSDgEi6U"
+    "zS8v3/8Ph61uvA=="
+)
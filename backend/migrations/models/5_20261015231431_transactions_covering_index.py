@@ -0,0 +1,74 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_tx_user_date_covering" ON "transactions" ("user_id", "transaction_date", "id") INCLUDE ("amount", "category", "merchant_name", "account_id");
+        DROP INDEX IF EXISTS "idx_transaction_user_id_b963ef";
+        DROP INDEX IF EXISTS "idx_transaction_transac_8db3ee";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_tx_user_date_covering";
+        CREATE INDEX IF NOT EXISTS "idx_transaction_transac_8db3ee" ON "transactions" ("transaction_date");
+        CREATE INDEX IF NOT EXISTS "idx_transaction_user_id_b963ef" ON "transactions" ("user_id", "transaction_date", "id");"""
+
+
+MODELS_STATE = (
+    "eJztXe1v4jge/leifOpKXNXSdqZ3Op1EWzrLbl9GLb1b7ewoYxIDvgaHTZy23Gr+97NNXh"
+    "07ECBAOv5SFduPnTz++eX3Yucvc+I50A0OO7bthZiY/zD+MjGYQPqPmNUyTDCdphksgYCB"
+    "y8uCeSGeCAYB8YHNKhsCN4A0yYGB7aMpQR5mpS8AfjYiiMFrO2RAx7MpEuFRSZkQoz9DaB"
+    "FvBMkY+rTkl680GWEHvsEg/jl9toYIuk7ufZDDKuDpFplNedrTU+/qmpdk7Q8s23PDCU5L"
+    "T2dk7OGkeBgi55BhWN4IYugDAp3Mi+LQdSNO4qT5E9ME4ocweVQnTXDgEIQuo8v85zDENm"
+    "PJ4C2xP6f/MgsEslYEvqIk28OMfMS6gr779/lbpe/MU03W1OXPnYeDkw8/8bf0AjLyeSZn"
+    "xPzOgYCAOZTzmhIZ9cqclQKll2PgyykVcQK59MFXoTVOSHlNpS4mNiZsNRbNCXizXIhHZE"
+    "x/nh2VsPrvzgMn9uyIE+vRcTAfIHdRTptnMX4zgklbQyTkj1WBTgG2EpuRCO6MzPbZ2RJs"
+    "0lJKOnlens9YzvjvFeQzxjVTPuulNJwMoG+5ICCnK1Er4BsptKdL8HuqZPdU5NYOfR9ie1"
+    "aFzyxme2JqPj1erbEa5Vk8WYLFEyWLJ3IWiTUALsC2ZNxfQRtNgFvGZw4t0OrM4YdRNXsp"
+    "piWMXnUve7edm4Pjs1abkxr86SICcyJbWJjAC0D8bVZkVYrXvJq2Dx1ELBdNEKkqqAJUs2"
+    "miwKLaBnqRSOeF57kQYMX+KYsTeBxQYF2zaLLt3zR7F/f3N+yhJwGljSf0+sL8+XR70X04"
+    "OBa47d31BU7ZAm0FMzpkHQvIZJRyQtAEypktokUxjeCH8T9NE9R+77b72O/cfs7xfdXpd1"
+    "lOm6fOhNSDD8JqllRi/KfX/9lgP43f7++6okqWlOv/brJnAiHxLOy9WsDJvnacHCflOpT1"
+    "hgV93/OLndmHb0TekXlUQzZrZd3W/a2f67F4Q3Fw2/ntp1yv3dzffYqLZwbQ5c39hTBWJp"
+    "CAIqm/PN7fyUmNywt0PmH6nl8cZJOW4aKAfK1tF5daGQYhcgnVIw9ZszUZGhgR5ZyL9Ari"
+    "zyoQOafLIGNlhbkpj9zAvLQLhY++g3OP3Vk0vhoyUUVTQek8FU6dFTs2j9Qdu9OOjR4+06"
+    "8BVfurWWAzkE2aYXe6AC2wujLb9fBZanRlbBTZu/Z8iEb4VzjjHPbocyj0rMia/xRVs7es"
+    "pampYPngNbHnZ8WCvh59KTjfxF52Hi87V12TkzgA9vMr8B1LwSZtAQeAL4KBRG2I0Ne/Pk"
+    "AXKAysEaH9tKZm8cp58tpehp8cc8WsSXsipgAMRvypWduspdhp5EwQNmXeJJ7RKvUlsSIW"
+    "6+Yl3Um8ToMB5o4iY+j5BhlDg9dkTAGWOZiWRm3Y5dTDis22dKpDc89bVqyiQbGeq2nNdW"
+    "rEWvlb+/j04+n5yYfTc1qEP0mS8rFkEozVTbWHifVKVet9FrMZk2jtLNbsV5qCIHj1fIkM"
+    "qlnMYn5w/0dhMVYvLHVOpRehQyce2Vwa5ZROpgNeZlm/PC+s9MiLuZKJ8UuyT7GpiIw8n3"
+    "sognCQ/TmFPvK4hNHdik8stic3v2o3fg0byrJJNtslS/udst3YyOnh+GiZeZaWUk4PPC8/"
+    "0woCviyb4rhohn1tC3yCSRxyVMXblIDWdorsl9K4klcknWSXXvoTRDNHdnsZQWyr5bBdHN"
+    "bp8lQURZqqGNU5VJkhaj9ZLZPETr8rcASxU5mhLGZNfvbKvSChx/dc13uBvgUxe2LJgCz1"
+    "UcrgW3RVyveJe+arBC6k442M6c5n7LkShq9dDyh0bglWoHfIwHXxe3R4Xo8g3j9d3HSNzw"
+    "905XjsRf6XxBrMM/OsPnQ7N9qtXruoarfVu/BuSNxW2r1havfGjt0bdVqhLud6Kvofd4c8"
+    "hJzGgkVKUqpVZp2yc+UtnwKWtfn3jDzY4GCV7Wpx8VJj1hQQAn2cnlyIfr8AN9Smq+2brs"
+    "T+WN66LfRjIxXdOjwFWXkuEKoOECsAm8LotoPEtLFVG1v3lE/a4hA5kO6rrMCmG65KCrQM"
+    "vE0N+vjwqJZJYBMadBjQvZRly03ZyjAAAbU4HmBjxog1pHQj8QBC+DndfK0cfJ7B6tDzHY"
+    "eea6OHNnpoo4c2ejTP6PE4w/Yv3sCUWDrirFaZeYMfn/mvN1jSpvHZ92wYBJRQg4IMVvqZ"
+    "/VDYNBYX15dlbGeIt0pMFbRrKpspsphmKn41mCh8OIQ2sag28Wr5IZYuPCWWHzm8kVpgLT"
+    "c80EWGhJJY+BKFOkFoGU04HFUa6AmgkXJYxyD32NQqEUP1ccosZgNHKvdK16vl7CSPT1pJ"
+    "H8sjtWK9a8Xam0zZTnkl1VrA6s7ccWfyU/bWhE5k0jVE7YIpABuyluhj+vqYvjb97eF0pU"
+    "1/2vT3w5v+sse6JeY/4dS32gQoHjRfbAW8Rpj2OQKukcGqbICLCi+2AH6J72bkj51WEp3K"
+    "Y4M+pSzbW4WyLW4HZNXDtynTyPg7Ry2mdsU3i7zx090cRQXkBfK3YVVGwm3yOmgD/Md34R"
+    "mozhws1UyGeouBrNH86HnczKfeXXlLfAtQtSUGWtySNrzWbXiVyeeyB1Rk2Pd+kIfRW5mo"
+    "HOidH+VRHUq8QCNlMIfyTGKNcRxrblrnoRx/b7dPTj62j04+nJ+dfvx4dn6UxHQUs8qCOy"
+    "56n1h8R26jKjkYoe/A3cAduNlnKhCptiAIsKZY87dvQPDtMVjhXvECsCEWmi14nXYSFrtr"
+    "JnVUbAP45FpGgUi1uTAuv0/mQtZgk8yFKLB8yJb1SB8U9lkLTp3moPqQtHAOPSbHGvleOK"
+    "1ou5Oj11A792qvv1DJ3L9Y+b3ibxOx8gBZyQG9yrckFMF6+ItHEaBvMUMbbacquwWsJjdP"
+    "LvYIlOwV1ApXAmjIdku7arWrVrtqm+qq1Teqv4eOLdyoHn9SrdpOPo/6URzxOnRhg6ELGX"
+    "/xmtELmU/L7i13CwMY8iNKHsMgyt8GuNORHzVFfnBiJSEfMeHqWI8KV9azyhZ9AVlRRh/q"
+    "2taaoY4tgBOA3Cpm9gTQxJvpa/H8xBfNW2MQjKtQWQA2xV+5BVKHtOHK7skcqCEWiW24Jr"
+    "VC/B70Jq0Qv9OOTb5htOQ3OgoKzJoffmqk8pIbCJlvg6xOQ/oRkoayoLqDcnVK5LdgNpSe"
+    "3B0Wq3OSuS+joUToT8bl+Zh4mIzdmcWuqA+na1LCdN3beYUPvL6GEVO3QSLPjcI6USCw3F"
+    "Rh5XtwOcNFD9veBBoAOwZ8m0IcQIN4hJY1ptDnX9NrGbxeXiQOLSsaN1as5w/8B37wXgMD"
+    "+NB49REhEBuDGf9u37dvuXMYklf89o32FhqNaAserYiBshCD09MyMHyhJaJaKYcusrn4Lr"
+    "4nmDfH/kli6ta6G7gssrx5XwvcSki52maT9M2yZxsSwHs/+aHvpt1Y1Cji01rFkZxgmnTX"
+    "55YPiESLRDVmMyBNrZLa7GG3qpfVSrFN4npjV9Zqt7I+Ef+u/aId6CN7bEp0jyinVOEAaZ"
+    "lFOoaaUP0l7q1/iZtqQoH0OKF6a5iBNHNnWIs7iQ2NCiRGxZtJYF2fKaDKvmRzoo4LzkB2"
+    "FRpc20K7sSDgCi6UzS8v3/8PG72F5w=="
+)
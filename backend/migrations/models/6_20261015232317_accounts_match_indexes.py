@@ -0,0 +1,74 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS "idx_accounts_institution_trgm" ON "accounts" USING GIN (lower("institution") gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS "idx_accounts_user_last4" ON "accounts" ("user_id", "account_number_last4");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_accounts_user_last4";
+        DROP INDEX IF EXISTS "idx_accounts_institution_trgm";"""
+
+
+MODELS_STATE = (
+    "eJztXWlv4zYa/iuCPqWAN0icZJJdLAo4iTN1m2PgONui04GGlmibG5lydSTxDua/L0nrpE"
+    "hZsi3byvBLEJN8SOnhy+M9SH3Tp44Fbe+wY5pOgH39X9o3HYMpJP/wWS1NB7NZkkETfDC0"
+    "WVmwKMQSwdDzXWDSykbA9iBJsqBnumjmIwfT0pcAP2shRGO1HVKg5ZgEifC4oEyA0d8BNH"
+    "xnDP0JdEnJz19IMsIWfIMe/flNHyFoW+x/PfCgayCLPdaiLgMH0yFJtIHnn+oUC99mLvQ8"
+    "8mxeVF1EAbLejOjVDFbXAkZffT5jRXRWA3lh9uM7Rc+eDfYIGTYXD8HSjQj79NS7vmEl6d"
+    "sPDdOxgylOSs/m/sTBcfEgQNYhxdC8McTQBT60UjTjwLbDHomSFnyRBN8NYEyUlSRYcAQC"
+    "m3aW/u9RgE3aRxprif45/VnPdR9theutMMkkFBImEBUE8u7fF2+VvDNL1WlTV790+gcnH3"
+    "5ib+l4/thlmYwR/TsDAh8YSU8mREb9yFjJUXo1Aa6YUh7HkUsefBVao4SE10TmI2IjwlZj"
+    "UZ+CN8OGeOxPyM+zowJW/9PpM2LPjhixDhmFi+F5H+a0WRblNyWYpDXkB+yxKtDJwVZiMx"
+    "TBnZHZPjsrwSYpJaWT5WX5jOcZ+nsF+YxwzZTPeilNT92rUMvhGym0pyX4PZWye8pzawau"
+    "C7E5r8JnGrM9MdWfHq/XWI2yLJ6UYPFEyuKJmEXfGAIbYFMw7q+hiabALuIzg+ZotRbww7"
+    "CavRTTAkavu1e9u87twfFZq81I9f62kQ8zIptbmMALQOxtVmRViFe86qYLLeQbNpoiv6qg"
+    "clDFpo48oiH46EUgnZeOY0OAJfunNI7jcUiAdc2i8bZ/0+xdPjzc0oeeeoQ2ltAbcPPn09"
+    "1lt39wzHHbux9wnNIF2vDmZMhaBhDJKOHER1MoZjaP5sU0hB9G/zRNUAe9u+7joHP3KcP3"
+    "dWfQpTltljrnUg8+cKtZXIn2e2/wi0Z/an8+3Hd5lSwuN/hTp88EAt8xsPNqACv92lFylJ"
+    "TpUNobBnRdx8135oBoz+KOzKIaslkr6rbuH4NMj0UbioO7zh8/ZXrt9uH+Y1Q8NYCubh8u"
+    "ubEyhT7Ik/rr48O9mNSoPEfnEybv+dlCpt/SbOT5X2rbxSVWhmGAbJ/okYe02ZoMDZSIYs"
+    "55ejnxpxXwnJNlkLKywtyURW5gXtqFwkfewXrA9jwcXw2ZqMKpoHCeCmbWih2bRaqO3WnH"
+    "hg+f6tfEDFzWApuCbNIMu9MFaInVldquR89CoytlI8/ejeNCNMa/wTnjsEeeQ6Jnhb6Ep7"
+    "CavWUtSU0EywWvsT0/LRbk9chLwcUm9qrzeNW57i4cAENgPr8C1zIkbJIWsAfYIugJ1IYQ"
+    "ffNbH9pAYmANCR0kNTWLV8aT03ZS/GSYy2dN21M+BWAwZk9N26YtRS4ra4qwLvJlsYxWoS"
+    "eLFmG+npLOLFanRgELN5U2clzNn0CN1aTNABa5t0qjlju8Krmceliy2RZOdWjh90uLVTgo"
+    "1nM1rblOjWkr/2gfn56fXpx8OL0gRdiTxCnnBZNgpG7KPUy0V6pa79OYzZhEa2exZr/SDH"
+    "jeq+MKZFDOYhrzg/s/couxfGGpcyq9DCwy8Yjm0jCncDIdsjJlowJYYWk8AJ8rmBg/x/sU"
+    "k4jI2HGZh8ILhumfM+gih0kY2a24vkH35PqXdeZU5caXbCiLJtl0l5T2O6W7sZHTw/FRmX"
+    "mWlJJODywvO9NyAl6WTX5cNMO+tgU+wTQKeKribYpBaztF9ktpXMkrkkyypZf+GNHMkd0u"
+    "I4htuRy288M6WZ7yokhSJaM6gyoyRO0nq0WS2Bl0OY4gtiozlMasyc9euRcE9LiObTsv0D"
+    "Ugpk8sGJCFPkoRfIuuSvE+cc98lcCGZLz5E7LzmTi2gOEb2wESnVuA5egdUXBd/B4dXtQj"
+    "iA9Pl7dd7VOfrByPvdD/EluDWWaW1X63c6vc6rWLqnJbvQvvhsBtpdwbunJv7Ni9UacV6m"
+    "qhp6L/MXdIP2A05ixSglKtIuuUmSlvuARQ1ubf07JgjYFltqvlxQuNWTPg+9DFycmF8PcL"
+    "sANlutq+6Yrvj/LWba4fG6no1uEpSMtzjlB5gFgO2BRGtx0kpoytyti6p3ySFkfIgmRfZX"
+    "gm2XBVUqBF4G1q0MeHR7VMApvQoAOP7KUMU2zKloYBcKjl8QAbM0asIaUbiQfgws/J5mvl"
+    "4PMUVoWe7zj0XBk9lNFDGT2U0aN5Ro/HOTZ/dYa6wNIRZbWKzBvs+Mx/nWFJm8Yn1zHpNR"
+    "h4rBGQRks/0x8Sm8by4huOXFSmihVMFaRrKpsp0phmKn41mChcOIKmbxBt4tVwAyxceAos"
+    "P2J4I7XAWm54IIuMHwhi4QsU6hihZDTmcFxpoMeARsphHYPcoVOrQAzlxynTmA0cqdwrXa"
+    "+Ws5MsPmklfSyLVIr1rhVrZzqjO+WVVGsOqzpzx53JTtkbUzKRCdcQuQsmB2zIWqKO6atj"
+    "+sr0t4fTlTL9KdPfD2/6Sx/rFpj/uFPfchMgf9B8uRXwBmHS5wjYWgorswEuK7zcAvg5up"
+    "uRPXZSSXgqjw76hLJ0b+XKtpgdkFa/5D5f/21xky9FEQF5gextWtIbfblnIDqzV6qZFPUG"
+    "BRnjxdHzqJmPvfviltgWoGpLFLS8JWV4rdvwKpLPsgdURNj3fpCH0luZqAzonR/lkR1KvE"
+    "RjaTCH9ExijXEca25aF6Ec/2y3T07O20cnHy7OTs/Pzy6O4piOfFZRcMdl7yON78hsVAUH"
+    "I9QduBu4Azf9TDki5RYEDtYUa/72DQiuOQEr3CueAzbEQrMFr9NOwmJ3zaSKim0An0zLyB"
+    "EpNxdG5ffJXEgbbJK5EHmGC+myHuqD3D5ryanTDFQdkubOoUfkGGPXCWYVbXdi9Bpq517t"
+    "9ZcqmfsXK79X/G0iVh4gIz6gV/mWhDxYDX/+KAJ0DWpoI+1UZTeHVeRmycWODwV7BbnCFQ"
+    "Mast1SrlrlqlWu2qa6atWN6u+hY3M3qkefVKu2k8+ifhRHvApd2GDoQspfvGb0QurDtnvL"
+    "3dIAhuyIEscw8PK3Ae5U5EdNkR+MWEHIR0S4PNajwpX1tLJl31+WlFGHura1ZshjC+AUIL"
+    "uKmT0GNPFm+lo8P9FF88YEeJMqVOaATfFXboHUEWm4snsyA2qIRWIbrkmlEL8HvUkpxO+0"
+    "Y+NvGJX8RkdOgVnzw0+NVF4yAyH1bZDVaUg+QtJQFmR3UK5OifgWzIbSk7nDYnVOUvdlNJ"
+    "QI9cm4LB9TB/sTe27QK+qD2ZqUUF33blFhn9XXMGLqNkhkuZFYJ3IEFpsqjGwPljNc9LDp"
+    "TKEGsKXBtxnEHtR8xydltRl02df0WhqrlxWJQsvyxo0V6/kL/4X7zqunARdqry7yfYi14Z"
+    "x9t+/r18w5DMErfv1KeguNx6QFh1REQWmIxuhpaRi+kBJhrYRDG5lMfJffE8yao//EMXVr"
+    "3Q1cFFnevK8FbiWkXG6zifum7NmGGPDeT36ou2k3FjWK2LRWcSTHmCbd9bnlAyLhIlGN2R"
+    "RIUSulNn3YrepltUJsk7je2JW1yq2sTsS/a79oB7rInOgC3SPMKVQ4QFJmmY4hJ1R9iXvr"
+    "X+ImmpAnPE4o3xqmIM3cGdbiTqJDowKJYfFmEljXZwqIsi/YnMjjglOQXYUG17bQbiwIuI"
+    "ILZfPLy/f/A6eur2Y="
+)
@@ -0,0 +1,71 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_accounts_user_active_created" ON "accounts" ("user_id", "is_active", "created_at" DESC);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_accounts_user_active_created";"""
+
+
+MODELS_STATE = (
+    "eJztXWtT47Ya/isef6IzKQMBFnrmTGcChG1aLjsQTjvd7ngVW0lUHDn1BUh3+O9HUnyVJc"
+    "dO4iRm9YUhkh7JfvTq8l4kf9MnjgVtb79jmk6Aff0/2jcdgwkk//BZLU0H02mSQRN8MLBZ"
+    "WTAvxBLBwPNdYNLKhsD2IEmyoGe6aOojB9PS5wA/aSFEY7XtU6DlmASJ8KigTIDRPwE0fG"
+    "cE/TF0ScnPX0gywhZ8hR79+U0fImhb7H898KBrIIsikWeQh0LPkP4wXQh8aBnA1ykcvk5d"
+    "6Hnk8byoxogFZL0a0dsZrLp5LUZYBaNhNmVldVYVeXn2462lyZ4lrNDAwWRAEm3g+cfVH2"
+    "QOk7dP0dMngz1CpmfnD8HSjQj7+Ni7vGIlaU8MDNOxgwlOSk9n/tjBcfEgQNY+xdC8EcTQ"
+    "ZWQkXY4D2w6lI0qa9x1J8N0Axp1mJQkWHILApoKj/3cYYJPKi8Zaon+Of9ZzokRb4SQnTD"
+    "IJhYQJRIWSvPvb/K2Sd2apOm3q4pfO/d7Rhx/YWzqeP3JZJmNEf2NA4AMj6cmEyKgfGSs5"
+    "Si/GwBVTyuM4csmDL0NrlJDwmoy/iNiIsOVY1Cfg1bAhHvlj8vPkoIDV/3XuGbEnB4xYh8"
+    "wI86niNsxps6w3NkpiwSStIT9gj1WBTg62FJuhCG6NzPbJSQk2SSkpnSwvy2c8z9DfS8hn"
+    "hGumfNZLaXrqXoZaDt9IoT0uwe+xlN1jnlszcF2IzVkVPtOYzYmp/vhwucJqlGXxqASLR1"
+    "IWj8Qs+sYA2ACbgnF/CU00AXYRnxk0R6s1h++H1eykmBYwetm96N10rvcOT1ptRqr3j418"
+    "mBHZ3MIEngFib7Mkq0K84pXuwy3kGzaaIL+qoHJQxWZWxclSee44NgRYsn9K4zgeBwRY1y"
+    "wab/vXzd753d01feiJR2hjCb0+N38+3px37/cOOW57t32OU7pAG96MDFmmLeZllHDiowkU"
+    "M5tH82Iawvejf5omqP3eTfeh37n5lOH7stPv0pw2S51xqXsfuNUsrkT7vdf/RaM/tT/vbr"
+    "u8ShaX6/9J1WsdBL5jYOfFAFb6taPkKCnTobQ3DOi6jpvvzD7RnsUdmUU1ZLNW1G3dP/qZ"
+    "Hos2FHs3nT9+yPTa9d3tx6h4agBdXN+dc2NlAn2QJ/XXh7tbMalReY7OR0ze87OFTL+l2c"
+    "jzv9S2i0usDIMA2T7RI/dpszUZGigRxZzz9HLiTyvgOU9ZsirOTVnkGualbSh85B2sO2zP"
+    "wvHVkIkqnAoK56lgai3ZsVmk6titdmz48Kl+TczAZS2wKcg6zbBbXYAWWF2p7Xr4JDS6Uj"
+    "by7F05LkQj/BucMQ575Dkkelbo13gMq9lZ1pLURLBc8BLb89NiQV6PvBScb2IvOg8Xncvu"
+    "3AEwAObTC3AtQ8ImaQF7gC2CnkBtCNFXv91DG0gMrCGh/aSmZvHKeHLaToqfDHP5rEl7wq"
+    "cADEbsqWnbtKXIfWZNENZFfjWW0Sr0qtEizNdT0rHG6tQoYO4y04aOq/ljqLGatCnAIldb"
+    "adRi51sll1MPSzbbwqkOzX2QabEKB8VqrqYV16kRbeXH9uHx6fHZ0YfjM1KEPUmcclowCU"
+    "bqptzDRHulqvU+jVmPSbR2Fmv2K02B5704rkAG5SymMd+5/yO3GMsXljqn0vPAIhOPaC4N"
+    "cwon0wErUzZCgRWWxibwuYKJ8XO8TzGJiIwcl3kovGCQ/jmFLnKYhJHdiusbdE+uf1llTl"
+    "VufMmGsmiSTXdJab9TuhsbOT0cHpSZZ0kp6fTA8rIzLSfgZdnkx0Uz7Gsb4BNMouCrKt6m"
+    "GLSyU2S3lMalvCLJJFt66Y8RzRzZ7TKC2JbLYTs/rJPlKS+KJFUyqjOoIkPUbrJaJImdfp"
+    "fjCGKrMkNpzIr87JR7QUCP69i28wxdA2L6xIIBWeijFME36KoU7xN3zFcJbEjGmz8mO5+x"
+    "YwsYvrIdING5BViO3iEF18Xvwf5ZPYJ493h+3dU+3ZOV46EX+l9iazDLzLJ63+1cK7d67a"
+    "Kq3FbvwrshcFsp94au3Btbdm/UaYW6mOup6F/mDrkPGI05i5SgVKvIOmVmyhsuAZS1+fe0"
+    "LFhjYJntanHxQmPWFPg+dHFyciH8/QzsQJmuNm+64vujvHWb68dGKrp1eArS8pwjVB4glg"
+    "M2hdFNB4kpY6sytu4on6TFIbIg2VcZnkk2XJUUaBF4kxr04f5BLZPAOjTowCN7KcMUm7Kl"
+    "YQAcanE8wNqMEStI6VriAbjwc7L5Wjr4PIVVoedbDj1XRg9l9FBGD2X0aJ7R42GGzV+dgS"
+    "6wdERZrSLzBjs+87czKGnT+OQ6Jr0GA480AtJo6Sf6Q2LTWFx8zZGLylSxhKmCdE1lM0Ua"
+    "00zFrwYThQuH0PQNok28GG6AhQtPgeVHDG+kFljLDQ9kkfEDQSx8gUIdI5SMxhyOKg30GN"
+    "BIOaxjkDt0ahWIofw4ZRqzhiOVO6Xr1XJ2ksUnLaWPZZFKsd62Yu1MpnSnvJRqzWFVZ265"
+    "M9kpe2NCJjLhGiJ3weSADVlL1DF9dUxfmf52cLpSpj9l+vvuTX/pY90C8x936ltuAuQPmi"
+    "+2Al4hTPocAVtLYWU2wEWFF1sAP0d3M7LHTioJT+XJb/PNlW0xOyCtfsF9vv7r/CZfiiIC"
+    "8gzZ27TK3ihMdGavVDMp6g0KMkbzo+dRMx97t8UtsS1A1ZYoaHFLyvBat+FVJJ9lD6iIsO"
+    "/9IA+ltzJRGdA7P8ojO5R4jkbSYA7pmcQa4zhW3LTOQzl+arePjk7bB0cfzk6OT09Pzg7i"
+    "mI58VlFwx3nvI43vyGxUBQcj1B24a7gDN/1MOSLlFgQO1hRr/uYNCK45BkvcK54DNsRCsw"
+    "Gv01bCYrfNpIqKbQCfTMvIESk3F0bld8lcSBtskrkQeYYL6bIe6oPcPmvBqdMMVB2S5s6h"
+    "R+QYI9cJphVtd2L0CmrnTu31FyqZuxcrv1P8rSNWHiAjPqBX+ZaEPFgNf/4oAnQNamgj7V"
+    "RlN4dV5GbJxY4PBXsFucIVAxqy3VKuWuWqVa7aprpq1Y3q76FjczeqR59Uq7aTz6K+F0e8"
+    "Cl1YY+hCyl+8YvRC6iO7O8vdwgCG7IgSxzDw8rcG7lTkR02RH4xYQchHRLg81qPClfW0sk"
+    "XfgpaUUYe6NrVmyGML4AQgu4qZPQY08Wb6Wjw/0UXzxhh44ypU5oBN8VdugNQhabiyezID"
+    "aohFYhOuSaUQvwe9SSnE77Rj428YlfxGR06BWfHDT41UXjIDIfVtkOVpSD5C0lAWZHdQLk"
+    "+J+BbMhtKTucNieU5S92U0lAj1ybgsHxMH+2N7ZtAr6oPpipRQXfdmXuE9q69hxNRtkMhy"
+    "I7FO5AgsNlUY2R4sZ7joYdOZQA1gS4OvU4g9qPmOT8pqU+iyr+m1NFYvKxKFluWNG0vW8x"
+    "f+C987L54GXKi9uMj3IdYGM/bdvq9fM+cwBK/49SvpLTQakRYcUhEFpSEao6elYfhMSoS1"
+    "Eg5tZDLxXXxPMGuO/hPH1K10N3BRZHnzvha4kZByuc0m7puyZxtiwHs/+aHupl1b1Chi01"
+    "rFkRxjmnTX54YPiISLRDVmUyBFrZTa9GG3qpfVCrFN4nptV9Yqt7I6Ef+u/aId6CJzrAt0"
+    "jzCnUOEASZlFOoacUPUl7o1/iZtoQp7wOKF8a5iCNHNnWIs7iQ6NCiSGxZtJYF2fKSDKvm"
+    "BzIo8LTkG2FRpc20K7tiDgCi6U9S8vb/8HIq7dMw=="
+)
@@ -0,0 +1,71 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "sync_jobs" ALTER COLUMN "user_id" DROP NOT NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "sync_jobs" ALTER COLUMN "user_id" SET NOT NULL;"""
+
+
+MODELS_STATE = (
+    "eJztXWtT47Ya/isef6IzKQMBFnrmTGcChG1aLjsQTjvd7ngVW0lUHDn1BUh3+O9HUnyVJc"
+    "dO4iRm9YUhkh7JfvTq8l4kf9MnjgVtb79jmk6Aff0/2jcdgwkk//BZLU0H02mSQRN8MLBZ"
+    "WTAvxBLBwPNdYNLKhsD2IEmyoGe6aOojB9PS5wA/aSFEY7XtU6DlmASJ8KigTIDRPwE0fG"
+    "cE/TF0ScnPX0gywhZ8hR79+U0fImhb7H898KBrIIsikWeQh0LPkP4wXQh8aBnA1ykcvk5d"
+    "6Hnk8byoxogFZL0a0dsZrLp5LUZYBaNhNmVldVYVeXn2462lyZ4lrNDAwWRAEm3g+cfVH2"
+    "QOk7dP0dMngz1CpmfnD8HSjQj7+Ni7vGIlaU8MDNOxgwlOSk9n/tjBcfEgQNY+xdC8EcTQ"
+    "ZWQkXY4D2w6lI0qa9x1J8N0Axp1mJQkWHILApoKj/3cYYJPKi8Zaon+Of9ZzokRb4SQnTD"
+    "IJhYQJRIWSvPvb/K2Sd2apOm3q4pfO/d7Rhx/YWzqeP3JZJmNEf2NA4AMj6cmEyKgfGSs5"
+    "Si/GwBVTyuM4csmDL0NrlJDwmoy/iNiIsOVY1Cfg1bAhHvlj8vPkoIDV/3XuGbEnB4xYh8"
+    "wI86niNsxps6w3NkpiwSStIT9gj1WBTg62FJuhCG6NzPbJSQk2SSkpnSwvy2c8z9DfS8hn"
+    "hGumfNZLaXrqXoZaDt9IoT0uwe+xlN1jnlszcF2IzVkVPtOYzYmp/vhwucJqlGXxqASLR1"
+    "IWj8Qs+sYA2ACbgnF/CU00AXYRnxk0R6s1h++H1eykmBYwetm96N10rvcOT1ptRqr3j418"
+    "mBHZ3MIEngFib7Mkq0K84pXuwy3kGzaaIL+qoHJQxWZWxclSee44NgRYsn9K4zgeBwRY1y"
+    "wab/vXzd753d01feiJR2hjCb0+N38+3px37/cOOW57t32OU7pAG96MDFmmLeZllHDiowkU"
+    "M5tH82Iawvejf5omqP3eTfeh37n5lOH7stPv0pw2S51xqXsfuNUsrkT7vdf/RaM/tT/vbr"
+    "u8ShaX6/9J1WsdBL5jYOfFAFb6taPkKCnTobQ3DOi6jpvvzD7RnsUdmUU1ZLNW1G3dP/qZ"
+    "Hos2FHs3nT9+yPTa9d3tx6h4agBdXN+dc2NlAn2QJ/XXh7tbMalReY7OR0ze87OFTL+l2c"
+    "jzv9S2i0usDIMA2T7RI/dpszUZGigRxZzz9HLiTyvgOU9ZsirOTVnkGualbSh85B2sO2zP"
+    "wvHVkIkqnAoK56lgai3ZsVmk6titdmz48Kl+TczAZS2wKcg6zbBbXYAWWF2p7Xr4JDS6Uj"
+    "by7F05LkQj/BucMQ575Dkkelbo13gMq9lZ1pLURLBc8BLb89NiQV6PvBScb2IvOg8Xncvu"
+    "3AEwAObTC3AtQ8ImaQF7gC2CnkBtCNFXv91DG0gMrCGh/aSmZvHKeHLaToqfDHP5rEl7wq"
+    "cADEbsqWnbtKXIfWZNENZFfjWW0Sr0qtEizNdT0rHG6tQoYO4y04aOq/ljqLGatCnAIldb"
+    "adRi51sll1MPSzbbwqkOzX2QabEKB8VqrqYV16kRbeXH9uHx6fHZ0YfjM1KEPUmcclowCU"
+    "bqptzDRHulqvU+jVmPSbR2Fmv2K02B5704rkAG5SymMd+5/yO3GMsXljqn0vPAIhOPaC4N"
+    "cwon0wErUzZCgRWWxibwuYKJ8XO8TzGJiIwcl3kovGCQ/jmFLnKYhJHdiusbdE+uf1llTl"
+    "VufMmGsmiSTXdJab9TuhsbOT0cHpSZZ0kp6fTA8rIzLSfgZdnkx0Uz7Gsb4BNMouCrKt6m"
+    "GLSyU2S3lMalvCLJJFt66Y8RzRzZ7TKC2JbLYTs/rJPlKS+KJFUyqjOoIkPUbrJaJImdfp"
+    "fjCGKrMkNpzIr87JR7QUCP69i28wxdA2L6xIIBWeijFME36KoU7xN3zFcJbEjGmz8mO5+x"
+    "YwsYvrIdING5BViO3iEF18Xvwf5ZPYJ493h+3dU+3ZOV46EX+l9iazDLzLJ63+1cK7d67a"
+    "Kq3FbvwrshcFsp94au3Btbdm/UaYW6mOup6F/mDrkPGI05i5SgVKvIOmVmyhsuAZS1+fe0"
+    "LFhjYJntanHxQmPWFPg+dHFyciH8/QzsQJmuNm+64vujvHWb68dGKrp1eArS8pwjVB4glg"
+    "M2hdFNB4kpY6sytu4on6TFIbIg2VcZnkk2XJUUaBF4kxr04f5BLZPAOjTowCN7KcMUm7Kl"
+    "YQAcanE8wNqMEStI6VriAbjwc7L5Wjr4PIVVoedbDj1XRg9l9FBGD2X0aJ7R42GGzV+dgS"
+    "6wdERZrSLzBjs+87czKGnT+OQ6Jr0GA480AtJo6Sf6Q2LTWFx8zZGLylSxhKmCdE1lM0Ua"
+    "00zFrwYThQuH0PQNok28GG6AhQtPgeVHDG+kFljLDQ9kkfEDQSx8gUIdI5SMxhyOKg30GN"
+    "BIOaxjkDt0ahWIofw4ZRqzhiOVO6Xr1XJ2ksUnLaWPZZFKsd62Yu1MpnSnvJRqzWFVZ265"
+    "M9kpe2NCJjLhGiJ3weSADVlL1DF9dUxfmf52cLraadPfTs1TTbH8bY20phr+0oe6BcY/7s"
+    "y33ADIHzNfbAO8Qph0OQK2lsLKLICLCi+2/32ObmZkj51UEp7Jk9/lmyvbYlZAWv2C23z9"
+    "1/k9vhRFBOQZsrdplb1PmGjMXqlmUtQbFGSM5gfPo2Y+9m6LW2IbgKotUdDilpTZtW6zq0"
+    "g+yx5PEWHf+zEeSm9lojKgd36QR3Yk8RyNpKEc0hOJNUZxrLhlnQdy/NRuHx2dtg+OPpyd"
+    "HJ+enpwdxBEd+ayi0I7z3kca3ZHZpgqORagbcNdwA276mXJEyu0HHKwptvzNmw9ccwyWuF"
+    "U8B2yIfWYDPqetBMVum0kVE9sAPpmWkSNSbiyMyu+SsZA22CRjIfIMF9JlPdQHuX3WgjOn"
+    "Gag6Is2dQo/IMUauE0wrWu7E6O/EiLeLkfI7xd86IuUBMuLjeZXvSMiD1fDnDyJA16CGNt"
+    "JOVXZzWEVullzs+FCwV5ArXDGgIdst5ahVjlrlqG2qo1bdp/4eOjZ3n3r0QbVqO/ks6ns5"
+    "gbMTgQuNYqwgciHlL14xeCH1id2d5W5hAEN2RIljGHj5WwN36shXTZEfjFhByEdEuDzWo8"
+    "KF9bSyRV+ClpRRR7o2tWbIYwvgBCC7ipk9BjTxXvpaPD/RNfPGGHjjKlTmgE3xV26A1CFp"
+    "uLJ7MgNqiEViE65JpRC/B71JKcTvtGPjLxiV/EJHToFZ8bNPjVReMgMh9WWQ5WlIPkHSUB"
+    "ZkN1AuT4n4DsyG0pO5wWJ5TlK3ZezcZqIUD+p7cVk+Jg72x/bMoPfTB9MVKaGq7s28wntW"
+    "X8OIqdsekeVGYpzIEVhsqTCyPVjObtHDpjOBGsCWBl+nEHtQ8x2flNWm0GWf0mtprF5WJI"
+    "osy9s2lqznL/wXvndePA24UHtxke9DrA1m7KN9X79mjmEIXvHrV9JbaDQiLTikIgpKQzRG"
+    "T0vD8JmUCGslHNrIZOK7+JJg1hz9Jw6pW+li4KLA8uZ9KnAjEeVyk03cN2WPNsSA937wQ1"
+    "1Mu7agUcSmtYojOcY06aLPDZ8PCReJasymQIpaKbXps25Vb6oVYpvE9druq1Ve5Uadh98h"
+    "5aHVDLdoB7rIHOsC3SPMKVQ4QFJmkY4hJ1R9hnvjn+EmmpAnPE0o3xqmIM3cGdbiTaJDow"
+    "KJYfFmEljXNwqIsi/YnMjDglOQbUUG17bQri0GuIIHZf3Ly9v/AYwY3FI="
+)